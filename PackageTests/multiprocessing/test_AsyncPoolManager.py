@@ -0,0 +1,106 @@
+import unittest
+import pytest
+
+import time
+import asyncio
+
+from better.multiprocessing import AsyncPoolManager, SubprocessException
+
+class Test_AsyncPoolManager(unittest.TestCase):
+
+    def test_submit(self):
+
+        async def main():
+            async with AsyncPoolManager(lambda x, y: x*y, size=2) as pool:
+                futures = [await pool.submit(i, 2) for i in range(20)]
+                return await asyncio.gather(*futures)
+
+        self.assertEqual(asyncio.run(main()), [x*2 for x in range(20)])
+
+    def test_event_loop_is_not_blocked(self):
+
+        def slow(value):
+            time.sleep(0.5)
+            return value
+
+        async def main():
+            ticks = 0
+            async def tick():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0.01)
+
+            ticker = asyncio.ensure_future(tick())
+            async with AsyncPoolManager(slow, size=2, queue_size=1) as pool:
+                outputs = await pool.map(range(6))
+            ticker.cancel()
+            return outputs, ticks
+
+        outputs, ticks = asyncio.run(main())
+        self.assertEqual(outputs, list(range(6)))
+        self.assertGreater(ticks, 50)
+
+    def test_backpressure(self):
+
+        def slow(value):
+            time.sleep(0.2)
+            return value
+
+        async def main():
+            async with AsyncPoolManager(slow, size=1, queue_size=1) as pool:
+                futures = [await pool.submit(i) for i in range(3)]
+
+                # The queue is full, placing another task waits for the process to pick one up
+                start = time.perf_counter()
+                futures.append(await pool.submit(3))
+                waited = time.perf_counter() - start
+
+                return await asyncio.gather(*futures), waited
+
+        outputs, waited = asyncio.run(main())
+        self.assertEqual(outputs, [0, 1, 2, 3])
+        self.assertGreater(waited, 0.1)
+
+    def test_async_for(self):
+
+        def slow_head(value):
+            if value == 0: time.sleep(0.5)
+            return value
+
+        async def source():
+            for i in range(30):
+                yield i
+
+        async def main():
+            async with AsyncPoolManager(slow_head, size=4) as pool:
+                ordered = [output async for output in pool.imap(source(), window=8)]
+                unordered = [output async for output in pool.imap_unordered(range(30), window=8)]
+                return ordered, unordered
+
+        ordered, unordered = asyncio.run(main())
+        self.assertEqual(ordered, list(range(30)))
+        self.assertEqual(set(unordered), set(range(30)))
+        self.assertNotEqual(unordered[0], 0)
+
+    def test_failure(self):
+
+        def fail(value):
+            if value == 3: raise ValueError(value)
+            return value
+
+        async def main():
+            async with AsyncPoolManager(fail, size=2) as pool:
+                futures = [await pool.submit(i) for i in range(6)]
+                return await asyncio.gather(*futures, return_exceptions=True)
+
+        outputs = asyncio.run(main())
+        self.assertEqual([outputs[i] for i in (0, 1, 2, 4, 5)], [0, 1, 2, 4, 5])
+        self.assertIsInstance(outputs[3], SubprocessException)
+        self.assertEqual(outputs[3].index, 3)
+        self.assertIsInstance(outputs[3].raised, ValueError)
+
+    def test_invalid_options(self):
+        for option in ("ordered", "chunksize", "reorder_window"):
+            with pytest.raises(TypeError):
+                AsyncPoolManager(lambda x: x, **{option: 2})
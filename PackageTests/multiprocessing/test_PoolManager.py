@@ -4,6 +4,7 @@ import pytest
 import sys
 import time
 import logging
+import multiprocessing as mp
 
 from better.multiprocessing import PoolProcess, PoolManager, SubprocessException
 
@@ -45,6 +46,151 @@ class Test_PoolManager(unittest.TestCase):
             pool.putAsync(range(40))
             self.assertEqual(set(pool.getAll()), {x*2 for x in range(40)})
 
+    def test_chunked_put(self):
+        with PoolManager(lambda x: x*2, chunksize=8) as pool:
+            for i in range(100): pool.put(i)
+            self.assertEqual(set(pool.getAll()), {x*2 for x in range(100)})
+
+    def test_chunked_map(self):
+        inputs = range(100)
+        self.assertEqual(PoolManager(lambda x: x + 10).map(inputs, chunksize=7), [x+10 for x in inputs])
+        self.assertEqual(PoolManager(lambda x: x + 10, chunksize="auto").map(inputs), [x+10 for x in inputs])
+        self.assertEqual(PoolManager(lambda x: x + 10).map(iter(inputs), chunksize="auto"), [x+10 for x in inputs])
+
+    def test_chunked_async_map(self):
+        with PoolManager(lambda x: x*2, ordered=True) as pool:
+            pool.putAsync(range(200), chunksize="auto")
+            self.assertEqual(pool.getAll(), [x*2 for x in range(200)])
+
+    def test_chunked_failure_identifies_task(self):
+
+        def fail(value):
+            if value == 13: raise ValueError(value)
+            return value
+
+        with PoolManager(fail, size=2, chunksize=5) as pool:
+            for i in range(20): pool.put(i)
+
+            with pytest.raises(SubprocessException) as raised:
+                pool.getAll()
+
+            self.assertEqual(raised.value.index, 13)
+
+    def test_invalid_chunksize(self):
+        for chunksize in (0, -1, 2.5, "large"):
+            with pytest.raises(ValueError):
+                PoolManager(lambda x: x, chunksize=chunksize)
+
+    def test_imap(self):
+        inputs = range(100)
+        self.assertEqual(list(PoolManager(lambda x: x + 10).imap(inputs)), [x+10 for x in inputs])
+        self.assertEqual(list(PoolManager(lambda x: x + 10).imap(inputs, chunksize=8)), [x+10 for x in inputs])
+        self.assertEqual(set(PoolManager(lambda x: x + 10).imap_unordered(inputs)), {x+10 for x in inputs})
+
+    def test_imap_bounds_tasks_in_flight(self):
+
+        consumed = []
+        def source():
+            for i in range(50):
+                consumed.append(i)
+                yield i
+
+        for i, value in enumerate(PoolManager(lambda x: x*2, size=2).imap(source(), window=4)):
+            self.assertEqual(value, i*2)
+            self.assertLessEqual(len(consumed), i + 4)
+
+    def test_imap_slow_first_task(self):
+
+        def slow_head(value):
+            if value == 0: time.sleep(1)
+            return value
+
+        self.assertEqual(list(PoolManager(slow_head, size=4).imap(range(4), window=4)), list(range(4)))
+        self.assertEqual(list(PoolManager(slow_head, size=4).imap(range(40), window=8)), list(range(40)))
+
+    def test_imap_abandoned(self):
+        for value in PoolManager(lambda x: x, size=2).imap_unordered(range(10**6), window=8):
+            if value > 10: break
+
+    def test_imap_fails(self):
+
+        def fail(value):
+            if value == 13: raise ValueError(value)
+            return value
+
+        with pytest.raises(SubprocessException) as raised:
+            list(PoolManager(fail, size=2).imap(range(40)))
+
+        self.assertEqual(raised.value.index, 13)
+
+    def test_invalid_window(self):
+        for window in (0, -1, 2.5):
+            with pytest.raises(ValueError):
+                PoolManager(lambda x: x).imap(range(10), window=window)
+
+    def test_ordered_get_does_not_recurse(self):
+
+        def slow_head(value):
+            if value == 0: time.sleep(2)
+            return value
+
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(200)
+        try:
+            with PoolManager(slow_head, size=2, ordered=True, chunksize=64) as pool:
+                for i in range(2000): pool.put(i)
+                self.assertEqual(pool.getAll(), list(range(2000)))
+                self.assertGreater(pool.reorderPeak, 200)
+                self.assertEqual(pool.reorderDepth, 0)
+
+            self.assertEqual(PoolManager(slow_head, size=2, chunksize=64).map(range(5000)), list(range(5000)))
+            self.assertEqual(PoolManager(slow_head, size=4).map(range(8)), list(range(8)))
+        finally:
+            sys.setrecursionlimit(limit)
+
+    def test_reorder_window_throttles_dispatch(self):
+
+        def slow_head(value):
+            if value == 0: time.sleep(1)
+            return value
+
+        with PoolManager(slow_head, size=4, ordered=True, reorder_window=10) as pool:
+            pool.putAsync(range(100))
+            self.assertEqual(pool.getAll(), list(range(100)))
+            self.assertLessEqual(pool.reorderPeak, 10)
+
+        with PoolManager(slow_head, size=4, ordered=True, reorder_window=10) as pool:
+            for i in range(10): pool.put(i)
+            with pytest.raises(mp.queues.Full):
+                pool.put(10, block=False)
+            with pytest.raises(mp.TimeoutError):
+                pool.put(10, timeout=0.2)
+
+        self.assertEqual(PoolManager(slow_head, size=4, reorder_window=10).map(range(50)), list(range(50)))
+
+    def test_ordered_failure_is_skipped(self):
+
+        def fail(value):
+            if value == 3: raise ValueError(value)
+            return value
+
+        with PoolManager(fail, size=2, ordered=True) as pool:
+            for i in range(6): pool.put(i)
+
+            outputs = []
+            while len(outputs) < 5:
+                try:
+                    outputs.append(pool.get())
+                except SubprocessException as e:
+                    self.assertEqual(e.index, 3)
+
+            self.assertEqual(outputs, [0, 1, 2, 4, 5])
+
+    def test_invalid_reorder_window(self):
+        for window in (0, -1, 2.5):
+            with pytest.raises(ValueError):
+                PoolManager(lambda x: x, reorder_window=window)
+
     def test_map_fails(self):
 
         with pytest.raises(ZeroDivisionError):
@@ -69,13 +215,18 @@ class Test_PoolManager(unittest.TestCase):
 
     def test_clearTasks_correctly_dequeues(self):
 
+        started = mp.Semaphore(0)
+
         def do_some_work(value):
+            started.release()
             time.sleep(2)
             return value * 2
 
         with PoolManager(do_some_work, size=4) as conn:
             for i in range(10): conn.put(i)
 
+            # Wait for each process to pick up its first task
+            for _ in range(4): self.assertTrue(started.acquire(timeout=10))
             conn.clearTasks()
 
             self.assertEqual(set(conn.getAll()), {0, 2, 4, 6})
@@ -0,0 +1,124 @@
+import unittest
+import pickle
+import multiprocessing as mp
+
+from better import ConfigParser
+from better.multiprocessing import PoolManager, SharedConfig, SharedSection
+
+def attachAndRead(name: bytes, path: str):
+    """ Attach to a pickled shared config in a fresh process and read a value from it """
+    shared = pickle.loads(name)
+    try:
+        return shared.get(path), shared.generation
+    finally:
+        shared.close()
+
+class Test_SharedConfig(unittest.TestCase):
+
+    def setUp(self):
+        self.config = ConfigParser().parse("""
+basic = value
+(int) number = 10
+(list<int>) numbers = 1, 2, 3
+[section]
+    key = section value
+    [nested]
+        deep = deep value
+[other]
+""")
+
+    def test_config_is_readable(self):
+
+        with SharedConfig(self.config) as shared:
+            view = shared.config
+
+            self.assertIsInstance(view, SharedSection)
+            self.assertEqual(view["basic"], "value")
+            self.assertEqual(view["number"], 10)
+            self.assertEqual(view["numbers"], (1, 2, 3))
+            self.assertEqual(view.get("section:nested:deep"), "deep value")
+            self.assertEqual(shared.get("section:key"), "section value")
+            self.assertIsNone(view.get("section:missing"))
+            self.assertEqual(view.get("basic:missing", 1), 1)
+            self.assertEqual(dict(view["other"]), {})
+
+    def test_view_preserves_order_and_equality(self):
+
+        with SharedConfig(self.config) as shared:
+            self.assertEqual(list(shared.config), list(self.config))
+            self.assertEqual(shared.config, self.config.freeze())
+            self.assertNotIn("missing", shared.config)
+            self.assertNotIn(1, shared.config)
+
+            with self.assertRaises(KeyError):
+                shared.config["missing"]
+
+    def test_view_is_read_only(self):
+
+        with SharedConfig(self.config) as shared:
+            with self.assertRaises(TypeError):
+                shared.config["basic"] = "changed"
+
+    def test_publish_increments_generation(self):
+
+        with SharedConfig(self.config) as shared:
+            self.assertEqual(shared.generation, 1)
+
+            previous = shared.config
+            self.assertEqual(shared.publish({"basic": "changed"}), 2)
+
+            self.assertEqual(shared.generation, 2)
+            self.assertEqual(shared.config["basic"], "changed")
+
+            with self.assertRaises(ValueError):
+                previous["basic"]  # Views of replaced generations are released
+
+    def test_attached_copies_refresh_between_generations(self):
+
+        with SharedConfig(self.config) as shared:
+            attached = pickle.loads(pickle.dumps(shared))
+
+            self.assertEqual(attached.generation, 1)
+            self.assertEqual(attached.get("section:key"), "section value")
+            self.assertFalse(attached.refresh())
+
+            shared.publish({"section": {"key": "new value"}})
+
+            self.assertEqual(attached.get("section:key"), "section value")  # Until refreshed
+            self.assertTrue(attached.refresh())
+            self.assertEqual(attached.get("section:key"), "new value")
+            self.assertEqual(attached.generation, 2)
+
+            with self.assertRaises(RuntimeError):
+                attached.publish({})
+
+            attached.close()
+
+    def test_spawned_process_attaches(self):
+
+        with SharedConfig(self.config) as shared:
+            with mp.get_context("spawn").Pool(1) as pool:
+                value = pool.apply(attachAndRead, (pickle.dumps(shared), "section:nested:deep"))
+
+        self.assertEqual(value, ("deep value", 1))
+
+    def test_non_string_keys_are_rejected(self):
+
+        with self.assertRaises(TypeError):
+            SharedConfig({1: "value"})
+
+    def test_pool_workers_receive_published_generations(self):
+
+        with SharedConfig(self.config) as shared:
+
+            def method(path, config):
+                return config.get(path)
+
+            with PoolManager(method, static_args=[shared], size=2) as pool:
+                for _ in range(4): pool.put("basic")
+                self.assertEqual(set(pool.getAll()), {"value"})
+
+                shared.publish({"basic": "changed"})
+
+                for _ in range(4): pool.put("basic")
+                self.assertEqual(set(pool.getAll()), {"changed"})
@@ -1,11 +1,16 @@
 import unittest
 import pytest
 
+import io
 import os
+import array
+import pickle
+import socket
 import tempfile
+import threading
 
 import better
-from better import ConfigParser
+from better import ConfigParser, ConfigChain
 
 RESOURCES = os.path.join(os.path.dirname(__file__), "resources", "configparser")
 
@@ -349,6 +354,55 @@ class Test_ConfigParser(unittest.TestCase):
 
         self.assertEqual(config["b"], ["2","3","4"])
 
+    def test_interpolationForwardReferences(self):
+
+        config = ConfigParser(r"""
+        (list<int>) b = {section:c}, {a}
+        (int) a = 4
+
+        [section]
+        c = {a}{a}
+        d = {a} and {section:c} are {b}
+        """)
+
+        self.assertEqual(config, {
+            "a": 4,
+            "b": [44, 4],
+            "section": {
+                "c": "44",
+                "d": "4 and 44 are [44, 4]"
+            }
+        })
+
+    def test_interpolationSelfReference(self):
+
+        config = ConfigParser("path = /usr/bin")
+        config.parse("path = {path}:/usr/local/bin")
+
+        self.assertEqual(config["path"], "/usr/bin:/usr/local/bin")
+
+    def test_interpolationRedefinition(self):
+
+        config = ConfigParser(r"""
+        a = {b} first
+        b = value
+        a = second
+        """)
+
+        self.assertEqual(config, {"a": "second", "b": "value"})
+
+    def test_interpolationCycle(self):
+
+        with pytest.raises(ValueError, match="Interpolation cycle"):
+            ConfigParser(r"""
+            a = {c}
+            b = {a}
+            c = {b}
+            """)
+
+        with pytest.raises(KeyError):
+            ConfigParser("a = {missing}")
+
     def test_ParsingIssues(self):
         """ A bug was discovered that a setting would be added twice when a new section was read as the section would
         flush the setting to the config, and then reading the new setting in the section, the setting would again be
@@ -409,6 +463,1088 @@ class Test_ConfigParser(unittest.TestCase):
             " (float) anotherValue = 123445"
         ]))
 
+class Test_ConfigParserFastEngine(unittest.TestCase):
+
+    def test_resources_match_line_engine(self):
+
+        for filename in os.listdir(RESOURCES):
+            path = os.path.join(RESOURCES, filename)
+            self.assertEqual(ConfigParser().read(path, engine="fast"), ConfigParser().read(path))
+
+    def test_comments_and_quotes(self):
+
+        string = r"""
+        a = value # This comment should not exist as part of the value
+        b = "value # This one should though since its inside a quote"
+        e = "We should also ensure that \" works as a method of escaping the quotes" # And this should still work
+        f = Lets go for multi-line comments ; shaking nervously
+         these should not be a problem right!? # One would hope
+        [section] # nothing...
+        \#still a comment
+        """
+
+        self.assertEqual(ConfigParser().parse(string, engine="fast"), ConfigParser().parse(string))
+
+    def test_line_numbers(self):
+
+        string = "a = 1\n\n# comment\n[section]\n    b = 2\n    c"
+        lines = list(ConfigParser()._scanLines(string))
+
+        self.assertEqual([(index, scope) for index, scope, _ in lines], [(1, 0), (4, 0), (5, 4), (6, 4)])
+        self.assertEqual(lines, list(ConfigParser()._readLines(io.StringIO(string))))
+
+    def test_unknown_engine(self):
+
+        with pytest.raises(ValueError):
+            ConfigParser().parse("a = 1", engine="slow")
+
+class Test_ConfigParserMapped(unittest.TestCase):
+
+    def test_resources_match_text_read(self):
+
+        for filename in os.listdir(RESOURCES):
+            path = os.path.join(RESOURCES, filename)
+            self.assertEqual(ConfigParser().read(path, mmap=True), ConfigParser().read(path))
+
+    def test_parse_bytes(self):
+
+        config = ConfigParser().parse(b"[section]\r\n    key = 'value # kept' # removed\r\n")
+        self.assertEqual(config, {"section": {"key": "value # kept"}})
+
+    def test_empty_file(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "empty.ini")
+            open(path, "w").close()
+
+            self.assertEqual(ConfigParser().read(path, mmap=True), {})
+
+class Test_ConfigParserLazy(unittest.TestCase):
+
+    source = os.linesep.join([
+        "root = value",
+        "[first]",
+        "(int) a = 10",
+        "    [nested]",
+        "    b = {first:a} nested",
+        "[second]",
+        "c = {first:nested:b} and more",
+        "(int) invalid = not a number",
+    ])
+
+    def test_sections_are_parsed_on_access(self):
+
+        config = ConfigParser().parse(self.source, lazy=True)
+
+        self.assertEqual(config._elements["root"], "value")
+        self.assertIn("first", config)
+        self.assertIsInstance(config._elements["first"], better.configparser._configparser._LazySection)
+
+        self.assertEqual(config["first"], {"a": 10, "nested": {"b": "10 nested"}})
+        self.assertIsInstance(config._elements["first"], dict)
+        self.assertIsInstance(config._elements["second"], better.configparser._configparser._LazySection)
+
+    def test_interpolation_across_sections(self):
+
+        config = ConfigParser().parse(self.source.replace("not a number", "20"), lazy=True)
+
+        self.assertEqual(config.get("second:c"), "10 nested and more")
+        self.assertIsInstance(config._elements["first"], dict)
+
+    def test_interpolation_forward_references(self):
+
+        source = os.linesep.join([
+            "(list<int>) b = {section:c}, {a}",
+            "(int) a = 4",
+            "[section]",
+            "c = {a}{a}",
+            "d = {a} and {section:c} are {b}",
+        ])
+
+        self.assertEqual(ConfigParser().parse(source, lazy=True), ConfigParser(source))
+        self.assertEqual(ConfigParser().parse(source, lazy=True), {
+            "a": 4,
+            "b": [44, 4],
+            "section": {"c": "44", "d": "4 and 44 are [44, 4]"}
+        })
+        self.assertEqual(ConfigParser().parse("x = {a:y}\n[a]\ny = 1\n", lazy=True)["x"], "1")
+
+    def test_errors_report_source_line(self):
+
+        config = ConfigParser().parse(self.source, lazy=True)
+
+        with pytest.raises(ValueError, match="Line 8"):
+            config["second"]
+
+    def test_matches_eager_parse(self):
+
+        for filename in os.listdir(RESOURCES):
+            path = os.path.join(RESOURCES, filename)
+            self.assertEqual(ConfigParser().read(path, lazy=True), ConfigParser().read(path))
+            self.assertEqual(ConfigParser().read(path, lazy=True, mmap=True), ConfigParser().read(path))
+
+    def test_lazy_sections_merge(self):
+
+        config = ConfigParser("[first]\nz = 1")
+        config.parse(self.source, lazy=True)
+        config.parse("[first]\ny = 2", lazy=True)
+
+        self.assertEqual(config["first"], {"z": "1", "a": 10, "nested": {"b": "10 nested"}, "y": "2"})
+
+class Test_ConfigParserIterparse(unittest.TestCase):
+
+    source = os.linesep.join([
+        "a = 1",
+        "[first]",
+        "    [nested]",
+        "    (int) b = 2",
+        "    c = multi",
+        "        line",
+        "d",
+        "[second]",
+        "e = {a}",
+    ])
+
+    def test_events(self):
+
+        events = [
+            (event, item.line, item.scope, item.name)
+            for event, item in ConfigParser().iterparse(self.source)
+        ]
+
+        self.assertEqual(events, [
+            ("setting", 1, [], "a"),
+            ("open", 2, [], "first"),
+            ("open", 3, ["first"], "nested"),
+            ("setting", 4, ["first", None, None, None, "nested"], "b"),
+            ("setting", 5, ["first", None, None, None, "nested"], "c"),
+            ("close", 3, ["first"], "nested"),
+            ("setting", 7, ["first"], "d"),
+            ("close", 2, [], "first"),
+            ("open", 8, [], "second"),
+            ("setting", 9, ["second"], "e"),
+            ("close", 8, [], "second"),
+        ])
+
+    def test_values(self):
+
+        config = ConfigParser()
+        values = {item.name: item.value for event, item in config.iterparse(self.source) if event == "setting"}
+
+        self.assertEqual(values, {"a": "1", "b": "2", "c": "multi\nline", "d": True, "e": "{a}"})
+        self.assertEqual(config, {})
+
+        converted = ConfigParser().iterparse(self.source, engine="fast", convert=True)
+        self.assertEqual({item.name: item.value for event, item in converted if event == "setting"}["b"], 2)
+
+    def test_settings_are_slotted(self):
+
+        with pytest.raises(AttributeError):
+            better.configparser.Setting([], 1, "name", "value").other = None
+
+class Test_ConfigParserAccessor(unittest.TestCase):
+
+    def setUp(self):
+        self.config = ConfigParser(r"""
+        basic = Still works
+        [1]
+            [2]
+                [3]
+                    key = value
+                    (int) number = 10
+        """)
+
+    def test_accessor_matches_get(self):
+
+        for path in ["basic", "1:2:3:key", "1:2:3:number", "1:2", "1:2:3:not present", "basic:deeper", "missing"]:
+            accessor = self.config.accessor(path)
+            self.assertEqual(accessor(), self.config.get(path))
+            self.assertEqual(accessor("default"), self.config.get(path, "default"))
+
+    def test_cached_accessor_is_invalidated(self):
+
+        accessor = self.config.accessor("1:2:3:key", cache=True)
+        self.assertEqual(accessor(), "value")
+
+        # Direct modification of nested sections is not observed
+        self.config["1"]["2"]["3"]["key"] = "changed"
+        self.assertEqual(accessor(), "value")
+
+        self.config.parse("[1]\n    [2]\n        [3]\n        key = parsed")
+        self.assertEqual(accessor(), "parsed")
+
+        del self.config["1"]
+        self.assertEqual(accessor("gone"), "gone")
+
+        self.config["1"] = {"2": {"3": {"key": "set"}}}
+        self.assertEqual(accessor(), "set")
+
+    def test_accessor_materializes_lazy_sections(self):
+
+        config = ConfigParser().parse("[section]\n(int) a = 1", lazy=True)
+        self.assertEqual(config.accessor("section:a")(), 1)
+
+class Test_ConfigParserIndex(unittest.TestCase):
+
+    source = os.linesep.join([
+        "basic = value",
+        "[db]",
+        "host = localhost",
+        "    [replica]",
+        "    (int) port = 5432",
+        "[dbx]",
+        "other = value",
+    ])
+
+    def test_index_lookups(self):
+
+        config = ConfigParser(self.source, index=True)
+
+        self.assertEqual(config._index["db:replica:port"], 5432)
+        self.assertEqual(config.get("db:replica:port"), 5432)
+        self.assertEqual(config.get("db:replica"), {"port": 5432})
+        self.assertEqual(config.get("db:missing", "default"), "default")
+
+    def test_prefix_enumeration(self):
+
+        for index in (True, False):
+            config = ConfigParser(self.source, index=index)
+
+            self.assertEqual(config.paths("db"), ["db:host", "db:replica", "db:replica:port"])
+            self.assertEqual(config.paths("db:replica"), ["db:replica:port"])
+            self.assertEqual(config.paths("basic"), [])
+            self.assertEqual(
+                config.paths(),
+                ["basic", "db", "db:host", "db:replica", "db:replica:port", "dbx", "dbx:other"]
+            )
+
+    def test_index_follows_modification(self):
+
+        config = ConfigParser(self.source, index=True)
+
+        config["db"] = {"name": "accounts"}
+        self.assertEqual(config.paths("db"), ["db:name"])
+        self.assertIsNone(config.get("db:replica:port"))
+
+        del config["db"]
+        self.assertEqual(config.paths(), ["basic", "dbx", "dbx:other"])
+
+        config.parse("[dbx]\nother = changed")
+        self.assertEqual(config.get("dbx:other"), "changed")
+
+    def test_index_follows_nested_edits(self):
+
+        config = ConfigParser("[a]\nb = 1\n[c]\n    [d]\n    e = 1", index=True)
+
+        config["a"]["b"] = "2"
+        config["c"]["d"]["e"] = "3"
+        self.assertEqual(config.get("a:b"), "2")
+        self.assertEqual(config.get("c:d:e"), "3")
+
+        config["a"]["new"] = "4"
+        self.assertEqual(config.get("a:new"), "4")
+
+        del config["a"]["b"]
+        self.assertIsNone(config.get("a:b"))
+        self.assertEqual(config.get("a:b", "default"), "default")
+
+    def test_index_with_lazy_sections(self):
+
+        config = ConfigParser(index=True).parse(self.source, lazy=True)
+
+        self.assertEqual(config.get("db:replica:port"), 5432)
+        self.assertEqual(config.paths("dbx"), ["dbx:other"])
+
+class Test_ConfigParserTypeRegistry(unittest.TestCase):
+
+    def test_register_type(self):
+
+        class DurationParser(ConfigParser): pass
+
+        def duration(value):
+            number, unit = value.split()
+            return int(number) * {"s": 1, "m": 60}[unit]
+
+        DurationParser.register_type("duration", duration)
+
+        config = DurationParser("""
+        (duration) timeout = 2 m
+        (list<duration>) retries = 1 s, 5 s, 1 m
+        """)
+
+        self.assertEqual(config["timeout"], 120)
+        self.assertEqual(config["retries"], [1, 5, 60])
+
+        # The registration is local to the class it was made upon
+        with pytest.raises(ValueError):
+            ConfigParser("(duration) timeout = 2 m")
+
+    def test_invalid_type_name(self):
+
+        class RegisteringParser(ConfigParser): pass
+
+        with pytest.raises(ValueError):
+            RegisteringParser.register_type("not<valid>", str)
+
+    def test_custom_types_are_resolved_once(self):
+
+        import uuid
+
+        config = ConfigParser("(uuid.UUID) a = 12345678123456781234567812345678")
+
+        self.assertEqual(config["a"], uuid.UUID("12345678123456781234567812345678"))
+        self.assertIs(ConfigParser._importedTypes["uuid.UUID"], uuid.UUID)
+        self.assertEqual(ConfigParser._signatures["uuid.UUID"], ("uuid.UUID", None))
+
+class Test_ConfigParserArrays(unittest.TestCase):
+
+    source = """
+    (list<int>) ids = 1, 2, 3
+    (tuple<float>) weights = 0.5, 1.5
+    (list<int>) empty =
+    (set<int>) unique = 1, 2
+    (list<str>) names = a, b
+    (list<int>) quoted = '1', "2"
+    """
+
+    def test_numeric_sequences_are_arrays(self):
+
+        config = ConfigParser(self.source, arrays="array")
+
+        self.assertEqual(config["ids"], array.array("q", [1, 2, 3]))
+        self.assertEqual(config["weights"], (0.5, 1.5))  # Tuples are not stored as arrays
+        self.assertEqual(config["empty"], array.array("q"))
+        self.assertEqual(config["quoted"], [1, 2])  # Quoted items are converted one at a time
+        self.assertEqual(config["unique"], {1, 2})
+        self.assertEqual(config["names"], ["a", "b"])
+
+    def test_arrays_disabled_by_default(self):
+
+        config = ConfigParser(self.source)
+
+        self.assertEqual(config["ids"], [1, 2, 3])
+        self.assertEqual(config["weights"], (0.5, 1.5))
+        self.assertEqual(config["empty"], [])
+
+    def test_items_without_a_direct_conversion(self):
+
+        # Empty items have always converted to zero, and oversized ints do not fit an array
+        config = ConfigParser("(list<int>) a = 1, , 2\n(list<int>) b = 1, {}".format(2**70), arrays="array")
+
+        self.assertEqual(config["a"], [1, 0, 2])
+        self.assertEqual(config["b"], [1, 2**70])
+
+        with pytest.raises(ValueError):
+            ConfigParser("(list<int>) a = 1, x", arrays="array")
+
+    def test_arrays_round_trip(self):
+
+        config = ConfigParser(self.source, arrays="array")
+        written = ConfigParser(config.dumps(), arrays="array")
+
+        self.assertEqual(written["ids"], config["ids"])
+        self.assertEqual(written["weights"], config["weights"])
+        self.assertEqual(ConfigParser(config.dumps())["ids"], [1, 2, 3])
+
+    def test_tuples_round_trip_with_arrays(self):
+
+        config = ConfigParser("(tuple<int>) t = 1, 2\n(tuple<float>) f = 0.5, 1.5", arrays="array")
+
+        self.assertEqual(config["t"], (1, 2))
+        self.assertIn("(tuple<int>) t = 1, 2", config.dumps())
+        self.assertIn("(tuple<float>) f = 0.5, 1.5", config.dumps())
+
+    def test_reload_numpy_arrays(self):
+
+        pytest.importorskip("numpy")
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "config.ini")
+            with open(path, "w") as handler:
+                handler.write("(list<int>) ids = 1, 2, 3\n(list<int>) same = 1\n")
+
+            config = ConfigParser(arrays="numpy").read(path)
+
+            with open(path, "w") as handler:
+                handler.write("(list<int>) ids = 1, 2, 4\n(list<int>) same = 1\n# changed\n")
+            status = os.stat(path)
+            os.utime(path, ns=(status.st_atime_ns, status.st_mtime_ns + 10**9))
+
+            self.assertEqual(config.reload(path).modified, ["ids"])
+            self.assertEqual(config["ids"].tolist(), [1, 2, 4])
+
+    def test_arrays_freeze_into_tuples(self):
+
+        frozen = ConfigParser(self.source, arrays="array").freeze()
+
+        self.assertEqual(frozen["ids"], (1, 2, 3))
+        hash(frozen)
+
+    def test_numpy_arrays(self):
+
+        numpy = pytest.importorskip("numpy")
+
+        config = ConfigParser(self.source, arrays="numpy")
+
+        self.assertIsInstance(config["ids"], numpy.ndarray)
+        self.assertEqual(config["ids"].dtype, numpy.int64)
+        self.assertEqual(config["weights"], (0.5, 1.5))
+        self.assertEqual(ConfigParser(config.dumps(), arrays="numpy")["ids"].tolist(), [1, 2, 3])
+
+    def test_invalid_arrays_option(self):
+
+        with pytest.raises(ValueError):
+            ConfigParser(arrays="vector")
+
+class Test_ConfigParserProfile(unittest.TestCase):
+
+    source = """
+    (uuid.UUID) identifier = 12345678123456781234567812345678  # A comment
+    [section]
+        (int) a = 10
+        b = {section:a} value
+    """
+
+    def test_profile_disabled_by_default(self):
+
+        self.assertIsNone(ConfigParser(self.source).profile)
+
+    def test_stages_are_recorded(self):
+
+        config = ConfigParser(profile=True).parse(self.source)
+        report = config.profile.report()
+
+        for stage in ("tokenize", "comments", "grammar", "build", "settings", "conversion", "interpolation"):
+            self.assertIn(stage, report["stages"])
+
+        self.assertEqual(report["stages"]["conversion"]["calls"], 3)
+        self.assertEqual(report["stages"]["interpolation"]["calls"], 1)
+        self.assertAlmostEqual(report["total"], sum(stage["seconds"] for stage in report["stages"].values()))
+
+        # Settings are recorded against their lines, the most time consuming line first
+        self.assertEqual({line["line"] for line in config.profile.report(lines=100)["lines"]}, {2, 3, 4, 5})
+        self.assertEqual(
+            [line["seconds"] for line in report["lines"]],
+            sorted((line["seconds"] for line in report["lines"]), reverse=True)
+        )
+
+    def test_imports_are_recorded_once(self):
+
+        ConfigParser._importedTypes.pop("uuid.UUID", None)
+
+        config = ConfigParser(profile=True).parse(self.source).parse(self.source)
+
+        self.assertEqual(list(config.profile.imports), ["uuid.UUID"])
+        self.assertEqual(config.profile.report()["stages"]["imports"]["calls"], 1)
+
+    def test_lines_of_files_record_their_source(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, "config.ini")
+            with open(filepath, "w") as handler: handler.write(self.source)
+
+            config = ConfigParser(profile=True)
+            config.read(filepath)
+            config.read_many([filepath])
+
+        self.assertEqual({line["source"] for line in config.profile.report()["lines"]}, {os.path.abspath(filepath)})
+
+    def test_reset(self):
+
+        config = ConfigParser(profile=True).parse(self.source, engine="fast")
+        self.assertNotIn("comments", config.profile.stages)  # The fast engine handles comments within its pattern
+
+        config.profile.reset()
+        self.assertEqual(config.profile.report(), {"total": 0, "stages": {}, "lines": [], "imports": {}})
+
+class Test_ConfigParserCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.config_path = os.path.join(self.directory.name, "config.ini")
+        self.cache_path = os.path.join(self.directory.name, "cache")
+
+        with open(self.config_path, "w") as handler:
+            handler.write("[section]\n(int) a = 10\nb = {section:a} value\n")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_cache_is_created_and_used(self):
+
+        config = ConfigParser().read(self.config_path, cache=self.cache_path)
+        self.assertEqual(config, {"section": {"a": 10, "b": "10 value"}})
+        self.assertEqual(len(os.listdir(self.cache_path)), 1)
+
+        # Replace the cached tree to prove that it is the cache that is read
+        cachepath = ConfigParser()._cachePath(self.config_path, self.cache_path)
+        with open(cachepath, "rb") as handler:
+            header = pickle.load(handler)
+        ConfigParser._writeCache(cachepath, header, {"section": {"a": 20}})
+
+        self.assertEqual(ConfigParser().read(self.config_path, cache=self.cache_path), {"section": {"a": 20}})
+
+    def test_default_cache_directory(self):
+
+        ConfigParser().read(self.config_path, cache=True)
+        self.assertTrue(os.path.exists(os.path.join(self.directory.name, "__configcache__", "config.ini.pickle")))
+
+    def test_stale_cache_is_rebuilt(self):
+
+        ConfigParser().read(self.config_path, cache=self.cache_path)
+
+        with open(self.config_path, "w") as handler:
+            handler.write("[section]\n(int) a = 300\n")
+
+        self.assertEqual(ConfigParser().read(self.config_path, cache=self.cache_path), {"section": {"a": 300}})
+
+    def test_touched_file_uses_hash(self):
+
+        ConfigParser().read(self.config_path, cache=self.cache_path)
+
+        status = os.stat(self.config_path)
+        os.utime(self.config_path, ns=(status.st_atime_ns, status.st_mtime_ns + 10**9))
+
+        config = ConfigParser().read(self.config_path, cache=self.cache_path)
+        self.assertEqual(config, {"section": {"a": 10, "b": "10 value"}})
+
+    def test_corrupt_cache_is_rebuilt(self):
+
+        ConfigParser().read(self.config_path, cache=self.cache_path)
+
+        cachepath = ConfigParser()._cachePath(self.config_path, self.cache_path)
+        with open(cachepath, "wb") as handler:
+            handler.write(b"not a pickle")
+
+        self.assertEqual(ConfigParser().read(self.config_path, cache=self.cache_path)["section"]["a"], 10)
+
+    def test_untrusted_cache_is_not_loaded(self):
+
+        if not hasattr(os, "getuid"): pytest.skip("File ownership is not available")
+
+        ConfigParser().read(self.config_path, cache=self.cache_path)
+
+        cachepath = ConfigParser()._cachePath(self.config_path, self.cache_path)
+        with open(cachepath, "rb") as handler:
+            header = pickle.load(handler)
+        ConfigParser._writeCache(cachepath, header, {"section": {"a": 20}})
+        os.chmod(cachepath, 0o664)
+
+        self.assertEqual(ConfigParser().read(self.config_path, cache=self.cache_path)["section"]["a"], 10)
+
+    def test_registered_types_invalidate_cache(self):
+
+        class Parser(ConfigParser): pass
+
+        with open(self.config_path, "w") as handler:
+            handler.write("(word) a = value\n")
+
+        Parser.register_type("word", str.upper)
+        self.assertEqual(Parser().read(self.config_path, cache=self.cache_path)["a"], "VALUE")
+
+        Parser.register_type("word", str.title)
+        self.assertEqual(Parser().read(self.config_path, cache=self.cache_path)["a"], "Value")
+
+    def test_file_referencing_outside_itself_is_recorded(self):
+
+        with open(self.config_path, "w") as handler:
+            handler.write("b = {base:a} value\n")
+
+        for _ in range(2):
+            config = ConfigParser("[base]\na = 1").read(self.config_path, cache=self.cache_path)
+            self.assertEqual(config["b"], "1 value")
+
+        cachepath = ConfigParser()._cachePath(self.config_path, self.cache_path)
+        with open(cachepath, "rb") as handler:
+            pickle.load(handler)
+            self.assertIsNone(pickle.load(handler))
+
+    def test_cached_read_merges_sections(self):
+
+        config = ConfigParser("[section]\nc = 1")
+        config.read(self.config_path, cache=self.cache_path)
+        config.read(self.config_path, cache=self.cache_path)
+
+        self.assertEqual(config, {"section": {"a": 10, "b": "10 value", "c": "1"}})
+
+class Test_ConfigParserReload(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.config_path = os.path.join(self.directory.name, "config.ini")
+        self.revision = 0
+
+        self.write("a = 1\n[first]\n(int) b = 2\n[second]\nc = {first:b} value\n[third]\nd = 4\n")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, content: str):
+        with open(self.config_path, "w") as handler:
+            handler.write(content)
+
+        # Ensure that the modification is observed regardless of the resolution of the file system's clock
+        self.revision += 1
+        status = os.stat(self.config_path)
+        os.utime(self.config_path, ns=(status.st_atime_ns, status.st_mtime_ns + self.revision*10**9))
+
+    def test_unchanged_file(self):
+
+        config = ConfigParser().read(self.config_path)
+        changes = config.reload()
+
+        self.assertFalse(changes)
+        self.assertEqual(config["second"]["c"], "2 value")
+
+    def test_changed_section_is_reparsed(self):
+
+        config = ConfigParser().read(self.config_path)
+        third = config["third"]
+
+        self.write("a = 1\n[first]\n(int) b = 2\n[second]\nc = {first:b} value\n[third]\nd = 5\ne = 6\n")
+        changes = config.reload()
+
+        self.assertEqual(changes.added, ["third:e"])
+        self.assertEqual(changes.removed, [])
+        self.assertEqual(changes.modified, ["third:d"])
+        self.assertEqual(config["third"], {"d": "5", "e": "6"})
+        self.assertIsNot(config["third"], third)
+
+    def test_unchanged_sections_are_untouched(self):
+
+        config = ConfigParser().read(self.config_path)
+        first, second = config["first"], config["second"]
+
+        self.write("a = 1\n[first]\n(int) b = 2\n[second]\nc = {first:b} value\n")
+        changes = config.reload()
+
+        self.assertEqual(changes.removed, ["third", "third:d"])
+        self.assertNotIn("third", config)
+        self.assertIs(config["first"], first)
+        self.assertIs(config["second"], second)
+
+    def test_referencing_sections_are_reparsed(self):
+
+        config = ConfigParser().read(self.config_path)
+
+        self.write("a = 1\n[first]\n(int) b = 3\n[second]\nc = {first:b} value\n[third]\nd = 4\n")
+        changes = config.reload()
+
+        self.assertEqual(changes.modified, ["first:b", "second:c"])
+        self.assertEqual(config["second"]["c"], "3 value")
+
+    def test_reload_of_many_files(self):
+
+        other_path = os.path.join(self.directory.name, "other.ini")
+        with open(other_path, "w") as handler:
+            handler.write("[third]\nf = 7\n")
+
+        config = ConfigParser(index=True).read(self.config_path).read(other_path)
+
+        self.write("a = 1\n[first]\n(int) b = 2\n[second]\nc = {first:b} value\n[third]\nd = 8\n")
+        changes = config.reload()
+
+        self.assertEqual(changes.modified, ["third:d"])
+        self.assertEqual(config["third"], {"d": "8", "f": "7"})
+        self.assertEqual(config.get("third:d"), "8")
+
+        with pytest.raises(ValueError):
+            config.reload(os.path.join(self.directory.name, "missing.ini"))
+
+    def test_failed_reload_leaves_config(self):
+
+        config = ConfigParser().read(self.config_path)
+
+        self.write("a = 1\n[first]\n(int) b = two\n[second]\nc = {first:b} value\n[third]\nd = 4\n")
+        with pytest.raises(ValueError):
+            config.reload()
+
+        self.assertEqual(config["first"]["b"], 2)
+        self.assertEqual(config["second"]["c"], "2 value")
+
+    def test_reload_lazy_and_cached_reads(self):
+
+        for options in ({"lazy": True}, {"mmap": True}, {"cache": os.path.join(self.directory.name, "cache")}):
+            config = ConfigParser().read(self.config_path, **options)
+
+            self.write("a = 0\n[first]\n(int) b = 2\n[second]\nc = {first:b} value\n[third]\nd = 4\n")
+            self.assertEqual(config.reload().modified, ["a"])
+            self.assertEqual(config, ConfigParser().read(self.config_path))
+
+            self.write("a = 1\n[first]\n(int) b = 2\n[second]\nc = {first:b} value\n[third]\nd = 4\n")
+
+    def test_lazy_and_mapped_reads_are_fingerprinted_on_reload(self):
+
+        for options in ({"lazy": True}, {"mmap": True}, {"mmap": True, "lazy": True}):
+            config = ConfigParser().read(self.config_path, **options)
+            self.assertIsNone(config._sources[self.config_path].regions)
+
+            self.assertEqual(config.reload().modified, [])
+            self.assertIsNotNone(config._sources[self.config_path].regions)
+
+            # Replace the file rather than rewrite it - lazy sections may still be reading from the mapping of the original
+            os.rename(self.config_path, self.config_path + ".old")
+            self.write("a = 1\n[first]\n(int) b = 2\n[second]\nc = {first:b} value\n")
+            self.assertEqual(config.reload().removed, ["third", "third:d"])
+            self.assertEqual(config, ConfigParser().read(self.config_path))
+
+            self.write("a = 1\n[first]\n(int) b = 2\n[second]\nc = {first:b} value\n[third]\nd = 4\n")
+
+    def test_lazy_and_mapped_reads_changed_before_their_first_reload(self):
+
+        for options in ({"lazy": True}, {"mmap": True}, {"mmap": True, "lazy": True}):
+            config = ConfigParser().read(self.config_path, **options)
+
+            os.rename(self.config_path, self.config_path + ".old")
+            self.write("a = 1\n[first]\n(int) b = 2\n[second]\nc = {first:b} value\n")
+            self.assertEqual(config.reload().removed, ["third", "third:d"])
+            self.assertEqual(config, ConfigParser().read(self.config_path))
+
+            self.write("a = 1\n[first]\n(int) b = 2\n[second]\nc = {first:b} value\n[third]\nd = 4\n")
+
+class Test_ConfigParserWatch(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.config_path = os.path.join(self.directory.name, "config.ini")
+
+        with open(self.config_path, "w") as handler:
+            handler.write("[section]\na = 1\n")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def watch(self, poll: bool):
+
+        config = ConfigParser()
+        changes, changed = [], threading.Event()
+
+        def callback(change):
+            changes.append(change)
+            changed.set()
+
+        watcher = config.watch(self.config_path, callback, debounce = 0.2, interval = 0.01, poll = poll)
+        try:
+            self.assertEqual(config, {"section": {"a": "1"}})
+
+            # A burst of writes is reloaded once, when it is complete
+            for value in range(2, 6):
+                with open(self.config_path, "w") as handler:
+                    handler.write("[section]\na = {}\n".format(value))
+
+            self.assertTrue(changed.wait(5))
+            self.assertEqual(config, {"section": {"a": "5"}})
+
+            # Files replaced by a rename are observed
+            changed.clear()
+            temppath = os.path.join(self.directory.name, "config.tmp")
+            with open(temppath, "w") as handler:
+                handler.write("[section]\na = 5\nb = 6\n")
+            os.replace(temppath, self.config_path)
+
+            self.assertTrue(changed.wait(5))
+            self.assertEqual(config, {"section": {"a": "5", "b": "6"}})
+            self.assertEqual(changes[-1].added, ["section:b"])
+
+        finally:
+            watcher.close()
+
+        self.assertFalse(watcher.is_alive())
+
+    def test_watch(self):
+        self.watch(poll = False)
+
+    def test_watch_polling(self):
+        self.watch(poll = True)
+
+    def test_failed_watch_releases_descriptors(self):
+
+        if not os.path.isdir("/proc/self/fd"): pytest.skip("Open descriptors cannot be counted")
+
+        with open(self.config_path, "w") as handler:
+            handler.write("x = {missing:key}\n")
+
+        before = len(os.listdir("/proc/self/fd"))
+        for _ in range(5):
+            with pytest.raises(Exception):
+                ConfigParser().watch(self.config_path)
+
+        self.assertEqual(len(os.listdir("/proc/self/fd")), before)
+
+class Test_ConfigParserDumps(unittest.TestCase):
+
+    def setUp(self):
+        self.config = ConfigParser({
+            "a": 10,
+            "b": os.linesep.join(["x"*70, "y"*70, "z"*70]),
+            "section": {"c": [1, 2], "nested": {"d": "value"}},
+            "large": {"key{}".format(i): "value {}".format(i) for i in range(10000)}
+        })
+
+    def test_dumps_matches_write(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "config.ini")
+            self.config.write(path)
+
+            with open(path) as handler:
+                self.assertEqual(self.config.dumps(), handler.read())
+
+        self.assertEqual(ConfigParser(self.config.dumps()), self.config)
+
+    def test_write_streams(self):
+
+        text = io.StringIO()
+        self.config.write(text)
+        self.assertEqual(text.getvalue(), self.config.dumps())
+
+        binary = io.BytesIO()
+        self.config.write(binary)
+        self.assertEqual(binary.getvalue(), self.config.dumps().encode())
+
+        with pytest.raises(ValueError):
+            self.config.write(object())
+
+    def test_write_socket(self):
+
+        sender, receiver = socket.socketpair()
+        with sender, receiver:
+            received = []
+            thread = threading.Thread(target = lambda: received.extend(iter(lambda: receiver.recv(65536), b"")))
+            thread.start()
+
+            self.config.write(sender)
+            sender.shutdown(socket.SHUT_WR)
+            thread.join()
+
+        self.assertEqual(b"".join(received), self.config.dumps().encode())
+
+class Test_ConfigParserReadMany(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.paths = []
+
+        for name, content in (
+            ("base.ini", "name = base\n[database]\nhost = localhost\n(int) port = 5432\n"),
+            ("env.ini", "[database]\nhost = db.internal\nurl = {database:host}:{database:port}\n"),
+            ("host.ini", "name = host\n"),
+            ):
+            path = os.path.join(self.directory.name, name)
+            with open(path, "w") as handler:
+                handler.write(content)
+            self.paths.append(path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_precedence_matches_sequential_reads(self):
+
+        sequential = ConfigParser()
+        for path in self.paths: sequential.read(path)
+
+        config = ConfigParser(index = True).read_many(self.paths, workers = 3)
+
+        self.assertEqual(config, sequential)
+        self.assertEqual(config, {
+            "name": "host",
+            "database": {"host": "db.internal", "port": 5432, "url": "db.internal:5432"}
+        })
+        self.assertEqual(config.get("database:url"), "db.internal:5432")
+
+    def test_origins(self):
+
+        config = ConfigParser().read_many(self.paths)
+
+        self.assertEqual(config.origin("name"), (self.paths[2], 1))
+        self.assertEqual(config.origin("database:host"), (self.paths[1], 2))
+        self.assertEqual(config.origin("database:port"), (self.paths[0], 4))
+        self.assertEqual(config.origin("database:url"), (self.paths[1], 3))
+        self.assertIsNone(config.origin("missing"))
+
+        self.assertIsNone(ConfigParser().read(self.paths[0]).origin("name"))
+
+    def test_failure_leaves_config(self):
+
+        config = ConfigParser({"database": {"host": "original"}})
+
+        with pytest.raises(IOError):
+            config.read_many(self.paths + [os.path.join(self.directory.name, "missing.ini")])
+
+        self.assertEqual(config, {"database": {"host": "original"}})
+
+class Test_ConfigChain(unittest.TestCase):
+
+    def setUp(self):
+        self.base = ConfigParser("""
+        name = base
+        [database]
+        host = localhost
+        (int) port = 5432
+            [pool]
+            (int) size = 10
+        [logging]
+        level = info
+        """)
+        self.override = ConfigParser("""
+        [database]
+        host = db.internal
+            [pool]
+            (int) size = 50
+        [logging]
+        """)
+        self.chain = ConfigChain(self.override, self.base)
+
+    def test_lookups_fall_through(self):
+
+        self.assertEqual(self.chain["name"], "base")
+        self.assertEqual(self.chain.get("database:host"), "db.internal")
+        self.assertEqual(self.chain.get("database:port"), 5432)
+        self.assertEqual(self.chain.get("database:pool:size"), 50)
+        self.assertEqual(self.chain.get("database:missing", 1), 1)
+        self.assertEqual(self.chain["logging"], {"level": "info"})
+        self.assertEqual(list(self.chain), ["name", "database", "logging"])
+
+    def test_settings_hide_lower_sections(self):
+
+        chain = ConfigChain({"database": "disabled"}, self.base)
+        self.assertEqual(chain["database"], "disabled")
+
+        chain = ConfigChain({"database": {"host": "a"}}, {"database": "disabled"}, self.base)
+        self.assertEqual(chain["database"], {"host": "a"})
+
+    def test_writes_go_to_the_first_layer(self):
+
+        child = self.chain.new_child()
+        child["name"] = "tenant"
+
+        self.assertEqual(child["name"], "tenant")
+        self.assertEqual(self.chain["name"], "base")
+        self.assertEqual(child.parents.layers, self.chain.layers)
+
+        del child["name"]
+        with pytest.raises(KeyError):
+            del child["name"]
+
+    def test_merged_shares_unchanged_sections(self):
+
+        merged = ConfigChain(ConfigParser({"database": {"host": "tenant"}}), self.base).merged()
+
+        self.assertIsInstance(merged, ConfigParser)
+        self.assertEqual(merged.get("database:host"), "tenant")
+        self.assertEqual(merged.get("database:port"), 5432)
+        self.assertIs(merged["logging"], self.base["logging"])
+        self.assertIs(merged["database"]["pool"], self.base["database"]["pool"])
+        self.assertIsNot(merged["database"], self.base["database"])
+
+        self.assertEqual(self.chain.merged(), {
+            "name": "base",
+            "database": {"host": "db.internal", "port": 5432, "pool": {"size": 50}},
+            "logging": {"level": "info"}
+        })
+
+class Test_ConfigParserFreeze(unittest.TestCase):
+
+    def setUp(self):
+        self.config = ConfigParser("""
+        name = service
+        (list<int>) ports = 80, 443
+        [database]
+        host = localhost
+            [pool]
+            (int) size = 10
+        [logging]
+        (set<str>) handlers = console, file
+        """, index = True)
+
+    def test_snapshot_is_immutable_and_hashable(self):
+
+        frozen = self.config.freeze()
+
+        self.assertEqual(frozen, {
+            "name": "service",
+            "ports": (80, 443),
+            "database": {"host": "localhost", "pool": {"size": 10}},
+            "logging": {"handlers": frozenset({"console", "file"})}
+        })
+        self.assertEqual(frozen.get("database:pool:size"), 10)
+        self.assertEqual(frozen.get("database:missing", 1), 1)
+
+        with pytest.raises(TypeError):
+            frozen["name"] = "other"
+        with pytest.raises(TypeError):
+            frozen["database"]["host"] = "other"
+
+        self.assertEqual(hash(frozen), hash(self.config.freeze()))
+        self.assertEqual(len({frozen, self.config.freeze()}), 1)
+
+        # The snapshot is independent of the config
+        self.config["database"]["host"] = "db.internal"
+        self.assertEqual(frozen["database"]["host"], "localhost")
+        self.assertNotEqual(frozen, self.config.freeze())
+
+    def test_thaw_copies_sections_on_access(self):
+
+        frozen = self.config.freeze()
+        config = frozen.thaw()
+
+        self.assertIsInstance(config, ConfigParser)
+        self.assertEqual(config.get("database:pool:size"), 10)
+
+        config["database"]["pool"]["size"] = 20
+        config["name"] = "thawed"
+
+        self.assertEqual(config.get("database:host"), "localhost")
+        self.assertEqual(config["database"], {"host": "localhost", "pool": {"size": 20}})
+        self.assertEqual(frozen.get("database:pool:size"), 10)
+        self.assertEqual(frozen["name"], "service")
+
+        del config["logging"]
+        self.assertEqual(config.paths(), ["database", "database:host", "database:pool", "database:pool:size", "name", "ports"])
+
+    def test_thaw_restores_value_types(self):
+
+        config = ConfigParser("""
+        (list<int>) ids = 1, 2, 3
+        (tuple<int>) pair = 1, 2
+        [a]
+        (set<int>) s = 1, 2
+        (list<str>) names = x, y
+        """)
+
+        frozen = config.freeze()
+        thawed = frozen.thaw()
+
+        self.assertEqual(frozen, config)
+        self.assertEqual(thawed, config)
+        self.assertEqual(thawed.dumps(), config.dumps())
+        self.assertIsInstance(thawed["a"]["s"], set)
+
+        thawed["ids"].append(4)
+        thawed["a"]["names"].append("z")
+        self.assertEqual(frozen["ids"], (1, 2, 3))
+        self.assertEqual(frozen["a"]["names"], ("x", "y"))
+
+    def test_thaw_restores_arrays(self):
+
+        config = ConfigParser("(list<int>) ids = 1, 2, 3", arrays="array")
+        thawed = config.freeze().thaw()
+
+        self.assertEqual(thawed["ids"], array.array("q", [1, 2, 3]))
+        self.assertEqual(thawed.dumps(), config.dumps())
+
+    def test_freeze_numpy_arrays(self):
+
+        numpy = pytest.importorskip("numpy")
+
+        config = ConfigParser("(list<int>) ids = 1, 2, 3", arrays="numpy")
+        frozen = config.freeze()
+        hash(frozen)
+
+        self.assertEqual(frozen["ids"], (1, 2, 3))
+        self.assertIsInstance(frozen.thaw()["ids"], numpy.ndarray)
+        self.assertEqual(frozen.thaw()["ids"].tolist(), [1, 2, 3])
+
 class TestSavingConfigs(unittest.TestCase):
 
     def setUp(self):
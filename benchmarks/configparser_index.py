@@ -0,0 +1,80 @@
+""" Compare ConfigParser.get with and without the flat path index
+
+Reports the time taken to look up every setting path of a generated config by traversal and by index, and the memory
+held by the index itself.
+
+    python benchmarks/configparser_index.py --sections 200 --depth 4 --settings 20
+"""
+import os
+import sys
+import timeit
+import argparse
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from better import ConfigParser
+
+def generate(sections: int, depth: int, settings: int) -> (str, [str]):
+    """ Generate a config of nested sections and the paths of all of its settings
+
+    Params:
+        sections (int): The number of top level sections
+        depth (int): The number of sections nested within each top level section
+        settings (int): The number of settings within each section
+
+    Returns:
+        (str, [str]): The config, and the paths of its settings
+    """
+    lines, paths = [], []
+    for section in range(sections):
+        scope = []
+        for level in range(depth):
+            name = "section {}".format(section) if not level else "level {}".format(level)
+            scope.append(name)
+            lines.append("{}[{}]".format("    "*level, name))
+            for setting in range(settings):
+                lines.append("{}key {} = value {}".format("    "*(level + 1), setting, setting))
+                paths.append(":".join(scope + ["key {}".format(setting)]))
+    return "\n".join(lines), paths
+
+def measure(source: str, paths: [str], index: bool, repeat: int) -> dict:
+    """ Parse the source and time the lookup of each path
+
+    Returns:
+        dict: The parse memory and the best time to look up all of the paths
+    """
+    tracemalloc.start()
+    config = ConfigParser(source, index=index)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    get = config.get
+    lookup = min(timeit.repeat(lambda: [get(path) for path in paths], number=1, repeat=repeat))
+    return {"memory": memory, "lookup": lookup}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sections", type=int, default=200)
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--settings", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    source, paths = generate(args.sections, args.depth, args.settings)
+
+    traversal = measure(source, paths, False, args.repeat)
+    indexed = measure(source, paths, True, args.repeat)
+
+    print("paths looked up:     {}".format(len(paths)))
+    print("traversal lookup:    {:.2f} us/get".format(traversal["lookup"]/len(paths)*1e6))
+    print("index lookup:        {:.2f} us/get ({:.1f}x)".format(
+        indexed["lookup"]/len(paths)*1e6, traversal["lookup"]/indexed["lookup"]
+    ))
+    print("config memory:       {:.1f} KiB".format(traversal["memory"]/1024))
+    print("index memory cost:   {:.1f} KiB (+{:.0%})".format(
+        (indexed["memory"] - traversal["memory"])/1024, (indexed["memory"] - traversal["memory"])/traversal["memory"]
+    ))
+
+if __name__ == "__main__":
+    main()
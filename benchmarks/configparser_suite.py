@@ -0,0 +1,230 @@
+""" Benchmark ConfigParser over generated configs of different shapes
+
+Generates a config for each shape and times parse, read, get, write and a write/parse round trip of it, tracking the
+peak memory of each operation. The results are printed and can be saved as JSON. A saved run can be compared against
+a later one - with a threshold, any operation that slows by more than the threshold fails the run.
+
+    python benchmarks/configparser_suite.py --scale 2 --output before.json
+    python benchmarks/configparser_suite.py --scale 2 --compare before.json --threshold 0.1
+
+Shapes:
+    deep            sections nested many levels deep
+    wide            a few sections holding many settings
+    multiline       settings with long values continued over many lines
+    interpolation   settings that interpolate chains of other settings
+    typed           settings cast to ints, floats, bools and sequences
+    eval            settings of the eval type - parsed unsafely
+"""
+import os
+import sys
+import json
+import time
+import timeit
+import argparse
+import platform
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from better import ConfigParser
+
+def deep(scale: int) -> str:
+    """ Sections nested ten levels deep, each holding a handful of settings """
+    lines = []
+    for section in range(20*scale):
+        for level in range(10):
+            name = "section {}".format(section) if not level else "level {}".format(level)
+            lines.append("{}[{}]".format("    "*level, name))
+            lines.extend("{}key {} = value {}".format("    "*(level + 1), i, i) for i in range(5))
+    return "\n".join(lines)
+
+def wide(scale: int) -> str:
+    """ A few sections, each holding thousands of settings """
+    lines = []
+    for section in range(5):
+        lines.append("[section {}]".format(section))
+        lines.extend("    key {} = value {}".format(i, i) for i in range(2000*scale))
+    return "\n".join(lines)
+
+def multiline(scale: int) -> str:
+    """ Settings whose values are continued over many lines """
+    lines = ["[text]"]
+    for setting in range(100*scale):
+        lines.append("    paragraph {} = the first line of the paragraph".format(setting))
+        lines.extend("        continued line {} of the paragraph, with a few more words".format(i) for i in range(30))
+    return "\n".join(lines)
+
+def interpolation(scale: int) -> str:
+    """ Chains of settings, each interpolating the previous setting of its chain and a shared root """
+    lines = ["root = /srv/application"]
+    for chain in range(50*scale):
+        lines.append("[chain {}]".format(chain))
+        lines.append("    link 0 = {root}/start")
+        lines.extend("    link {} = {{chain {}:link {}}}/step".format(i, chain, i - 1) for i in range(1, 20))
+    return "\n".join(lines)
+
+def typed(scale: int) -> str:
+    """ Settings cast to scalar and sequence types """
+    lines = []
+    for section in range(100*scale):
+        lines.append("[section {}]".format(section))
+        lines.extend([
+            "    (int) count = {}".format(section),
+            "    (float) ratio = {}.5".format(section),
+            "    (bool) enabled = True",
+            "    (list<int>) ids = {}".format(", ".join(str(i) for i in range(50))),
+            "    (tuple<float>) weights = {}".format(", ".join("{}.25".format(i) for i in range(20))),
+            "    (set<str>) tags = alpha, beta, gamma",
+        ])
+    lines.append("(list<int>) identifiers = {}".format(", ".join(str(i) for i in range(10000*scale))))
+    return "\n".join(lines)
+
+def evaluated(scale: int) -> str:
+    """ Settings of the eval type """
+    lines = []
+    for section in range(100*scale):
+        lines.append("[section {}]".format(section))
+        lines.extend("    (eval) value {} = [{}, {} * 2, sum(range({}))]".format(i, i, i, i) for i in range(10))
+    return "\n".join(lines)
+
+SHAPES = {
+    "deep": (deep, True),
+    "wide": (wide, True),
+    "multiline": (multiline, True),
+    "interpolation": (interpolation, True),
+    "typed": (typed, True),
+    "eval": (evaluated, False),
+}
+
+def paths(config: ConfigParser) -> [str]:
+    """ Collect the colon delimited path of every setting within a config """
+    collected = []
+    def walk(node: dict, prefix: str):
+        for key, value in node.items():
+            path = prefix + key
+            if isinstance(value, dict): walk(value, path + ":")
+            else: collected.append(path)
+    walk(config, "")
+    return collected
+
+def measure(operation: callable, repeat: int) -> dict:
+    """ Time an operation, taking the best of the repeats, and measure its peak memory over a separate run
+
+    Returns:
+        dict: The best time in seconds and the peak memory in bytes
+    """
+    seconds = min(timeit.repeat(operation, number=1, repeat=repeat))
+
+    tracemalloc.start()
+    operation()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"seconds": seconds, "peak": peak}
+
+def benchmark(shape: str, scale: int, repeat: int, directory: str) -> dict:
+    """ Run the operations over the config of a shape
+
+    Returns:
+        dict: The measurements of each operation, and the size of the config
+    """
+    generate, safe = SHAPES[shape]
+    source = generate(scale)
+
+    filepath = os.path.join(directory, "{}.ini".format(shape))
+    with open(filepath, "w") as handle: handle.write(source)
+
+    config = ConfigParser(safe=safe).parse(source)
+    settings = paths(config)
+    written = os.path.join(directory, "{}.written.ini".format(shape))
+
+    operations = {
+        "parse": lambda: ConfigParser(safe=safe).parse(source),
+        "read": lambda: ConfigParser(safe=safe).read(filepath),
+        "get": lambda: [config.get(path) for path in settings],
+        "write": lambda: config.write(written),
+        "round trip": lambda: ConfigParser(safe=safe).parse(config.dumps()),
+    }
+
+    return {
+        "bytes": len(source.encode()),
+        "settings": len(settings),
+        "operations": {name: measure(operation, repeat) for name, operation in operations.items()},
+    }
+
+def compare(results: dict, baseline: dict, threshold: float) -> [str]:
+    """ Compare the times of a run against a baseline run
+
+    Params:
+        results (dict): The results of this run
+        baseline (dict): The results of a previous run
+        threshold (float): The allowed fractional slow down of an operation, None to only report the changes
+
+    Returns:
+        [str]: The operations that slowed by more than the threshold
+    """
+    regressions = []
+    for shape, result in results["shapes"].items():
+        previous = baseline["shapes"].get(shape)
+        if previous is None: continue
+
+        for name, measured in result["operations"].items():
+            before = previous["operations"].get(name)
+            if before is None: continue
+
+            change = measured["seconds"]/before["seconds"] - 1
+            print("{:<15} {:<12} {:>10.2f} ms -> {:>10.2f} ms {:>+8.1%}".format(
+                shape, name, before["seconds"]*1e3, measured["seconds"]*1e3, change
+            ))
+
+            if threshold is not None and change > threshold:
+                regressions.append("{} {} slowed by {:.1%}".format(shape, name, change))
+
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--shapes", nargs="+", choices=list(SHAPES), default=list(SHAPES))
+    parser.add_argument("--scale", type=int, default=1, help="Multiply the size of every generated config")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="Save the results as JSON to this path")
+    parser.add_argument("--compare", help="The JSON results of a previous run to compare against")
+    parser.add_argument("--threshold", type=float, help="Fail when an operation slows by more than this fraction")
+    args = parser.parse_args()
+
+    results = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "scale": args.scale,
+        "repeat": args.repeat,
+        "shapes": {},
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        for shape in args.shapes:
+            result = results["shapes"][shape] = benchmark(shape, args.scale, args.repeat, directory)
+
+            print("{} - {} settings, {:.1f} KiB".format(shape, result["settings"], result["bytes"]/1024))
+            for name, measured in result["operations"].items():
+                print("    {:<12} {:>10.2f} ms {:>10.1f} KiB peak".format(
+                    name, measured["seconds"]*1e3, measured["peak"]/1024
+                ))
+
+    if args.output:
+        with open(args.output, "w") as handle: json.dump(results, handle, indent=4)
+
+    if args.compare:
+        with open(args.compare) as handle: baseline = json.load(handle)
+
+        if baseline.get("scale") != args.scale:
+            print("Warning: the baseline was run at scale {}".format(baseline.get("scale")))
+
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print("\n".join(["Regressions:"] + regressions))
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
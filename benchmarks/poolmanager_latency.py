@@ -0,0 +1,92 @@
+""" Measure the latency of PoolManager round trips and the CPU the parent process spends waiting on its pool
+
+Reports the time from putting a task to getting its result back, and the CPU time consumed by the parent process while
+it waits for tasks that sleep in the pool. A parent that waits without polling uses next to no CPU. The throughput of
+mapping many small tasks is reported for each chunksize.
+
+    python benchmarks/poolmanager_latency.py --size 4 --tasks 200 --sleep 0.5 --chunksizes 1 16 256 auto
+"""
+import os
+import sys
+import time
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from better.multiprocessing import PoolManager
+
+def echo(value):
+    return value
+
+def nap(length):
+    time.sleep(length)
+    return length
+
+def latency(size: int, tasks: int) -> [float]:
+    """ Time individual put/get round trips through a pool
+
+    Returns:
+        [float]: The seconds taken by each round trip
+    """
+    timings = []
+    with PoolManager(echo, size=size) as pool:
+        for i in range(tasks):
+            start = time.perf_counter()
+            pool.put(i)
+            pool.get()
+            timings.append(time.perf_counter() - start)
+    return timings
+
+def waiting(size: int, length: float) -> (float, float):
+    """ Measure the CPU consumed by the parent while it waits for a sleeping task from each process of the pool
+
+    Returns:
+        (float, float): The wall clock seconds and the parent's CPU seconds spent waiting
+    """
+    with PoolManager(nap, size=size) as pool:
+        # Allow the processes to start before measuring
+        for _ in range(size): pool.put(0)
+        pool.getAll()
+
+        wall, cpu = time.perf_counter(), time.process_time()
+        for _ in range(size): pool.put(length)
+        pool.getAll()
+        return time.perf_counter() - wall, time.process_time() - cpu
+
+def throughput(size: int, tasks: int, chunksize: (int, str)) -> float:
+    """ Time mapping small tasks over a pool with a chunksize
+
+    Returns:
+        float: The tasks completed per second
+    """
+    start = time.perf_counter()
+    PoolManager(echo, size=size).map(range(tasks), chunksize=chunksize)
+    return tasks / (time.perf_counter() - start)
+
+def chunksize(value: str) -> (int, str):
+    return value if value == "auto" else int(value)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=os.cpu_count())
+    parser.add_argument("--tasks", type=int, default=200)
+    parser.add_argument("--sleep", type=float, default=1.0)
+    parser.add_argument("--map-tasks", type=int, default=20000)
+    parser.add_argument("--chunksizes", type=chunksize, nargs="+", default=[1, 16, 256, "auto"])
+    args = parser.parse_args()
+
+    timings = sorted(latency(args.size, args.tasks))
+    wall, cpu = waiting(args.size, args.sleep)
+
+    print("round trips:         {}".format(len(timings)))
+    print("median latency:      {:.1f} us".format(statistics.median(timings)*1e6))
+    print("p99 latency:         {:.1f} us".format(timings[int(len(timings)*0.99) - 1]*1e6))
+    print("waited:              {:.2f} s".format(wall))
+    print("parent cpu waiting:  {:.3f} s ({:.1%})".format(cpu, cpu/wall))
+
+    for size in args.chunksizes:
+        print("map chunksize {:<6} {:.0f} tasks/s".format(size, throughput(args.size, args.map_tasks, size)))
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
 from . import threading
 from . import multiprocessing
 
-from .configparser import ConfigParser
\ No newline at end of file
+from .configparser import ConfigParser, ConfigChain
\ No newline at end of file
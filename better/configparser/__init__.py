@@ -0,0 +1,5 @@
+from ._configparser import ConsistencyError, Setting, Section, ChangeSet, FrozenSection, FrozenConfig, PathAccessor
+from ._configparser import ConfigParser
+from ._profile import ParseProfile
+from ._watcher import ConfigWatcher
+from ._chain import ConfigChain
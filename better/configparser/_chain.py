@@ -0,0 +1,157 @@
+import itertools
+import collections.abc
+
+from ._configparser import ConfigParser
+
+class ConfigChain(collections.abc.MutableMapping):
+    """ A layered view of a stack of configs - lookups fall through the layers in order, such that the first layer
+    takes precedence over the second and so on. Sections are merged across the layers in the manner parse merges them
+    (sections merge, settings overwrite), without copying - a section present in many layers is presented as a view
+    of the layers' sections, a section present in a single layer is that layer's section.
+
+    Writes, and deletions, are made to the first layer only.
+
+    Params:
+        *layers (ConfigParser / dict): The configs of the chain, in decreasing order of precedence. Defaults to a single
+            empty config
+    """
+
+    def __init__(self, *layers):
+        self.layers = list(layers) or [ConfigParser()]
+
+    def __repr__(self): return "<ConfigChain {}>".format(self.layers)
+    def __len__(self): return len(set().union(*self.layers))
+    def __getitem__(self, key: object):
+        value = _ChainSection._lookup(self.layers, key)
+        if value is _ChainSection._missing: raise KeyError(key)
+        return value
+    def __contains__(self, key: object): return any(key in layer for layer in self.layers)
+    def __setitem__(self, key: object, value: object): self.layers[0][key] = value
+    def __delitem__(self, key: object): del self.layers[0][key]
+    def __iter__(self): return iter(dict.fromkeys(itertools.chain.from_iterable(reversed(self.layers))))
+
+    def get(self, path: str, default: object = None) -> object:
+        """ Collect the value from within the chain and return or if not found return the default value
+
+        Params:
+            path (str): A colon delimited path of key names
+            default (object) = None: The value to be returned if nothing is found
+
+        Returns:
+            object: Either the value at the location of path, or the default
+        """
+
+        value = self
+        for key in path.split(":"):
+            if not isinstance(value, collections.abc.Mapping) or key not in value: return default
+            value = value[key]
+
+        return value
+
+    def new_child(self, layer: object = None):
+        """ Create a chain with a new layer ahead of the layers of this chain
+
+        Params:
+            layer (ConfigParser / dict) = None: The layer to take precedence, defaults to an empty config sharing the
+                options of the first layer
+
+        Returns:
+            ConfigChain: The new chain
+        """
+        if layer is None:
+            layer = self.layers[0]._spawn() if isinstance(self.layers[0], ConfigParser) else ConfigParser()
+        return type(self)(layer, *self.layers)
+
+    @property
+    def parents(self):
+        """ ConfigChain: A chain of all but the first layer """
+        return type(self)(*self.layers[1:])
+
+    def merged(self) -> ConfigParser:
+        """ Merge the layers into a single config. Only sections that are present in more than one layer are created,
+        every other section is shared with the layer it came from - modifying a shared section modifies the layer
+
+        Returns:
+            ConfigParser: The merged config, sharing the options of the first config layer
+        """
+
+        template = next((layer for layer in self.layers if isinstance(layer, ConfigParser)), None)
+        config = ConfigParser() if template is None else template._spawn()
+
+        # Collect the roots of the layers, parsing any lazy sections
+        roots = [layer.copy() if isinstance(layer, ConfigParser) else layer for layer in self.layers]
+        config._elements = _ChainSection._merge(roots)
+
+        if config._index is not None: config._index = config._indexTree(config._elements)
+        return config
+
+class _ChainSection(collections.abc.Mapping):
+    """ A section that is declared in many layers of a chain, presenting the merge of the layers' sections
+
+    Params:
+        sections ([dict]): The sections of the layers, in decreasing order of precedence
+    """
+
+    __slots__ = ("sections",)
+
+    _missing = object()  # Marks a key that is in none of the layers
+
+    def __init__(self, sections: [dict]):
+        self.sections = sections
+
+    def __repr__(self): return "<ChainSection {}>".format(dict(self))
+    def __len__(self): return len(set().union(*self.sections))
+    def __getitem__(self, key: object):
+        value = self._lookup(self.sections, key)
+        if value is self._missing: raise KeyError(key)
+        return value
+    def __contains__(self, key: object): return any(key in section for section in self.sections)
+    def __iter__(self): return iter(dict.fromkeys(itertools.chain.from_iterable(reversed(self.sections))))
+
+    @classmethod
+    def _layers(cls, nodes: [dict], key: object) -> [object]:
+        """ Collect the values of a key that contribute to the merge of the nodes - the first value, and if it is a
+        section the sections of the following nodes until a node holds a setting for the key
+
+        Params:
+            nodes ([dict]): The nodes, in decreasing order of precedence
+            key (object): The key
+
+        Returns:
+            [object]: The contributing values, in decreasing order of precedence
+        """
+        values = []
+        for node in nodes:
+            if key not in node: continue
+
+            value = node[key]
+            if not isinstance(value, dict):
+                if not values: values.append(value)
+                break
+
+            values.append(value)
+
+        return values
+
+    @classmethod
+    def _lookup(cls, nodes: [dict], key: object) -> object:
+        """ Look up a key through the nodes - a view is created for sections present in more than one node """
+        values = cls._layers(nodes, key)
+        if not values: return cls._missing
+        return values[0] if len(values) == 1 else cls(values)
+
+    @classmethod
+    def _merge(cls, nodes: [dict]) -> dict:
+        """ Merge the nodes into a new node, sharing the sections that are present in a single node
+
+        Params:
+            nodes ([dict]): The nodes, in decreasing order of precedence
+
+        Returns:
+            dict: The merged node
+        """
+        merged = {}
+        for key in dict.fromkeys(itertools.chain.from_iterable(reversed(nodes))):
+            values = cls._layers(nodes, key)
+            merged[key] = values[0] if len(values) == 1 else cls._merge(values)
+        return merged
@@ -0,0 +1,2484 @@
+import os
+import io
+import re
+import array
+import mmap
+import bisect
+import pickle
+import importlib
+import locale
+import hashlib
+import tempfile
+import concurrent.futures
+import itertools
+import stat
+import logging
+import collections
+
+from ._profile import ParseProfile
+from ._watcher import ConfigWatcher
+
+log = logging.getLogger("better.ConfigParser")
+
+class ConsistencyError(Exception):
+    """ A warning that the internal consistency of the config parser has broken
+    down
+    """
+    pass
+
+class Setting:
+    """ A setting value within the a config file. A key value representation
+    that holds its scope
+    """
+
+    __slots__ = ("scope", "line", "name", "value", "type")
+
+    def __init__(self, scope: [str], line: int, name: str, value: object, type: str = None):
+        self.scope = scope
+        self.line = line
+        self.name = name
+        self.value = value
+        self.type = type
+
+    def __repr__(self):
+        return "line {} in {}: ({}) {} = {}".format(self.line, self.scope, self.type, self.name, self.value)
+
+class Section:
+    """ A section header within a config file. Holds the scope the section was declared within and its name
+    """
+
+    __slots__ = ("scope", "line", "name")
+
+    def __init__(self, scope: [str], line: int, name: str):
+        self.scope = scope
+        self.line = line
+        self.name = name
+
+    def __repr__(self):
+        return "line {} in {}: [{}]".format(self.line, self.scope, self.name)
+
+class _LazySection:
+    """ A placeholder for a top level section whose settings have not yet been parsed. It records the regions of the
+    source buffers that declare the section, and the value the section had before they were read
+
+    Params:
+        base (object): The value of the section before the lazily parsed regions are applied
+        safe (bool): Manner of content parsing for the regions
+    """
+
+    __slots__ = ("base", "safe", "spans")
+
+    def __init__(self, base: object, safe: bool):
+        self.base = base
+        self.safe = safe
+        self.spans = []  # (buffer, start offset, end offset, number of lines preceding the start offset)
+
+    def __repr__(self):
+        return "<lazy section of {} regions>".format(len(self.spans))
+
+class _Region:
+    """ A region of a source file that declares top level keys - either the settings that precede the first top level
+    section, or a top level section up until the next. Regions are fingerprinted such that a reload can identify the
+    keys whose declarations have changed
+
+    Params:
+        start (int): The offset of the region within the source
+        end (int): The offset of the end of the region
+        line_offset (int): The number of lines that precede the region
+        keys (frozenset): The top level keys the region declares
+        references (frozenset): The top level keys the region's interpolation references
+        digest (bytes): The hash of the region's content
+    """
+
+    __slots__ = ("start", "end", "line_offset", "keys", "references", "digest")
+
+    def __init__(self, start: int, end: int, line_offset: int, keys: frozenset, references: frozenset, digest: bytes):
+        self.start = start
+        self.end = end
+        self.line_offset = line_offset
+        self.keys = keys
+        self.references = references
+        self.digest = digest
+
+    def __repr__(self):
+        return "<region {}-{} declaring {}>".format(self.start, self.end, sorted(self.keys))
+
+class _Source:
+    """ A record of a file that has been read into the config - the state of the file when it was read and the
+    fingerprints of its regions
+
+    Params:
+        safe (bool): Manner of content parsing the file was read with
+        size (int): The size of the file
+        mtime (int): The modification time of the file in nanoseconds
+        digest (str): The hash of the file's content, None until the file is fingerprinted
+        regions ([_Region]): The regions of the file, in order, None until the file is fingerprinted
+        keys (frozenset) = None: The top level keys set by reading the file - recorded until it is fingerprinted
+    """
+
+    __slots__ = ("safe", "size", "mtime", "digest", "regions", "keys")
+
+    def __init__(self, safe: bool, size: int, mtime: int, digest: str, regions: [_Region], keys: frozenset = None):
+        self.safe = safe
+        self.size = size
+        self.mtime = mtime
+        self.digest = digest
+        self.regions = regions
+        self.keys = keys
+
+    def __repr__(self):
+        if self.regions is None: return "<source not fingerprinted>"
+        return "<source of {} regions>".format(len(self.regions))
+
+class ChangeSet:
+    """ The colon delimited paths of a config that have been changed by a reload
+
+    Params:
+        added ([str]): The paths that did not exist before the reload
+        removed ([str]): The paths that no longer exist
+        modified ([str]): The paths whose value has changed
+    """
+
+    __slots__ = ("added", "removed", "modified")
+
+    def __init__(self, added: [str] = (), removed: [str] = (), modified: [str] = ()):
+        self.added = sorted(added)
+        self.removed = sorted(removed)
+        self.modified = sorted(modified)
+
+    def __bool__(self): return bool(self.added or self.removed or self.modified)
+
+    def __repr__(self):
+        return "<ChangeSet added {} removed {} modified {}>".format(self.added, self.removed, self.modified)
+
+class _FrozenList(tuple):
+    """ A frozen list - a tuple that is equal to the list it was frozen from, and thaws back into a list """
+
+    def __eq__(self, other): return tuple.__eq__(self, tuple(other) if isinstance(other, list) else other)
+    def __ne__(self, other): return not self == other
+    __hash__ = tuple.__hash__
+
+    def _thaw(self) -> list: return [FrozenSection._thawValue(item) for item in self]
+
+class _FrozenSet(frozenset):
+    """ A frozen set that thaws back into a set """
+
+    def _thaw(self) -> set: return set(self)
+
+class _FrozenBytes(bytes):
+    """ A frozen bytearray that thaws back into a bytearray """
+
+    def _thaw(self) -> bytearray: return bytearray(self)
+
+class _FrozenArray(tuple):
+    """ A frozen array.array or numpy array - a tuple of the array's items that is equal to the array it was frozen
+    from, and thaws back into an array of the same typecode or dtype
+
+    Params:
+        items (iterable): The items of the array
+        backend (str): "array" or "numpy"
+        typecode (str): The array.array typecode or numpy dtype of the array
+    """
+
+    def __new__(cls, items: object, backend: str, typecode: str):
+        frozen = tuple.__new__(cls, items)
+        frozen.backend, frozen.typecode = backend, typecode
+        return frozen
+
+    def __reduce__(self): return (type(self), (tuple(self), self.backend, self.typecode))
+    def __eq__(self, other):
+        if isinstance(other, array.array) or (hasattr(other, "tolist") and hasattr(other, "dtype")): other = other.tolist()
+        return tuple.__eq__(self, tuple(other) if isinstance(other, list) else other)
+    def __ne__(self, other): return not self == other
+    __hash__ = tuple.__hash__
+
+    def _thaw(self) -> object:
+        if self.backend == "numpy": return importlib.import_module("numpy").array(self, dtype=self.typecode)
+        return array.array(self.typecode, self)
+
+class FrozenSection(collections.abc.Mapping):
+    """ An immutable section of a frozen config snapshot. Equal to a dictionary with the same content, and hashable
+    provided its values are hashable
+
+    Params:
+        items (dict): The frozen content of the section - the section takes ownership of the dictionary
+    """
+
+    __slots__ = ("_items", "_hash")
+
+    def __init__(self, items: dict):
+        self._items = items
+        self._hash = None
+
+    def __repr__(self): return "<{} {}>".format(type(self).__name__, self._items)
+    def __len__(self): return len(self._items)
+    def __getitem__(self, key: object): return self._items[key]
+    def __contains__(self, key: object): return key in self._items
+    def __iter__(self): return iter(self._items)
+    def __hash__(self):
+        if self._hash is None: self._hash = hash(frozenset(self._items.items()))
+        return self._hash
+
+    def get(self, path: str, default: object = None) -> object:
+        """ Collect the value at a colon delimited path within the section - see ConfigParser.get
+
+        Params:
+            path (str): A colon delimited path of key names
+            default (object) = None: The value to be returned if nothing is found
+
+        Returns:
+            object: Either the value at the location of path, or the default
+        """
+        if not isinstance(path, str) or ":" not in path: return self._items.get(path, default)
+
+        value = self
+        for key in path.split(":"):
+            if not isinstance(value, FrozenSection): return default
+            value = value._items.get(key, PathAccessor._missing)
+            if value is PathAccessor._missing: return default
+
+        return value
+
+    @classmethod
+    def _freeze(cls, value: object) -> object:
+        """ Freeze a value - sections into frozen sections, mutable containers into their immutable counterparts. The
+        frozen containers record the type they were frozen from, such that thawing restores it
+
+        Params:
+            value (object): The value to be frozen
+
+        Returns:
+            object: The frozen value
+        """
+        if isinstance(value, dict): return FrozenSection({key: cls._freeze(item) for key, item in value.items()})
+        elif isinstance(value, list): return _FrozenList(cls._freeze(item) for item in value)
+        elif isinstance(value, set): return _FrozenSet(value)
+        elif isinstance(value, bytearray): return _FrozenBytes(value)
+        elif isinstance(value, array.array): return _FrozenArray(value.tolist(), "array", value.typecode)
+        elif type(value).__module__ == "numpy" and hasattr(value, "tolist") and hasattr(value, "dtype"):
+            return _FrozenArray(value.tolist(), "numpy", value.dtype.str)
+        return value
+
+    @staticmethod
+    def _thawValue(value: object) -> object:
+        """ Thaw a frozen value into the type it was frozen from - other values are shared as they are """
+        return value._thaw() if isinstance(value, _frozenTypes) else value
+
+    def _thaw(self) -> dict:
+        """ Copy the section into mutable sections and containers - the other values of its settings are shared """
+        return {key: self._thawValue(value) for key, value in self._items.items()}
+
+_frozenTypes = (FrozenSection, _FrozenList, _FrozenSet, _FrozenBytes, _FrozenArray)
+
+class FrozenConfig(FrozenSection):
+    """ An immutable snapshot of a config, as taken by ConfigParser.freeze
+
+    Params:
+        items (dict): The frozen content of the config
+        parser ((type, dict)): The class and options of the config that was frozen
+    """
+
+    __slots__ = ("_parser",)
+
+    def __init__(self, items: dict, parser: (type, dict)):
+        FrozenSection.__init__(self, items)
+        self._parser = parser
+
+    def thaw(self):
+        """ Create a mutable config from the snapshot. Thawing is cheap - a top level section of the snapshot is copied
+        into the config the first time it is accessed, sections that are never accessed are never copied
+
+        Returns:
+            ConfigParser: A config with the options of the config that was frozen
+        """
+
+        parser, options = self._parser
+        config = parser(**options)
+
+        # Thaw the top level sections on demand, as is done for lazily parsed sections
+        config._elements = {
+            key: _LazySection(value, config._safe) if value.__class__ is FrozenSection else self._thawValue(value)
+            for key, value in self._items.items()
+        }
+        if config._index is not None: config._index = config._indexTree(config._elements)
+
+        return config
+
+class PathAccessor:
+    """ A precompiled path into a config - the path is split once, and calling the accessor performs only the lookups
+    of the path's keys. Optionally the resolved value is cached until the config is next modified through its own
+    interface (setting or deleting keys, parsing or reading). Modifications made directly to the config's nested
+    sections are not observed by the cache.
+
+    Params:
+        config (ConfigParser): The config the path resolves within
+        path (str): A colon delimited path of key names
+        *,
+        cache (bool): Toggle caching of the resolved value
+    """
+
+    __slots__ = ("path", "_config", "_keys", "_cache", "_generation", "_value")
+
+    _missing = object()  # Marks a path that could not be resolved
+
+    def __init__(self, config, path: str, *, cache: bool = False):
+        self.path = path
+        self._config = config
+        self._keys = tuple(path.split(":"))
+        self._cache = cache
+        self._generation = None
+        self._value = self._missing
+
+    def __repr__(self):
+        return "<PathAccessor {}>".format(self.path)
+
+    def __call__(self, default: object = None) -> object:
+        """ Collect the value at the accessor's path
+
+        Params:
+            default (object) = None: The value to be returned if the path cannot be resolved
+
+        Returns:
+            object: The value at the path, or the default
+        """
+
+        if self._cache:
+            if self._generation != self._config._generation:
+                self._value = self._resolve()
+                self._generation = self._config._generation
+
+            value = self._value
+        else:
+            value = self._resolve()
+
+        return default if value is self._missing else value
+
+    def _resolve(self) -> object:
+        """ Traverse the config along the path
+
+        Returns:
+            object: The value at the path, or the missing marker if it could not be resolved
+        """
+
+        node = self._config._elements
+        for key in self._keys:
+            if not isinstance(node, dict): return self._missing
+
+            node = node.get(key, self._missing)
+            if node is self._missing: return node
+            if node.__class__ is _LazySection: node = self._config._materialize(key)
+
+        return node
+
+class ConfigParser(collections.abc.MutableMapping):
+    """ This is an implementation of the global ini configuration format
+
+    Parameters:
+        source (object): A source for the config parser, to allow it to
+            initialize with values. Must be either a string or an instance that
+            implements the io.IOBase interface (essentially must have a readline
+            method)
+        *,
+        indent_size (int): The number of of spaces that have to be adjacent,
+            such that they can be treated as a tab char
+        delimiter (str): The char(s) used to delimite sequences within the
+            configuration file
+        index (bool): Maintain a flat index of colon delimited paths to their
+            values, such that get is a single lookup and paths can be
+            enumerated by prefix. Settings and sections edited directly
+            within a section are seen by get, but not by paths, and
+            sections replaced directly within a section are not seen
+        arrays (bool / str): Convert list settings of ints or floats into
+            compact arrays - "array" for array.array, "numpy" for numpy
+            arrays and True for numpy when it is installed, else array.array
+        profile (bool): Record the time spent in each stage of parsing, see
+            ConfigParser.profile
+
+    Raises:
+        ValueError: In the event that the source provided does not have a
+            readline function
+    """
+
+    _rxComments = re.compile(r"[#;].*")  # Identifies comments and all following characters
+
+    _rxEmptyLine = re.compile(r"^\s*$")
+    _rxWhiteSpace = re.compile(r"^\s*")
+
+    _rxSection = re.compile(r"^\[(?P<header>.+)\]$")
+    _rxEquality = re.compile(r"^(\((?P<type>[^\({}\)=:\n]+)\))?\s*(?P<name>[^\({}\)=:\n]+)\s*[=:]\s*(?P<value>.*)$")
+
+    # A reference to another key's value - an absolute path within braces. Escaping the closing brace avoids it
+    _rxInterpolation = re.compile(r"{(?P<path>[^{}\n]*[^{}\\\n])}")
+
+    _rxType = re.compile(r"^(?P<type>[\w\.]+)(<(?P<sub_type>[^>]+)>)?$")
+
+    # Tokenizes a line of a buffer into its indentation, its content and its comment. The content alternates between
+    # runs of plain characters, escape sequences and quoted strings such that comment characters are only recognised
+    # outside of quotes - mirroring _removeComments
+    _rxToken = re.compile(
+        r"(?P<indent>[^\S\n]*)"
+        r"(?P<content>(?:"
+            r"[^\\\"'#;\n]+"
+            r"|\\+[^\\#;\n]?"
+            r"|\"(?:[^\\\"\n]+|\\+[^\\\n]?)*\"?"
+            r"|'(?:[^\\'\n]+|\\+[^\\\n]?)*'?"
+        r")*)"
+        r"(?P<comment>[#;][^\n]*)?"
+        r"(?:\n|\Z)"
+    )
+    _rxTokenBytes = re.compile(_rxToken.pattern.encode())  # The token pattern for scanning encoded buffers
+
+    _bufferTypes = (bytes, bytearray, memoryview, mmap.mmap)  # Sources that are scanned as encoded buffers
+
+    # Identify the candidate lines for top level section headers, any line beginning with an opening bracket
+    _rxTopLevel = re.compile(r"^\[", re.MULTILINE)
+    _rxTopLevelBytes = re.compile(_rxTopLevel.pattern.encode(), re.MULTILINE)
+    _rxNewlineBytes = re.compile(b"\n")
+
+    _engines = ("line", "fast")
+
+    _cacheDirectory = "__configcache__"  # The directory, alongside the source, where cached trees are stored by default
+    _cacheVersion = 3  # Incremented whenever the layout of the cached tree changes
+
+    _max_line_length = 120
+    _writeBufferSize = 64*1024  # The number of characters gathered into each block written by write
+
+    _rxContinuations = {}  # The continuation whitespace of a value to the pattern identifying its unindented lines
+
+    # Converters for the builtin types - each is passed the config and the list of the setting's (split) values
+    _converters = {
+        "str": lambda config, values: config._delimiter.join(values),
+        "list": lambda config, values: values,
+        "set": lambda config, values: set(values),
+        "frozenset": lambda config, values: frozenset(values),
+        "tuple": lambda config, values: tuple(values),
+        "range": lambda config, values: range(*[int(x) for x in values]),
+        "bytes": lambda config, values: bytes(*values),
+        "bytearray": lambda config, values: bytearray(*values),
+        "bool": lambda config, values: values[0] == "True",
+        "int": lambda config, values: int(values[0], int(values[1])) if len(values) == 2 else int(*values),
+        "float": lambda config, values: float(*values),
+        "complex": lambda config, values: float("".join(values)),
+    }
+
+    # Sequence sub types converted in a single pass, to their converter, array.array typecode and numpy dtype
+    _numericTypes = {"int": (int, "q", "int64"), "float": (float, "d", "float64")}
+    _arrayTypes = ("list",)  # The sequences stored as arrays when arrays are enabled - tuples stay immutable tuples
+
+    _registered = {}  # User registered converters - each is passed the setting's value string
+    _signatures = {}  # Memoized type signatures - signature to its type and sub type
+    _importedTypes = {}  # Dotted custom types resolved to their class
+
+    def __init__(
+        self,
+        source: object = {},
+        *,
+        indent_size: int = 4,
+        delimiter: str = ",",
+        join: str = os.linesep,
+        default: object = True,
+        safe: bool = True,
+        index: bool = False,
+        arrays: (bool, str) = False,
+        profile: bool = False
+    ):
+
+        self._elements = {}  # The dictionary containing the content
+        self._generation = 0  # Incremented on each modification of the config made through its interface
+        self._indent = indent_size
+        self._delimiter = delimiter
+        self._join = join
+        self._default = default
+        self._safe = safe
+        self._arrays = self._arrayBackend(arrays)
+
+        self._index = {} if index else None  # Colon delimited paths to their values
+        self._indexPaths = None  # The sorted paths of the index - generated when paths are enumerated
+
+        self._sources = {}  # The files read into the config, in the order read, to their fingerprints
+
+        self._origins = None  # Colon delimited paths to the file and line of their setting - recorded by read_many
+        self._reading = None  # The file being read
+
+        self._profile = None  # The profile recording the time spent parsing - the parse stages are wrapped to record it
+        if profile: self._instrument(ParseProfile())
+
+        if isinstance(source, dict):
+            self.update(source)
+        else:
+            self.parse(source)
+
+    def __repr__(self): return "<ConfigParser {}>".format(self._elements)
+    def __len__(self): return len(self._elements)
+    def __getitem__(self, key: object):
+        value = self._elements[key]
+        if value.__class__ is _LazySection: return self._materialize(key)
+        return value
+    def __contains__(self, key: object): return key in self._elements
+    def __setitem__(self, key: object, value: object):
+        if self._index is not None: self._indexAssign(self._path([], key), self._elements.get(key), value)
+        self._elements[key] = value
+        self._generation += 1
+    def __delitem__(self, key: object):
+        value = self._elements.pop(key)
+        if self._index is not None: self._indexAssign(self._path([], key), value, PathAccessor._missing)
+        self._generation += 1
+    def __iter__(self): return iter(self._elements)
+
+    def get(self, path: str, default: object = None) -> object:
+        """ Collect the value from within the config parser and return or if not
+        found return the default value
+
+        Params:
+            path (str): A semi-colon delimited path of key names
+            default (object) = None: The value to be returned if nothing is
+                found
+
+        returns:
+            object: Either the value at the location of path, or the default
+        """
+
+        if self._index is not None:
+            parent, _, key = path.rpartition(":")
+            if not parent:
+                # Top level keys are only changed through the config, which keeps them indexed
+                value = self._index.get(path, PathAccessor._missing)
+                if value is not PathAccessor._missing: return value
+
+            elif self._elements.get(path.partition(":")[0]).__class__ is not _LazySection:
+                # Settings are read from their section in the live tree, such that edits made directly to the section
+                # are seen - keys the section does not hold fall through to traversal
+                node = self._index.get(parent)
+                if node.__class__ is dict:
+                    value = node.get(key, PathAccessor._missing)
+                    if value is not PathAccessor._missing: return value
+
+        if ":" in path:
+            # Split the path into its absolute path key names
+            absolute_path = path.split(":")
+
+            # Select the top level node as value to travel down
+            value = self._elements
+
+            # For each key attempt to traverse the node
+            for key in absolute_path:
+                if not isinstance(value, dict) or key not in value:
+                    # The value doesn't exist return the default provided
+                    return default
+
+                value = value[key]
+                if value.__class__ is _LazySection: value = self._materialize(key)
+
+            # Return the value found after traversing the nodes
+            return value
+        else:
+            # Traditional behaviour
+            return super().get(path, default)
+
+    def accessor(self, path: str, *, cache: bool = False) -> PathAccessor:
+        """ Precompile a path into the config for repeated lookups. Calling the accessor is equivalent to calling get
+        with the path
+
+        Params:
+            path (str): A colon delimited path of key names
+            *,
+            cache (bool): Cache the resolved value until the config is next modified through its interface
+
+        Returns:
+            PathAccessor: A callable taking an optional default, returning the value at the path
+        """
+        return PathAccessor(self, path, cache = cache)
+
+    def origin(self, path: str) -> (str, int):
+        """ Identify the file and line that declared a setting. Origins are recorded once the config has been read
+        into with read_many - for the settings of files read (or reloaded) from then on. Settings parsed from strings
+        have no file. Values assigned in memory, and the settings of cached or lazily parsed reads, are not recorded
+
+        Params:
+            path (str): A colon delimited path of key names
+
+        Returns:
+            (str, int): The absolute path of the file (None if the setting was not read from a file) and the line number
+                of the setting, or None if the origin of the setting is unknown
+        """
+        if self._origins is None: return None
+        return self._origins.get(path)
+
+    def read(
+        self,
+        filepath: str,
+        *,
+        safe: bool = None,
+        engine: str = "line",
+        cache: (bool, str) = False,
+        mmap: bool = False,
+        lazy: bool = False
+        ):
+        """ Read the contents of a file using the filepath provided, parse the
+        contents and update the config with its values.
+
+        When cache is set, the parsed tree of the file is pickled to disk and reused by subsequent reads for as long as
+        the file's size and modification time (or failing that, its content hash) are unchanged. A cached file is
+        parsed in isolation, any interpolation that references keys outside of the file disables the cache for it. A
+        cached tree is fully parsed, lazy has no effect on reads served from the cache. Caches are only loaded if they
+        are owned by the current user and cannot be written by other users.
+
+        Parameters:
+            filepath (str): The filepath to the configuration file.
+            *,
+            safe (bool): Manner of content parsing. defaults to ConfigParsers safe property.
+            engine (str): The parse engine to tokenize the file with - see parse
+            cache (bool / str): Toggle the parse cache. True stores the cache in a __configcache__ directory next to
+                the file, a string provides the directory to store it within.
+            mmap (bool): Memory map the file and scan its bytes in place rather than reading it into a string. Only
+                the content of meaningful lines is decoded. Implies the fast engine
+            lazy (bool): Only index the top level sections of the file, parsing a section when it is first accessed.
+                Lazily read files are held in memory (or remain mapped) until all their sections have been parsed
+
+        Returns:
+            ConfigParser: self
+
+        Raises:
+            IOError: Any error that can be raises by the 'open' builtin can be
+                raised by this function
+        """
+
+        if cache:
+            tree, source = self._readCache(filepath, cache, safe = safe, engine = engine, mapped = mmap)
+            if tree is not None:
+                for key in tree:
+                    if key in self._elements: self[key]  # Lazy sections are to be merged with, not replaced
+                self._merge(self._elements, tree)
+                if self._index is not None:
+                    for key in tree: self._indexAssign(self._path([], key), None, self._elements[key])
+                self._generation += 1
+                self._record(filepath, source)
+                return self
+
+        self._reading = os.path.abspath(filepath)
+        before = dict(self._elements)
+        try:
+            if mmap:
+                status = self._readMapped(filepath, safe = safe, lazy = lazy)
+
+            else:
+                with open(filepath, "rb") as handler:
+                    status = os.fstat(handler.fileno())
+                    content = handler.read()
+
+                # Decode the content as open would, such that the file's regions are fingerprinted from what was parsed
+                self.parse(io.TextIOWrapper(io.BytesIO(content)), safe = safe, engine = engine, lazy = lazy)
+                if not lazy:
+                    self._record(filepath, self._fingerprint(content, status, self._safe if safe is None else safe))
+                    return self
+
+            # Lazy and memory mapped reads are fingerprinted when first reloaded or watched, such that reading holds no
+            # copy of the file - the top level keys the read set are recorded in the meantime
+            keys = frozenset(key for key, value in self._elements.items() if before.get(key, _Source) is not value)
+            self._record(
+                filepath,
+                _Source(self._safe if safe is None else safe, status.st_size, status.st_mtime_ns, None, None, keys)
+            )
+
+        finally:
+            self._reading = None
+
+        return self
+
+    def _readMapped(self, filepath: str, *, safe: bool, lazy: bool) -> os.stat_result:
+        """ Memory map a file and parse it directly from the mapping
+
+        Params:
+            filepath (str): The filepath to the configuration file
+            *,
+            safe (bool): Manner of content parsing
+            lazy (bool): Index the file's sections only - the mapping is kept open for the lazy sections
+
+        Returns:
+            os.stat_result: The status of the file that was mapped
+        """
+        safe = self._safe if safe is None else safe
+
+        with open(filepath, "rb") as handler:
+            status = os.fstat(handler.fileno())
+            if not status.st_size: return status  # Empty files cannot be mapped - nothing to parse
+
+            mapping = mmap.mmap(handler.fileno(), 0, access = mmap.ACCESS_READ)
+
+        if lazy:
+            self.parse(mapping, safe = safe, lazy = True)  # Released once the lazy sections no longer reference it
+        else:
+            with mapping: self.parse(mapping, safe = safe, engine = "fast")
+
+        return status
+
+    def read_many(self, filepaths: [str], *, workers: int = None, safe: bool = None):
+        """ Read many files into the config. The files are read and tokenized in parallel by a pool of threads, and
+        are then added into the config in the order they were provided - a later file taking precedence over an
+        earlier one exactly as if each had been read in turn. The files are added to a copy of the config which
+        replaces the config once every file has been added, such that should any file fail to be read the config is
+        left unchanged.
+
+        The file and line that declared each setting is recorded, see origin.
+
+        Params:
+            filepaths ([str]): The filepaths of the configuration files, in increasing order of precedence
+            *,
+            workers (int) = None: The number of threads to read the files with, defaults to that of
+                concurrent.futures.ThreadPoolExecutor
+            safe (bool): Manner of content parsing. defaults to ConfigParsers safe property.
+
+        Returns:
+            ConfigParser: self
+
+        Raises:
+            IOError: Any error that can be raises by the 'open' builtin can be raised by this function
+        """
+
+        filepaths = [os.path.abspath(filepath) for filepath in filepaths]
+        safe = self._safe if safe is None else safe
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers = workers) as executor:
+            tokenized = list(executor.map(lambda filepath: self._tokenize(filepath, safe), filepaths))
+
+        # Add the files into a copy of the config - the index is regenerated once all files have been added
+        shadow = self._spawn()
+        shadow._elements = self._copyTree(self._elements)
+        shadow._index = None
+        shadow._origins = {} if self._origins is None else dict(self._origins)
+        shadow._safe = safe
+
+        for filepath, (events, _) in zip(filepaths, tokenized):
+            shadow._reading = filepath
+            shadow._buildEvents(events)
+
+        if self._index is not None: self._index, self._indexPaths = self._indexTree(shadow._elements), None
+
+        # Swap in the new root with a single assignment
+        self._origins = shadow._origins
+        self._elements = shadow._elements
+        self._generation += 1
+
+        for filepath, (_, source) in zip(filepaths, tokenized): self._record(filepath, source)
+
+        return self
+
+    def _tokenize(self, filepath: str, safe: bool) -> ([(str, object)], _Source):
+        """ Read a file and interpret its content as the events of the config grammar, without adding anything to the
+        config
+
+        Params:
+            filepath (str): The path to the configuration file
+            safe (bool): Manner of content parsing the file is to be read with
+
+        Returns:
+            ([(str, Section / Setting)], _Source): The events of the file and the record of the file
+        """
+        with open(filepath, "rb") as handler:
+            status = os.fstat(handler.fileno())
+            content = handler.read()
+
+        # Decode the content as open would - files are tokenized in threads of their own, away from self._reading
+        if self._profile is not None: self._profile._local.source = filepath
+        try:
+            events = list(self._events(self._scanLines(io.TextIOWrapper(io.BytesIO(content)).read())))
+            return events, self._fingerprint(content, status, safe)
+        finally:
+            if self._profile is not None: self._profile._local.source = None
+
+    @classmethod
+    def _copyTree(cls, node: dict) -> dict:
+        """ Copy the sections of a tree - the settings' values are shared between the trees
+
+        Params:
+            node (dict): The root of the tree
+
+        Returns:
+            dict: The copied tree
+        """
+        tree = {}
+        for key, value in node.items():
+            if isinstance(value, dict):
+                value = cls._copyTree(value)
+
+            elif value.__class__ is _LazySection:
+                lazy = _LazySection(cls._copyTree(value.base) if isinstance(value.base, dict) else value.base, value.safe)
+                lazy.spans = list(value.spans)
+                value = lazy
+
+            tree[key] = value
+
+        return tree
+
+    def _options(self) -> dict:
+        """ Collect the keyword arguments that would construct a config parser that parses identically to this one """
+        return {
+            "indent_size": self._indent,
+            "delimiter": self._delimiter,
+            "join": self._join,
+            "default": self._default,
+            "safe": self._safe,
+            "index": self._index is not None,
+            "arrays": self._arrays or False,
+        }
+
+    def _spawn(self):
+        """ Create an empty config parser that shares the options, and the profile, of this config parser """
+        spawned = type(self)(**self._options())
+        if self._profile is not None: spawned._instrument(self._profile)
+        return spawned
+
+    @property
+    def profile(self) -> ParseProfile:
+        """ ParseProfile: The time spent in each stage of parsing, the slowest lines and the custom types imported, as
+        recorded across everything parsed by the config - None unless the config was constructed with profile=True
+        """
+        return self._profile
+
+    def _instrument(self, profile: ParseProfile) -> None:
+        """ Record the time spent parsing into a profile, by wrapping the methods of the parse stages on the instance
+
+        Params:
+            profile (ParseProfile): The profile to record into
+        """
+        self._profile = profile
+
+        def line(number: int) -> (str, int): return getattr(profile._local, "source", None) or self._reading, number
+
+        for stage, method in (("tokenize", "_readLines"), ("tokenize", "_scanLines")):
+            setattr(self, method, profile._generator(stage, getattr(self, method), lambda item: line(item[0])))
+        self._events = profile._generator("grammar", self._events, lambda item: line(item[1].line))
+
+        self._removeComments = profile._function("comments", self._removeComments)
+        self._buildEvents = profile._function("build", self._buildEvents)
+        self._addSetting = profile._function("settings", self._addSetting, lambda setting: line(setting.line))
+        self._convertSetting = profile._function("conversion", self._convertSetting, lambda setting: line(setting.line))
+        self._resolveReferences = profile._function("interpolation", self._resolveReferences)
+        self._importType = profile._importer(self._importType, self._importedTypes)
+
+    def _cachePath(self, filepath: str, cache: (bool, str)) -> str:
+        """ Determine the location of the cache file for the provided source file
+
+        Params:
+            filepath (str): The path to the source configuration file
+            cache (bool / str): True for the default cache directory, or the path to the cache directory
+
+        Returns:
+            str: The path of the cache file
+        """
+        directory, filename = os.path.split(os.path.abspath(filepath))
+
+        if cache is True:
+            return os.path.join(directory, self._cacheDirectory, filename + ".pickle")
+
+        # Cache directories may be shared between sources of the same name - distinguish them by their location
+        digest = hashlib.sha1(directory.encode()).hexdigest()[:16]
+        return os.path.join(cache, "{}.{}.pickle".format(filename, digest))
+
+    def _readCache(self, filepath: str, cache: (bool, str), *, safe: bool, engine: str, mapped: bool) -> dict:
+        """ Collect the parsed tree of a file from its cache, rebuilding the cache when it is missing or stale
+
+        Params:
+            filepath (str): The path to the source configuration file
+            cache (bool / str): The cache setting provided to read
+            *,
+            safe (bool): Manner of content parsing
+            engine (str): The parse engine to tokenize the file with
+            mapped (bool): Scan the file content as bytes rather than decoding it entirely
+
+        Returns:
+            (dict, _Source): The parsed tree of the file and the fingerprints of the file, or None in place of the tree
+                if the file could not be parsed in isolation
+        """
+
+        cachepath = self._cachePath(filepath, cache)
+        options = self._options()
+        options.pop("index")  # The index does not change the parsed tree
+        if safe is not None: options["safe"] = safe
+
+        # Registered converters change the parsed tree - they are identified by their qualified names
+        converters = sorted(
+            (name, "{}.{}".format(getattr(converter, "__module__", None), getattr(converter, "__qualname__", None)))
+            for name, converter in self._registered.items()
+        )
+
+        status = os.stat(filepath)
+
+        try:
+            with open(cachepath, "rb") as handler:
+                # Unpickling runs code - only caches that no other user could have written are loaded
+                if not self._trustedCache(os.fstat(handler.fileno())): raise PermissionError(cachepath)
+
+                header = pickle.load(handler)
+
+                if (header["version"] == self._cacheVersion and header["options"] == options and
+                    header["converters"] == converters and header["size"] == status.st_size):
+
+                    if header["mtime"] != status.st_mtime_ns:
+                        with open(filepath, "rb") as source:
+                            content = source.read()
+
+                        if header["hash"] != hashlib.sha256(content).hexdigest(): raise ValueError("Stale cache")
+
+                        # The file has been touched but not changed - refresh the cache's modification time
+                        tree = pickle.load(handler)
+                        header = dict(header, mtime = status.st_mtime_ns)
+                        self._writeCache(cachepath, header, tree)
+                    else:
+                        tree = pickle.load(handler)
+
+                    # Files that cannot be parsed in isolation are cached without a tree, so they are not parsed again
+                    if tree is None: return None, None
+                    return tree, self._cachedSource(header, options)
+
+        except Exception:
+            pass  # The cache is missing, untrusted, unreadable, stale or corrupted - it shall be rebuilt
+
+        # Parse the file in isolation - read the content once such that the hash describes exactly what was parsed
+        with open(filepath, "rb") as source:
+            content = source.read()
+
+        header = {
+            "version": self._cacheVersion,
+            "options": options,
+            "converters": converters,
+            "size": status.st_size,
+            "mtime": status.st_mtime_ns,
+        }
+
+        config = type(self)(**options)
+        try:
+            if mapped: config.parse(content, engine = "fast")
+            else: config.parse(io.TextIOWrapper(io.BytesIO(content)), engine = engine)
+        except (KeyError, ConsistencyError):
+            # Interpolation references a value outside of the file - record it such that later reads skip the parse
+            header.update(hash = hashlib.sha256(content).hexdigest(), regions = None)
+            self._writeCache(cachepath, header, None)
+            return None, None
+
+        source = self._fingerprint(content, status, options["safe"])
+
+        header.update(hash = source.digest, regions = source.regions)
+        self._writeCache(cachepath, header, config._elements)
+
+        return config._elements, source
+
+    @staticmethod
+    def _trustedCache(status: os.stat_result) -> bool:
+        """ Determine whether a cache file can be loaded - it must be owned by the current user and must not be
+        writable by the group or other users. Platforms without file ownership trust all caches
+
+        Params:
+            status (os.stat_result): The status of the cache file
+
+        Returns:
+            bool: True if the cache can be loaded
+        """
+        if not hasattr(os, "getuid"): return True
+        return status.st_uid == os.getuid() and not status.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+    @staticmethod
+    def _cachedSource(header: dict, options: dict) -> _Source:
+        """ Recreate the fingerprints of a file from the header of its cache """
+        return _Source(options["safe"], header["size"], header["mtime"], header["hash"], header["regions"])
+
+    @staticmethod
+    def _writeCache(cachepath: str, header: dict, tree: dict) -> None:
+        """ Atomically write a parsed tree to its cache location. Failure to write the cache is not an error, the
+        cache is simply not stored
+
+        Params:
+            cachepath (str): The location of the cache file
+            header (dict): The information that validates the cache against its source
+            tree (dict): The parsed tree
+        """
+        directory = os.path.dirname(cachepath)
+
+        try:
+            os.makedirs(directory, exist_ok = True)
+
+            # Write to a temporary file and move it into place - concurrent readers never see a partial cache
+            handle, temppath = tempfile.mkstemp(dir = directory, suffix = ".tmp")
+            try:
+                with os.fdopen(handle, "wb") as handler:
+                    pickle.dump(header, handler, protocol = pickle.HIGHEST_PROTOCOL)
+                    pickle.dump(tree, handler, protocol = pickle.HIGHEST_PROTOCOL)
+                os.replace(temppath, cachepath)
+            except BaseException:
+                os.remove(temppath)
+                raise
+
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            pass
+
+    @classmethod
+    def _merge(cls, node: dict, tree: dict) -> None:
+        """ Merge a parsed tree into a node in the manner parse does - sections are merged together and settings
+        overwrite any previous value
+
+        Params:
+            node (dict): The node to be updated
+            tree (dict): The tree whose values are to be merged into the node
+        """
+        for key, value in tree.items():
+            if isinstance(value, dict) and isinstance(node.get(key), dict):
+                cls._merge(node[key], value)
+            else:
+                node[key] = value
+
+    def reload(self, filepath: str = None) -> ChangeSet:
+        """ Re-read the files that have been read into the config, re-parsing only the top level sections whose
+        content has changed. Files are compared with their previous content by the fingerprints of their regions (the
+        settings preceding the first top level section, and each top level section). The keys declared by a changed
+        region are rebuilt from every file that declares them, along with any key whose interpolation references them.
+        All other keys are left untouched.
+
+        Files read lazily or memory mapped are fingerprinted by their first reload (or watch). If such a file changed
+        before then, every key it set when read, or now declares, is rebuilt.
+
+        Rebuilt keys hold only what the files declare - changes made to them in memory are discarded. The rebuilt keys
+        are parsed into a copy of the config's root which replaces the root once complete, such that readers on other
+        threads never observe a partially rebuilt config. Should the reload fail, the config is left as it was.
+
+        Params:
+            filepath (str) = None: The file to reload, defaults to all the files read into the config
+
+        Returns:
+            ChangeSet: The paths that have been added, removed or modified by the reload
+
+        Raises:
+            ValueError: The filepath has not been read into the config
+            IOError: Any error that can be raised by the 'open' builtin
+        """
+
+        if filepath is None:
+            paths = list(self._sources)
+        else:
+            paths = [os.path.abspath(filepath)]
+            if paths[0] not in self._sources:
+                raise ValueError("Cannot reload '{}' - it has not been read into the config".format(filepath))
+
+        for path in self._sources: self._settle(path)  # Lazily and memory mapped read files are fingerprinted
+
+        sources = dict(self._sources)  # The fingerprints of the files as they are now
+        contents = {}  # The content of the files that have been re-read
+        dirty = set()  # The top level keys that are to be rebuilt
+
+        for path in paths:
+            source = sources[path]
+            with open(path, "rb") as handler:
+                status = os.fstat(handler.fileno())
+                if status.st_size == source.size and status.st_mtime_ns == source.mtime: continue
+
+                contents[path] = handler.read()
+
+            sources[path] = self._fingerprint(contents[path], status, source.safe)
+            if source.regions is None:
+                # The file changed before it was fingerprinted - every key it set or now declares is rebuilt
+                dirty |= source.keys | {key for region in sources[path].regions for key in region.keys}
+            elif sources[path].digest != source.digest:
+                dirty |= self._changedKeys(source.regions, sources[path].regions)
+
+        if not dirty:
+            self._sources = sources
+            return ChangeSet()
+
+        # Rebuilding a region rebuilds every key it declares, and the keys that reference a rebuilt key must be rebuilt
+        expanded = None
+        while expanded != dirty:
+            expanded = set(dirty)
+            for source in sources.values():
+                for region in source.regions or ():
+                    if region.keys & dirty or region.references & dirty: dirty |= region.keys
+
+        # Parse the lazy sections being rebuilt before the config is swapped
+        for key in dirty:
+            if key in self._elements: self[key]
+
+        previous, current = {}, {}
+        for key in dirty:
+            path = self._path([], key)
+            if path is not None and key in self._elements: self._flatten(path, self._elements[key], previous)
+
+        # Rebuild the keys within a copy of the config's root - the config is unchanged until the copy is swapped in
+        shadow = self._spawn()
+        shadow._elements = dict(self._elements)
+        if self._index is not None: shadow._index = dict(self._index)
+        if self._origins is not None:
+            shadow._origins = {path: origin for path, origin in self._origins.items() if path not in previous}
+
+        try:
+            for key in dirty:
+                if key in shadow._elements: del shadow[key]
+
+            for path, source in sources.items():
+                regions = [region for region in source.regions or () if region.keys & dirty]
+                if not regions: continue
+
+                if path not in contents:
+                    with open(path, "rb") as handler: contents[path] = handler.read()
+
+                # The regions of a file are parsed together - interpolation may reference keys declared after it
+                shadow._safe = source.safe
+                shadow._reading = path
+                shadow._build(itertools.chain.from_iterable(
+                    shadow._scanLines(contents[path], region.start, region.end, region.line_offset)
+                    for region in regions
+                ))
+
+        except BaseException:
+            # Retain any lazy sections that were parsed for interpolation
+            for key, value in list(self._elements.items()):
+                if value.__class__ is _LazySection and shadow._elements.get(key) is value.base: self[key] = value.base
+            raise
+
+        # Swap in the rebuilt root with a single assignment - readers observe either the previous or the reloaded tree
+        self._index, self._indexPaths = shadow._index, None
+        self._origins = shadow._origins
+        self._elements = shadow._elements
+        self._generation += 1
+
+        self._sources = sources
+
+        for key in dirty:
+            path = self._path([], key)
+            if path is not None and key in self._elements: self._flatten(path, self._elements[key], current)
+
+        return ChangeSet(
+            current.keys() - previous.keys(),
+            previous.keys() - current.keys(),
+            [
+                path for path in current.keys() & previous.keys()
+                if not (isinstance(current[path], dict) and isinstance(previous[path], dict))
+                and self._changed(previous[path], current[path])
+            ]
+        )
+
+    @staticmethod
+    def _changed(previous: object, current: object) -> bool:
+        """ Determine whether a setting's value has changed - arrays are compared by their items, as comparing numpy
+        arrays produces an array rather than a bool """
+        if current.__class__ is not previous.__class__: return True
+        if isinstance(current, array.array) or (hasattr(current, "tolist") and hasattr(current, "dtype")):
+            return current.tolist() != previous.tolist()
+        return current != previous
+
+    def watch(
+        self,
+        filepath: str,
+        callback: callable = None,
+        *,
+        debounce: float = 0.1,
+        interval: float = 1.0,
+        poll: bool = False
+        ) -> ConfigWatcher:
+        """ Watch a file and reload it into the config whenever it changes, on a background thread. The file is read
+        into the config first if it has not been already. Each reload swaps in the reloaded tree with a single
+        assignment (see reload), so the config can be read from other threads while it is being watched
+
+        Params:
+            filepath (str): The path of the file to watch
+            callback (callable) = None: Called from the watcher's thread with the ChangeSet of each reload that changes
+                the config
+            *,
+            debounce (float): The number of seconds the file must be left unchanged before it is reloaded, such that
+                a burst of writes causes a single reload
+            interval (float): The number of seconds between polls of the file's status when inotify is unavailable
+            poll (bool): Poll the file's status even where inotify is available (e.g. for network file systems)
+
+        Returns:
+            ConfigWatcher: The started watcher thread - close it to stop watching the file
+
+        Raises:
+            IOError: Any error that can be raised by the 'open' builtin when the file is first read
+        """
+
+        # Begin observing the file before reading it - a change made while it is read is not missed
+        watcher = ConfigWatcher(self, filepath, callback, debounce = debounce, interval = interval, poll = poll)
+
+        try:
+            if os.path.abspath(filepath) not in self._sources: self.read(filepath)
+            self._settle(os.path.abspath(filepath))  # Changes are identified against the file as it is now
+        except BaseException:
+            watcher.close()
+            raise
+
+        watcher.start()
+        return watcher
+
+    def _settle(self, path: str) -> None:
+        """ Fingerprint a file that was read without being fingerprinted (a lazy or memory mapped read), provided it
+        has not changed since it was read
+
+        Params:
+            path (str): The absolute path of the file
+        """
+        source = self._sources[path]
+        if source.regions is not None: return
+
+        with open(path, "rb") as handler:
+            status = os.fstat(handler.fileno())
+            if status.st_size != source.size or status.st_mtime_ns != source.mtime: return
+            content = handler.read()
+
+        self._sources[path] = self._fingerprint(content, status, source.safe)
+
+    def _fingerprint(self, buffer: (bytes, mmap.mmap), status: os.stat_result, safe: bool) -> _Source:
+        """ Fingerprint the content of a file by its regions - the settings preceding the first top level section, and
+        each top level section
+
+        Params:
+            buffer (bytes / mmap): The content of the file
+            status (os.stat_result): The status of the file the content was read from
+            safe (bool): Manner of content parsing the file was read with
+
+        Returns:
+            _Source: The record of the file
+        """
+
+        headers = self._topLevelHeaders(buffer)
+        encoding = locale.getpreferredencoding(False)
+
+        bounds = [(0, headers[0][0] if headers else len(buffer), None)]
+        bounds += [
+            (start, headers[i + 1][0] if i + 1 < len(headers) else len(buffer), header)
+            for i, (start, header) in enumerate(headers)
+        ]
+
+        regions, line_offset = [], 0
+        for start, end, header in bounds:
+            if start == end: continue
+
+            if header is None:
+                # The settings preceding the first section may declare any number of keys
+                keys = frozenset(
+                    next((key for key in item.scope if key is not None), item.name)
+                    for event, item in self._events(self._scanLines(buffer, start, end))
+                    if event == "open" or event == "setting"
+                )
+            else:
+                keys = frozenset((header,))
+
+            # Only regions that may hold interpolation are decoded, the rest are hashed in place
+            references = frozenset()
+            if buffer.find(b"{", start, end) >= 0:
+                references = frozenset(
+                    match.group("path").split(":")[0]
+                    for match in self._rxInterpolation.finditer(buffer[start: end].decode(encoding))
+                )
+
+            with memoryview(buffer) as view:
+                digest = hashlib.sha1(view[start: end]).digest()
+
+            regions.append(_Region(start, end, line_offset, keys, references, digest))
+            line_offset += self._countLines(buffer, start, end)
+
+        return _Source(safe, status.st_size, status.st_mtime_ns, hashlib.sha256(buffer).hexdigest(), regions)
+
+    @staticmethod
+    def _changedKeys(previous: [_Region], current: [_Region]) -> set:
+        """ Compare the regions of a file before and after it changed
+
+        Params:
+            previous ([_Region]): The regions of the file as it was
+            current ([_Region]): The regions of the file as it is
+
+        Returns:
+            set: The top level keys whose declarations differ
+        """
+
+        def declarations(regions: [_Region]) -> dict:
+            keys = collections.defaultdict(list)
+            for region in regions:
+                for key in region.keys: keys[key].append(region.digest)
+            return keys
+
+        previous, current = declarations(previous), declarations(current)
+        return {key for key in previous.keys() | current.keys() if previous.get(key) != current.get(key)}
+
+    def _record(self, filepath: str, source: _Source) -> None:
+        """ Record a file that has been read into the config such that it can be reloaded - a file read again moves to
+        the end of the read order
+        """
+        path = os.path.abspath(filepath)
+        self._sources.pop(path, None)
+        self._sources[path] = source
+
+    def parse(self, configuration_string: str, *, safe: bool = None, engine: str = "line", lazy: bool = False):
+        """ Parse the provided  object converting its contents into key values and updating this config with the values.
+        This function accepts strings or io objects that express a readline function.
+
+        Parameters:
+            configuration_string (str / io.IO.base): The string to be parsed
+            *,
+            safe (bool): Manner of content parsing. defaults to ConfigParsers safe property.
+            engine (str): The tokenizer used to read the source. "line" reads the source a line at a time, "fast" scans
+                the whole buffer in a single pass of a compiled pattern. Both produce identical results. Bytes like
+                sources (bytes, memoryview, mmap) are always scanned by the fast engine.
+            lazy (bool): Only index the top level sections of the source. A section's settings are parsed the first
+                time the section is accessed. Implies the fast engine.
+
+        Raises:
+            ValueError: In the event that the source cannot be read or the engine is not recognised
+        """
+        if engine not in self._engines:
+            raise ValueError("Unknown parse engine '{}' - expected one of {}".format(engine, self._engines))
+
+        if safe is not None:
+            temp = self._safe
+            self._safe = safe
+
+        try:
+            if lazy:
+                self._indexSections(self._readBuffer(configuration_string))
+            else:
+                self._build(self._lines(configuration_string, engine))
+
+        finally:
+            self._generation += 1
+
+            if safe is not None:
+                self._safe = temp
+
+        return self
+
+    def iterparse(self, source: object, *, engine: str = "line", convert: bool = False):
+        """ Scan a source and yield the structure it declares as a stream of events, without adding anything to the
+        config. The source is read with the same grammar as parse.
+
+        Events are yielded as (event, item) pairs:
+            ("open", Section): A section header has been read
+            ("setting", Setting): A setting has been read in its entirety (including any extension lines)
+            ("close", Section): A section has gone out of scope - all of its settings have been yielded
+
+        As there is no tree to reference, setting values are not interpolated.
+
+        Parameters:
+            source (str / io.IO.base): The source to be scanned - as accepted by parse
+            *,
+            engine (str): The tokenizer used to read the source - see parse
+            convert (bool): Convert setting values to their declared types, otherwise values are yielded as read
+
+        Yields:
+            (str, Section / Setting): The event and the section or setting it concerns
+
+        Raises:
+            ValueError: In the event that the source cannot be read or the engine is not recognised
+        """
+        if engine not in self._engines:
+            raise ValueError("Unknown parse engine '{}' - expected one of {}".format(engine, self._engines))
+
+        for event, item in self._events(self._lines(source, engine)):
+            if convert and event == "setting" and item.value is not self._default: self._convertSetting(item)
+            yield event, item
+
+    def _lines(self, source: object, engine: str):
+        """ Select the parse engine for a source and return the generator of its meaningful lines
+
+        Params:
+            source (object): The source to be read
+            engine (str): The name of the parse engine
+
+        Returns:
+            generator: Yielding the line number, the scope and the stripped content of each meaningful line
+
+        Raises:
+            ValueError: In the event that the source cannot be read
+        """
+
+        if engine == "fast" or isinstance(source, self._bufferTypes):
+            return self._scanLines(self._readBuffer(source))
+
+        # Convert any string passed into an io stream
+        if isinstance(source, str):
+            ioStream = io.StringIO(source)
+
+        # Check that the source configuration is valid
+        elif hasattr(source, 'readline'):
+            ioStream = source
+
+        else:
+            raise ValueError("Source object doesn't implement a readline function - cannot parse")
+
+        return self._readLines(ioStream)
+
+    def _build(self, lines: iter) -> None:
+        """ Construct the settings and sections expressed by the lines of a source and add them into the config
+
+        Params:
+            lines (iter): The meaningful lines of a source, as yielded by a parse engine
+        """
+        self._buildEvents(self._events(lines))
+
+    def _buildEvents(self, events: iter) -> None:
+        """ Construct the settings and sections expressed by the events of a source and add them into the config
+
+        Params:
+            events (iter): The events of a source, as yielded by _events
+        """
+
+        # Settings whose values reference other keys - held back until the source has been read entirely
+        pending = {}
+
+        for event, item in events:
+            if event == "setting":
+                # Keys declared without a value hold the default value - only read values are interpolated
+                references = self._references(item.value) if item.value is not self._default else None
+
+                if references or pending:
+                    # A later definition replaces any pending definition of the same key
+                    path = tuple(key for key in item.scope if key is not None) + (item.name,)
+                    pending.pop(path, None)
+
+                    if references:
+                        pending[path] = (item, references)
+                        continue
+
+                self._addSetting(item)
+
+            elif event == "open":
+                if pending: pending.pop(tuple(key for key in item.scope if key is not None) + (item.name,), None)
+
+                # Traverse the current parsed scope and add the section in if present
+                # Note: Taking care to ensure that a previously openned section isn't overwritten
+                node = self._traverse(item.scope)
+                if item.name in node:
+                    node[item.name] = node[item.name]
+                else:
+                    section = node[item.name] = {}
+                    if self._index is not None: self._indexAssign(self._path(item.scope, item.name), None, section)
+
+        # All settings have been read - interpolate the settings that reference other keys
+        if pending: self._resolveReferences(pending)
+
+    def _events(self, lines: iter):
+        """ The grammar of the config - interpret the meaningful lines of a source as the opening and closing of
+        sections and the declaration of settings
+
+        Params:
+            lines (iter): The meaningful lines of a source, as yielded by a parse engine
+
+        Yields:
+            (str, Section / Setting): The event ("open", "setting", "close") and the section or setting it concerns
+        """
+
+        # Holds current indentation for section headers - e.g ["header", None, None, "sub header"]. Scope shall reduce
+        # the scope stack.
+        scope_stack = []
+        sections = []  # The open sections, in parallel to the scope stack
+
+        # Currently examined setting container - holds name and points to value
+        setting = None
+
+        # For each meaningful line - its line number, the scope of its indentation and its stripped content
+        for line_index, scope, line in lines:
+
+            # Reduce scope stack if less than section scope
+            if len(scope_stack) > scope + 1:
+                # The sections beyond this scope are closed - any setting within them has been read in its entirety
+                if setting is not None:
+                    yield "setting", setting
+                    setting = None
+
+                for section in reversed(sections[scope+1:]):
+                    if section is not None: yield "close", section
+
+                scope_stack = scope_stack[:scope+1]
+                sections = sections[:scope+1]
+
+            # Examine the syntax of the line and determine its intention
+            match = self._rxSection.search(line)
+            if match is not None:
+                # Section declaration - Open a new section in at this scope
+
+                # Push any currently open setting
+                if setting is not None:
+                    yield "setting", setting
+                    setting = None
+
+                # Close any section previously open at this scope
+                if scope < len(sections) and sections[scope] is not None: yield "close", sections[scope]
+
+                # Collect from the match object the section header
+                section = Section(scope_stack[:scope], line_index, match.group("header"))
+
+                # Add the header to the stack updated section header - padding scope with None
+                scope_stack += [None]*((scope + 1) - len(scope_stack))
+                scope_stack[scope] = section.name
+                sections += [None]*((scope + 1) - len(sections))
+                sections[scope] = section
+
+                yield "open", section
+                continue
+
+            match = self._rxEquality.search(line)
+            if match is not None:
+                # Setting Declaration - The line is a key value pair
+
+                # Add previous setting if set
+                if setting is not None: yield "setting", setting
+
+                # Generate a setting to hold the information of this line just read in
+                setting = Setting(
+                    scope_stack.copy(),
+                    line_index,
+                    match.group("name").strip(),
+                    match.group("value").strip(),
+                    match.group("type")
+                )
+
+            elif len(scope_stack) <= scope and setting is not None:
+                # Setting Extension - Scope is greater than section header + no key value - assumed value extension
+                setting.value += self._join + line
+
+            else:
+                # Key Declaration - The line is a key without a value
+                if setting is not None: yield "setting", setting
+
+                yield "setting", Setting(scope_stack.copy(), line_index, line, self._default)
+
+                # Reset setting - ready for a new value
+                setting = None
+
+        # All lines read - push final setting and close the remaining sections
+        if setting is not None: yield "setting", setting
+
+        for section in reversed(sections):
+            if section is not None: yield "close", section
+
+    def _readLines(self, ioStream: io.IOBase):
+        """ Line engine - pull the source through its readline function a line at a time, removing comments and
+        discarding empty lines
+
+        Params:
+            ioStream (io.IOBase): An object that implements readline
+
+        Yields:
+            (int, int, str): The line number, the scope of the line's indentation and the stripped line content
+        """
+
+        # Line counter / represents the line number of the file being read
+        line_index = 0
+
+        while True:
+            line = ioStream.readline()
+            if line == "": break  # The line has reached an end of file line (due to the lack of a new line character)
+
+            # Increment the line number
+            line_index += 1
+
+            line = self._removeComments(line)  # Remove comments from the line
+            if self._rxEmptyLine.search(line): continue  # Ignore empty lines
+
+            # Determine scope of the line
+            scope = len(self._rxWhiteSpace.match(line).group(0).replace("\t", " "*self._indent))
+
+            yield line_index, scope, line.strip()  # Strip out all surrounding whitespace
+
+    @classmethod
+    def _readBuffer(cls, source: object) -> (str, bytes):
+        """ Collect the entire contents of a source so that it can be scanned as a single buffer. Bytes like sources are
+        returned as they are such that they are scanned in place
+
+        Params:
+            source (object): A string, a bytes like object, or an object implementing either read or readline
+
+        Returns:
+            str / bytes: The contents of the source
+
+        Raises:
+            ValueError: In the event that the source cannot be read
+        """
+        if isinstance(source, (str, *cls._bufferTypes)): return source
+        elif hasattr(source, "read"): return source.read()
+        elif hasattr(source, "readline"): return "".join(iter(source.readline, ""))
+        else:
+            raise ValueError("Source object doesn't implement a read or readline function - cannot parse")
+
+    def _scanLines(self, buffer: (str, bytes), start: int = 0, end: int = None, line_offset: int = 0):
+        """ Fast engine - tokenize an entire buffer in a single pass with the compiled line token pattern. Comment and
+        quote handling is performed by the pattern and therefore matches the behaviour of _removeComments.
+
+        Encoded buffers are scanned in place, only the content of lines that hold a section, key or value is decoded.
+        The buffer's encoding is expected to be that of the locale (as with open) and must be ASCII compatible.
+
+        Params:
+            buffer (str / bytes): The entire contents of the configuration
+            start (int): The offset within the buffer to begin scanning from - must be the start of a line
+            end (int): The offset within the buffer to scan up to, defaults to the end of the buffer
+            line_offset (int): The number of lines that precede the start offset
+
+        Yields:
+            (int, int, str): The line number, the scope of the line's indentation and the stripped line content
+        """
+
+        tab = self._indent - 1  # Each tab contributes the indent size to the scope, it is already counted once
+
+        if isinstance(buffer, str):
+            pattern, tab_char, encoding = self._rxToken, "\t", None
+        else:
+            pattern, tab_char, encoding = self._rxTokenBytes, b"\t", locale.getpreferredencoding(False)
+
+        if end is None: end = len(buffer)
+
+        for line_index, match in enumerate(pattern.finditer(buffer, start, end), line_offset + 1):
+            line = match.group("content").strip()
+            if not line: continue  # Ignore empty lines
+
+            if encoding:
+                line = line.decode(encoding).strip()
+                if not line: continue
+
+            indent = match.group("indent")
+            yield line_index, len(indent) + indent.count(tab_char)*tab, line
+
+    def _indexSections(self, buffer: (str, bytes)) -> None:
+        """ Lazily parse a buffer - record the regions of the buffer that declare each top level section without parsing
+        them. Any settings that precede the first top level section are parsed immediately.
+
+        A top level section is declared by a header without indentation, its region runs until the next such header
+
+        Params:
+            buffer (str / bytes): The entire contents of the configuration
+        """
+
+        headers = self._topLevelHeaders(buffer)
+        preamble = headers[0][0] if headers else len(buffer)
+
+        # Sections referenced by the preceding settings are parsed with them, such that interpolation between them is
+        # resolved together - as it would be eagerly
+        content = buffer[0: preamble]
+        if not isinstance(content, str): content = content.decode(locale.getpreferredencoding(False))
+        referenced = {match.group("path").split(":")[0] for match in self._rxInterpolation.finditer(content)}
+        eager = [self._scanLines(buffer, 0, preamble)]
+
+        # Register the sections before the preceding settings are parsed, such that their interpolation can reach them
+        placeholders = []
+        line_offset = self._countLines(buffer, 0, preamble)
+        for i, (start, header) in enumerate(headers):
+            end = headers[i + 1][0] if i + 1 < len(headers) else len(buffer)
+
+            if header in referenced:
+                eager.append(self._scanLines(buffer, start, end, line_offset))
+                line_offset += self._countLines(buffer, start, end)
+                continue
+
+            lazy = self._elements.get(header)
+            if lazy.__class__ is not _LazySection:
+                lazy = self._elements[header] = _LazySection({} if lazy is None else lazy, self._safe)
+                placeholders.append((header, lazy))
+
+            lazy.spans.append((buffer, start, end, line_offset))
+            line_offset += self._countLines(buffer, start, end)
+
+        # Parse the settings preceding the first section
+        self._build(itertools.chain.from_iterable(eager))
+
+        for header, lazy in placeholders:
+            value = self._elements.get(header)
+            if value is not lazy:
+                # A preceding setting assigned the key - the section is applied over its value, as it would be eagerly
+                lazy.base = {} if value is None else value
+                self._elements[header] = lazy
+
+    def _topLevelHeaders(self, buffer: (str, bytes)) -> [(int, str)]:
+        """ Identify the top level section headers of a buffer, headers without indentation
+
+        Params:
+            buffer (str / bytes): The entire contents of the configuration
+
+        Returns:
+            [(int, str)]: The offset of each header's line and the name of the section it declares
+        """
+
+        if isinstance(buffer, str):
+            candidates, pattern, encoding = self._rxTopLevel, self._rxToken, None
+        else:
+            candidates, pattern, encoding = self._rxTopLevelBytes, self._rxTokenBytes, locale.getpreferredencoding(False)
+
+        headers = []
+        for candidate in candidates.finditer(buffer):
+            start = candidate.start()
+
+            line = pattern.match(buffer, start).group("content").strip()
+            if encoding: line = line.decode(encoding)
+
+            match = self._rxSection.search(line)
+            if match is not None: headers.append((start, match.group("header")))
+
+        return headers
+
+    @classmethod
+    def _countLines(cls, buffer: (str, bytes), start: int, end: int) -> int:
+        """ Count the number of new lines within a region of a buffer
+
+        Params:
+            buffer (str / bytes): The buffer
+            start (int): The start offset of the region
+            end (int): The end offset of the region
+
+        Returns:
+            int: The number of new line characters in the region
+        """
+        if isinstance(buffer, str): return buffer.count("\n", start, end)
+        elif isinstance(buffer, (bytes, bytearray)): return buffer.count(b"\n", start, end)
+        else: return len(cls._rxNewlineBytes.findall(buffer, start, end))
+
+    def _materialize(self, key: str) -> dict:
+        """ Parse the regions of a lazy section, replacing the placeholder within the config with the section
+
+        Params:
+            key (str): The name of the top level lazy section
+
+        Returns:
+            dict: The parsed section
+        """
+
+        lazy = self._elements[key]
+        if lazy.base.__class__ is FrozenSection: lazy.base = lazy.base._thaw()  # The section of a thawed snapshot
+
+        # Replace the placeholder first - the section's regions shall merge into its base, and any interpolation
+        # within the section that references the section finds it
+        self._elements[key] = lazy.base
+        if self._index is not None: self._indexAssign(self._path([], key), None, lazy.base)
+
+        temp = self._safe
+        self._safe = lazy.safe
+        try:
+            for buffer, start, end, line_offset in lazy.spans:
+                self._build(self._scanLines(buffer, start, end, line_offset))
+        finally:
+            self._safe = temp
+
+        return self._elements[key]
+
+    def write(self, filepath: (str, io.IOBase)) -> None:
+        """ Write the config to a file, or to a stream. The config is serialised into large blocks which are written to
+        the destination in turn
+
+        Params:
+            filepath (str / io.IOBase / socket.socket): The path of to where the file should be generated, or an object
+                to write to - a text stream, a binary stream (written in the locale's encoding) or a socket
+        """
+
+        if isinstance(filepath, (str, os.PathLike)):
+            with open(filepath, "w") as handler:
+                self._writeBlocks(self._serialise(self, 0), handler.write)
+
+        elif hasattr(filepath, "sendall"):
+            encoding = locale.getpreferredencoding(False)
+            self._writeBlocks(self._serialise(self, 0), lambda block: filepath.sendall(block.encode(encoding)))
+
+        elif isinstance(filepath, (io.RawIOBase, io.BufferedIOBase)) or "b" in getattr(filepath, "mode", ""):
+            encoding = locale.getpreferredencoding(False)
+            self._writeBlocks(self._serialise(self, 0), lambda block: filepath.write(block.encode(encoding)))
+
+        elif hasattr(filepath, "write"):
+            self._writeBlocks(self._serialise(self, 0), filepath.write)
+
+        else:
+            raise ValueError("Destination object doesn't implement a write function - cannot write")
+
+    def dumps(self) -> str:
+        """ Serialise the config into a string, in the format written by write
+
+        Returns:
+            str: The config as it would be written to file
+        """
+        return "".join(self._serialise(self, 0))
+
+    def _writeBlocks(self, chunks: iter, write: callable) -> None:
+        """ Gather the chunks of a serialised config into blocks of the write buffer size, and write each block
+
+        Params:
+            chunks (iter): The strings of the serialised config
+            write (callable): Writes a block to the destination
+        """
+
+        block, size = [], 0
+        for chunk in chunks:
+            block.append(chunk)
+            size += len(chunk)
+
+            if size >= self._writeBufferSize:
+                write("".join(block))
+                block, size = [], 0
+
+        if block: write("".join(block))
+
+    def _serialise(self, section: dict, depth: int):
+        """ Serialise the section provided, and recursively the subsections within it
+
+        Params:
+            section (dict): The section to be serialised
+            depth (int): The depth of the section - none zero value implies that the section is a nested section
+
+        Yields:
+            str: The chunks of the serialised section
+        """
+
+        # Define containers for the two types of contents of the dictionary - separate the section
+        settings, sections = [], []
+
+        for key, value in section.items():
+            if isinstance(value, dict):
+                sections.append((key, value))
+            else:
+                settings.append((key, value))
+
+        setting_depth = max(0, depth - 1)
+        indent = " "*(setting_depth*self._indent)
+        whitespace = " "*(1 + setting_depth*self._indent)  # Leads the continuation lines of a value
+        line_length = self._max_line_length - (setting_depth*self._indent + 1)
+
+        # Identify the new lines of a value that are not followed by the continuation whitespace
+        rxContinuation = self._rxContinuations.get(whitespace)
+        if rxContinuation is None:
+            rxContinuation = self._rxContinuations[whitespace] = re.compile(
+                "{}(?!{})".format(re.escape(os.linesep), re.escape(whitespace))
+            )
+        continuation = os.linesep + whitespace
+
+        # Process the settings of the section first - sort the keys before writing
+        for key, value in sorted(settings, key = lambda x: x[0]):
+
+            # Define the variables type
+            setting_type, value = self._convertFromType(value)
+            if setting_type: setting_type = "({}) ".format(setting_type)
+
+            # Define the key for the setting
+            title = "{}{}{} = ".format(indent, setting_type, key)
+            lentit = len(title)
+
+            # Define the value string
+            lenval = len(value)
+
+            if lentit + lenval < self._max_line_length or self._join not in value:
+                # The entire setting can fit on a single line - or it cannot be broken up
+                config_value = value
+            else:
+                # The setting is greater than the line limit - examine the value for break points
+                pieces = []
+                start, end = 0, self._max_line_length - lentit
+
+                while True:
+                    # Check whether we can break from the processing of the value
+                    if end > lenval:
+                        # The final window containing the rest of the value - write it and break
+                        pieces.append(value[start:])
+                        break
+
+                    # Identify whether there is a break point in the window
+                    splitPoint = value.rfind(self._join, start, end)
+
+                    if splitPoint == -1:
+                        # There was nowhere to split for this window, search for next split and add entire line
+                        nextSplit = value.find(self._join, end)
+
+                        if nextSplit == -1:
+                            # There is not going to be another split, write the remaining line and end
+                            pieces.append(value[start:])
+                            break
+                        else:
+                            end = nextSplit
+                    else:
+                        end = splitPoint
+
+                    # Extract the line given by the start and end char and add it to the config line
+                    pieces.append(value[start: end])
+                    pieces.append(continuation)
+
+                    # Update the start and end index - Add one to the previous end to jump over the break character
+                    start, end = end + 1, end + 1 + line_length
+
+                config_value = "".join(pieces)
+
+            # Ensure that white space is handled
+            if os.linesep in config_value: config_value = rxContinuation.sub(continuation, config_value)
+
+            # Write the setting line
+            yield title
+            yield config_value
+            yield os.linesep
+
+        for name, subsection in sorted(sections, key = lambda x: x[0]):
+            # Write the nested sections - start by writing its name
+            yield "{}[{}]{}".format(" "*(depth*self._indent), name, os.linesep)
+
+            # Write the contents of the section
+            yield from self._serialise(subsection, depth + 1)
+
+            # Separate the sections - Check that section contents doesn't already separate sections
+            if not any(isinstance(v, dict) for v in subsection.values()):
+                yield os.linesep
+
+    def _addSetting(self, setting: Setting):
+            """ Push the information about the currently staged variable into the config at the position expressed by
+            its mark on the scope stack
+            """
+            if setting is None: return  # Nothing to add
+
+            self._convertSetting(setting)
+
+            # Insert the setting into self at the correct position
+            node = self._traverse(setting.scope)
+            if self._index is not None:
+                self._indexAssign(self._path(setting.scope, setting.name), node.get(setting.name), setting.value)
+            node[setting.name] = setting.value
+
+            if self._origins is not None:
+                path = self._path(setting.scope, setting.name)
+                if path is not None: self._origins[path] = (self._reading, setting.line)
+
+    def _convertSetting(self, setting: Setting) -> None:
+            """ Convert the value of a setting into its declared type, or trim the quotes from an untyped value
+
+            Params:
+                setting (Setting): The setting whose value is to be converted
+
+            Raises:
+                ValueError: In the event that the value cannot be converted into its type
+            """
+
+            # None string type set for value - update the value before adding to self
+            if setting.type is not (None and "str"):
+                try:
+                    setting.value = self._convertToType(setting.type, setting.value)
+                except Exception as e:
+                    raise ValueError(
+                        "Invalid type definition: Line {} - {} = {}".format(setting.line, setting.name, setting.value)
+                    ) from e
+
+            elif isinstance(setting.value, str) and setting.value:
+                # Trim quotes from  string setting value if applicable
+                if setting.value[0] in ('"', "'") and setting.value[0] == setting.value[-1]:
+                    setting.value = setting.value[1:-1]
+
+    def _removeComments(self, line: str) -> str:
+        """ Remove comments ensuring that a the comment symbols aren't removed
+        if they are actually apart of the value
+
+        Lines without comment symbols are returned as they are, and lines without quotes are cut at their first comment
+        symbol. Otherwise the line is matched by the token pattern, which tracks quotes and escapes exactly as the fast
+        engine does
+
+        Params:
+            line (str): The line that is to have the comment striped out of it
+
+        Returns:
+            str: The line provided without line
+        """
+
+        hashed, semicolon = line.find("#"), line.find(";")
+        if hashed < 0 and semicolon < 0: return line
+
+        if "'" not in line and '"' not in line:
+            # Escapes only protect quotes - the first comment symbol opens the comment
+            return line[:semicolon if hashed < 0 or 0 <= semicolon < hashed else hashed]
+
+        match = self._rxToken.match(line)
+        if match.start("comment") < 0: return line
+        return line[:match.start("comment")]
+
+    def paths(self, prefix: str = None) -> [str]:
+        """ Enumerate the colon delimited paths of the sections and settings within the config, optionally only those
+        beneath a prefix path. With an index the paths are collected from the index without walking the config
+
+        Params:
+            prefix (str) = None: The path of the section whose contents are to be enumerated
+
+        Returns:
+            [str]: The sorted paths beneath the prefix
+        """
+
+        # Ensure that the sections of interest have been parsed
+        if prefix is None:
+            for key in self._elements: self[key]
+        elif prefix.split(":")[0] in self._elements:
+            self[prefix.split(":")[0]]
+
+        if self._index is None:
+            paths = []
+            node = self._elements if prefix is None else self.get(prefix)
+
+            def walk(node: dict, path: str):
+                for key, value in node.items():
+                    if not isinstance(key, str) or ":" in key: continue
+                    key = key if path is None else path + ":" + key
+                    paths.append(key)
+                    if isinstance(value, dict): walk(value, key)
+
+            if isinstance(node, dict): walk(node, prefix)
+            return sorted(paths)
+
+        if self._indexPaths is None: self._indexPaths = sorted(self._index)
+        if prefix is None: return self._indexPaths.copy()
+
+        prefix += ":"
+        start = bisect.bisect_left(self._indexPaths, prefix)
+        end = bisect.bisect_left(self._indexPaths, prefix[:-1] + chr(ord(":") + 1), start)
+        return self._indexPaths[start: end]
+
+    @staticmethod
+    def _path(scope: [str], name: str) -> str:
+        """ Generate the colon delimited path of a key within a scope
+
+        Params:
+            scope ([str]): The scope stack of the key (unused scope being None)
+            name (str): The key
+
+        Returns:
+            str: The path of the key, None if the key cannot be expressed as a path
+        """
+        keys = [key for key in scope if key is not None]
+        keys.append(name)
+
+        for key in keys:
+            if not isinstance(key, str) or ":" in key: return None
+
+        return ":".join(keys)
+
+    def _indexAssign(self, path: str, previous: object, value: object) -> None:
+        """ Update the flat index for a change of value at a path - the previous value's paths are removed and the new
+        value's paths are added
+
+        Params:
+            path (str): The path of the value, None for values that cannot be expressed as a path
+            previous (object): The value that was held at the path
+            value (object): The value now held at the path, the missing marker if the path has been deleted
+        """
+        if path is None: return
+        self._indexPaths = None
+
+        if previous.__class__ is _LazySection: previous = previous.base  # Only the base of a lazy section is indexed
+
+        if isinstance(previous, (dict, FrozenSection)) and previous is not value: self._indexDiscard(path, previous)
+
+        if value is PathAccessor._missing: self._index.pop(path, None)
+        else: self._indexAdd(path, value)
+
+    @classmethod
+    def _indexTree(cls, elements: dict) -> dict:
+        """ Generate the flat index of a config's root
+
+        Params:
+            elements (dict): The root of the config
+
+        Returns:
+            dict: Colon delimited paths to their values
+        """
+        index = {}
+        for key, value in elements.items():
+            path = cls._path([], key)
+            if path is not None: cls._flatten(path, value.base if value.__class__ is _LazySection else value, index)
+        return index
+
+    def _indexAdd(self, path: str, value: object) -> None:
+        """ Add a value and any values nested within it into the index """
+        self._flatten(path, value, self._index)
+
+    @classmethod
+    def _flatten(cls, path: str, value: object, paths: dict) -> None:
+        """ Add a value and any values nested within it into a mapping of colon delimited paths to values
+
+        Params:
+            path (str): The path of the value
+            value (object): The value
+            paths (dict): The mapping to be updated
+        """
+        paths[path] = value
+        if isinstance(value, (dict, FrozenSection)):
+            for key, item in value.items():
+                if isinstance(key, str) and ":" not in key: cls._flatten(path + ":" + key, item, paths)
+
+    def _indexDiscard(self, path: str, node: dict) -> None:
+        """ Remove the values nested within a section from the index """
+        for key, item in node.items():
+            if isinstance(key, str) and ":" not in key:
+                self._index.pop(path + ":" + key, None)
+                if isinstance(item, dict): self._indexDiscard(path + ":" + key, item)
+
+    def _traverse(self, path: [str]):
+        """ Traverse the internal structure with the provided path and return
+        the value located. All strings passed must be the keys for dictionaries
+        within the structure other than than the last item. The value returned
+        can be anything that exists at that point
+
+        Params:
+            path ([str]): A list of keys of the objects - the path through the
+                config to the value
+
+        Raises:
+            KeyError - if the structure is does not resemble the path that has
+                been provided
+        """
+
+        # Root Node
+        node = self._elements
+
+        for key in path:
+            # Traverse the dictionary for the final item
+            if key is None: continue  # Ignore unused scope
+            if not isinstance(node, dict): raise ConsistencyError("Path expected a greater depth during traversal")
+            node = node[key]
+            if node.__class__ is _LazySection: node = self._materialize(key)
+
+        return node
+
+    def _performInterpolation(self, line: str) -> str:
+        """ Convert the references in the provided line into their value that
+        was previously defined, and not a key value within the config
+
+        Params:
+            line (str): The line to perform the interpolation on
+
+        Returns:
+            str: The line transformed to have its values
+        """
+        references = self._references(line)
+        if not references: return line
+        return self._substitute(line, references, {})
+
+    def _references(self, value: str) -> [(int, int, tuple)]:
+        """ Identify the references to other keys within a value
+
+        Params:
+            value (str): The value of a setting
+
+        Returns:
+            [(int, int, tuple)]: The start and end offsets of each reference and the path it references
+        """
+        if "{" not in value: return []
+        return [
+            (match.start(), match.end(), tuple(match.group("path").split(":")))
+            for match in self._rxInterpolation.finditer(value)
+        ]
+
+    def _substitute(self, value: str, references: [(int, int, tuple)], resolved: dict) -> str:
+        """ Replace the references within a value with the values they reference, in a single pass of the value
+
+        Params:
+            value (str): The value containing the references
+            references ([(int, int, tuple)]): The offsets and paths of the references in the value
+            resolved (dict): Values of paths that have been resolved during this parse, other paths are collected
+                from the config
+
+        Returns:
+            str: The interpolated value
+
+        Raises:
+            KeyError: A reference is to a key that does not exist
+        """
+        pieces, position = [], 0
+        for start, end, path in references:
+            if path in resolved: reference = resolved[path]
+            else: reference = self._traverse(path[:-1])[path[-1]]
+
+            pieces.append(value[position: start])
+            pieces.append(str(reference))
+            position = end
+
+        pieces.append(value[position:])
+        return "".join(pieces)
+
+    def _resolveReferences(self, pending: dict) -> None:
+        """ Interpolate the values of settings that reference other keys and add them into the config. The references
+        between the settings form a dependency graph that is resolved in topological order, such that a setting may
+        reference a key defined after it. A reference from a setting to its own key is to the key's previous value.
+
+        Params:
+            pending (dict): Setting paths to the setting and its references, in the order they were read
+
+        Raises:
+            ValueError: The references between the settings form a cycle
+            KeyError: A reference is to a key that does not exist
+        """
+
+        resolved = {}  # Memoized values of the resolved settings
+
+        for root in pending:
+            if root in resolved: continue
+
+            # Depth first traversal of the setting's references - the stack holds the chain of dependent settings
+            stack, visiting = [root], {root}
+            while stack:
+                path = stack[-1]
+                setting, references = pending[path]
+
+                for _, _, reference in references:
+                    if reference == path or reference not in pending or reference in resolved: continue
+
+                    if reference in visiting:
+                        cycle = stack[stack.index(reference):] + [reference]
+                        raise ValueError("Interpolation cycle: {}".format(" -> ".join(
+                            "{} (line {})".format(":".join(key), pending[key][0].line) for key in cycle
+                        )))
+
+                    # Resolve the referenced setting first
+                    stack.append(reference)
+                    visiting.add(reference)
+                    break
+
+                else:
+                    # All references are resolved - interpolate and add the setting
+                    setting.value = self._substitute(setting.value, references, resolved)
+                    self._addSetting(setting)
+
+                    resolved[path] = setting.value
+                    stack.pop()
+                    visiting.discard(path)
+
+    def _convertToType(self, variable_type: str, variable_value: str):
+        """ Convert the value passed into the type provided
+
+        Raises:
+            TypeError: In the event that the value is not acceptable for the
+                type specified
+            Exception: Any other acception that may be caused by using a non
+                standard type
+        """
+
+        signature = self._signatures.get(variable_type)
+        if signature is None:
+            match = self._rxType.match(variable_type)
+            if match is None:
+                raise ValueError("Couldn't process type signature: {}".format(variable_type))
+
+            signature = self._signatures[variable_type] = (match.group("type"), match.group("sub_type"))
+
+        settingType, subType = signature
+
+        # Registered converters take the value as it is
+        converter = self._registered.get(settingType)
+        if converter is not None: return converter(variable_value)
+
+        if settingType == 'eval':
+            if not self._safe: return eval(variable_value)
+            else: raise RuntimeError("Unsafe eval type present as type in config when config read is safe")
+
+        numeric = None if subType in self._registered else self._numericTypes.get(subType)
+        if numeric is not None and '"' not in variable_value and "'" not in variable_value:
+            # Sequences of numbers are converted in a single pass - values that int and float cannot take as they are
+            # (such as empty items) fall back to the items being converted one at a time
+            items = variable_value.split(self._delimiter) if variable_value else []
+            try:
+                if self._arrays is not None and settingType in self._arrayTypes:
+                    return self._convertToArray(subType, items)
+                variable_value = list(map(numeric[0], items))
+            except (ValueError, OverflowError):
+                numeric = None
+        else:
+            numeric = None
+
+        if numeric is None:
+            if variable_value:
+                variable_value = [x.strip().strip('"').strip("'") for x in variable_value.split(self._delimiter)]
+
+                if subType:
+                    variable_value = [self._convertToType(subType, sub_val) for sub_val in variable_value]
+            else:
+                variable_value = []
+
+        converter = self._converters.get(settingType)
+        if converter is not None: return converter(self, variable_value)
+
+        return self._importType(settingType)(*variable_value)
+
+    def _convertToArray(self, subType: str, items: [str]) -> object:
+        """ Convert the items of a sequence of ints or floats into an array of the config's array backend
+
+        Params:
+            subType (str): The type of the items - int or float
+            items ([str]): The unconverted items
+
+        Returns:
+            object: The array.array or numpy array of the items
+
+        Raises:
+            ValueError: An item cannot be converted into the sub type
+            OverflowError: An item is too large for the array's item size
+        """
+        converter, typecode, dtype = self._numericTypes[subType]
+        if self._arrays == "numpy":
+            return importlib.import_module("numpy").fromiter(map(converter, items), dtype=dtype, count=len(items))
+        return array.array(typecode, map(converter, items))
+
+    @staticmethod
+    def _arrayBackend(arrays: (bool, str)) -> str:
+        """ Resolve the arrays option into the array backend used for numeric sequences
+
+        Params:
+            arrays (bool / str): The arrays option - False, True, "array" or "numpy"
+
+        Returns:
+            str: "array" or "numpy", None when arrays are disabled
+
+        Raises:
+            ValueError: The option is not recognised
+            ImportError: numpy was requested and is not installed
+        """
+        if arrays is False or arrays is None: return None
+        elif arrays is True:
+            try:
+                importlib.import_module("numpy")
+                return "numpy"
+            except ImportError:
+                return "array"
+        elif arrays == "numpy":
+            importlib.import_module("numpy")
+            return arrays
+        elif arrays == "array":
+            return arrays
+
+        raise ValueError("Invalid arrays option '{}' - expected True, False, 'array' or 'numpy'".format(arrays))
+
+    @classmethod
+    def _importType(cls, settingType: str) -> type:
+        """ Resolve a dotted custom type to the class it names - resolved types are cached
+
+        Params:
+            settingType (str): The dotted path of the type - module path followed by the class name
+
+        Returns:
+            type: The class
+
+        Raises:
+            ImportError: In the event the module cannot be imported
+            AttributeError: In the event the module does not define the class
+        """
+        importClass = cls._importedTypes.get(settingType)
+        if importClass is None:
+            modules = settingType.split(".")
+            importClass = getattr(importlib.import_module(".".join(modules[:-1])), modules[-1])
+            cls._importedTypes[settingType] = importClass
+
+        return importClass
+
+    @classmethod
+    def register_type(cls, name: str, converter: callable) -> None:
+        """ Register a converter for a type name. Settings declared with the type are converted by calling the converter
+        with the setting's value string as read - the value is not split by the delimiter. The type can be used as the
+        sub type of a sequence, where the converter is called for each item
+
+        Registered converters take precedence over the builtin types and the types of the same name registered on
+        parent classes
+
+        Params:
+            name (str): The name of the type as it shall appear in the config
+            converter (callable): Takes the value string and returns the converted value
+
+        Raises:
+            ValueError: The name is not a valid type name
+        """
+        if not re.match(r"^[\w\.]+$", name):
+            raise ValueError("Invalid type name '{}' - type names may only contain word characters and '.'".format(name))
+
+        # Copy the registry on a class's first registration - subclasses do not register onto their parents
+        if "_registered" not in cls.__dict__: cls._registered = dict(cls._registered)
+        cls._registered[name] = converter
+
+    @staticmethod
+    def _updateIterableType(base: str, iterable: object):
+        """ Check whether all the items within an iterable have the same type if so update the base to reflext that
+
+        Params:
+            base (str): The base type of the iterable
+            iterable (object): An object that can be iterated
+
+        Returns:
+            str: the base or the base and its subtype if all items have the same type
+        """
+        if len(iterable): # Assert that the iterable has length before checking its values
+            iterType = None
+            for item in iterable:
+
+                if iterType is None:
+                    # Record the type of the first item
+                    iterType = type(item).__name__
+                    continue
+
+                # break in the event that an item doesn't have the same type of any previous items
+                if type(item).__name__ != iterType:
+                    break
+            else:
+                return "{}<{}>".format(base, iterType) # If it never breaks, then all the items must have the same type
+
+        return base
+
+    def _convertFromType(self, value: object) -> str:
+        """ Convert the provided value into a string which would be acceptable as input to the config parser. This
+        method is to service the serialisation of a config.
+
+        Params:
+            value (object): The value that is to be stringified
+
+        Returns:
+            str: The config parser string representation of the object
+        """
+
+        if isinstance(value, str):
+            return "", value
+
+        # Assert the name of the type for casting
+        value_type = type(value).__name__
+
+        if isinstance(value, (int, bool, float)):
+            value_string = str(value)
+
+        elif isinstance(value, set):
+            value_type = self._updateIterableType(value_type, value)
+
+            if len(value): value_string = str(value).strip(r"{}")
+            else: value_string = ""
+
+        elif isinstance(value, frozenset):
+            value_type = self._updateIterableType(value_type, value)
+
+            if len(value): value_string = str(value)[11:-2]
+            else: value_string = ""
+
+        elif isinstance(value, list):
+            value_type = self._updateIterableType(value_type, value)
+            value_string = str(value).strip("[]")
+
+        elif isinstance(value, array.array) or (value_type == "ndarray" and getattr(value, "ndim", None) == 1):
+            # Arrays are written as lists of their items, read back into arrays by configs with arrays enabled
+            value = value.tolist()
+            value_type = self._updateIterableType("list", value)
+            value_string = str(value).strip("[]")
+
+        elif isinstance(value, tuple):
+            value_type = self._updateIterableType(value_type, value)
+            value_string = str(value).strip("()")
+
+        elif isinstance(value, (bytes, bytearray)):
+            value_string = value.decode() + ", utf-8"
+
+        elif isinstance(value, complex):
+            value_string = str(value).strip("()")
+
+        else:
+            raise ValueError("Variable type could not be converted")
+
+        return value_type, value_string
+
+    def freeze(self):
+        """ Take an immutable snapshot of the config. The snapshot is built from frozen sections and holds immutable
+        values - lists and arrays are frozen into tuples, sets into frozensets and bytearrays into bytes, each of which
+        thaws back into the type it was frozen from. The snapshot is hashable (provided its values are) and can be shared between threads without locking.
+
+        The config must not be modified in place by another thread while it is frozen - modifications made by reload
+        and read_many replace the config's root, and are safe.
+
+        Returns:
+            FrozenConfig: The snapshot of the config
+        """
+        for key in list(self._elements): self[key]  # Parse any lazy sections
+
+        elements = self._elements
+        return FrozenConfig(
+            {key: FrozenSection._freeze(value) for key, value in elements.items()},
+            (type(self), self._options())
+        )
+
+    def copy(self): return {key: self[key] for key in self._elements}
@@ -0,0 +1,144 @@
+import time
+import threading
+
+class ParseProfile:
+    """ The time spent in each stage of parsing a config, as recorded by a config parser constructed with profile=True.
+    Time is recorded exclusively - the time of a stage does not include the time of the stages it calls into - so the
+    stage times add up to the total time spent parsing.
+
+    Stages:
+        tokenize: Reading the meaningful lines of a source (the line and fast engines)
+        comments: Removing comments from lines (the line engine only)
+        grammar: Interpreting lines as sections and settings
+        build: Adding sections into the config, and holding back settings that reference other keys
+        settings: Adding settings into the config (and its index)
+        conversion: Converting setting values into their declared types
+        interpolation: Resolving the settings that reference other keys
+        imports: Importing the custom types of settings
+    """
+
+    def __init__(self):
+        self.stages = {}  # Stage name to its cumulative time in seconds and number of calls
+        self.lines = {}  # The source (file path, None for strings) and line number to the time spent on the line
+        self.imports = {}  # The custom types imported to the time their import took
+
+        self._lock = threading.Lock()
+        self._local = threading.local()  # The stack of the stages being timed, and the file being read, of each thread
+
+    def __repr__(self):
+        return "<ParseProfile {}>".format(", ".join(
+            "{} {:.3f}s".format(stage, seconds) for stage, (seconds, _) in self.stages.items()
+        ))
+
+    def report(self, lines: int = 10) -> dict:
+        """ Summarise the profile
+
+        Params:
+            lines (int) = 10: The number of slowest lines to report
+
+        Returns:
+            dict: The time and calls of each stage, the slowest lines and the custom types imported
+        """
+        with self._lock:
+            return {
+                "total": sum(seconds for seconds, _ in self.stages.values()),
+                "stages": {
+                    stage: {"seconds": seconds, "calls": calls} for stage, (seconds, calls) in self.stages.items()
+                },
+                "lines": [
+                    {"source": source, "line": line, "seconds": seconds}
+                    for (source, line), seconds in sorted(self.lines.items(), key=lambda item: -item[1])[:lines]
+                ],
+                "imports": dict(self.imports),
+            }
+
+    def reset(self) -> None:
+        """ Discard everything recorded """
+        with self._lock:
+            self.stages, self.lines, self.imports = {}, {}, {}
+
+    def _enter(self) -> float:
+        """ Open the timing of a stage - returns its start time """
+        stack = getattr(self._local, "stack", None)
+        if stack is None: stack = self._local.stack = [[0., 0.]]
+        stack.append([0., 0.])  # The time of the stages called into, and the part of it recorded against lines
+        return time.perf_counter()
+
+    def _exit(self, stage: str, start: float, line: (str, int) = None) -> None:
+        """ Close the timing of a stage, recording its exclusive time against the stage and, if given, the line """
+        elapsed = time.perf_counter() - start
+
+        stack = self._local.stack
+        children, attributed = stack.pop()
+        parent = stack[-1]
+        parent[0] += elapsed
+        parent[1] += elapsed if line is not None else attributed
+
+        with self._lock:
+            record = self.stages.get(stage)
+            if record is None: record = self.stages[stage] = [0., 0]
+            record[0] += elapsed - children
+            record[1] += 1
+
+            # Lines take the time of the stages called into that was not recorded against a line of their own
+            if line is not None: self.lines[line] = self.lines.get(line, 0.) + elapsed - attributed
+
+    def _function(self, stage: str, function: callable, line: callable = None) -> callable:
+        """ Wrap a function such that its calls are timed as a stage, optionally recorded against a line
+
+        Params:
+            stage (str): The name of the stage
+            function (callable): The function to be timed
+            line (callable) = None: Takes the function's arguments and returns the line they concern
+        """
+        def timed(*args, **kwargs):
+            start = self._enter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self._exit(stage, start, line(*args) if line else None)
+        return timed
+
+    def _importer(self, function: callable, imported: dict) -> callable:
+        """ Wrap the import of custom types such that the imports that are not already cached are timed
+
+        Params:
+            function (callable): Takes the dotted path of a type and returns the type
+            imported (dict): The cache of imported types
+        """
+        def timed(settingType: str):
+            if settingType in imported: return function(settingType)
+
+            start = self._enter()
+            try:
+                return function(settingType)
+            finally:
+                elapsed = time.perf_counter() - start
+                self._exit("imports", start)
+                with self._lock: self.imports[settingType] = elapsed
+        return timed
+
+    def _generator(self, stage: str, function: callable, line: callable) -> callable:
+        """ Wrap a generator function such that producing each of its items is timed as a stage, and recorded against
+        the line of the item
+
+        Params:
+            stage (str): The name of the stage
+            function (callable): The generator function to be timed
+            line (callable): Takes an item produced and returns the line it concerns
+        """
+        def timed(*args, **kwargs):
+            iterator = function(*args, **kwargs)
+            while True:
+                start = self._enter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    self._exit(stage, start)
+                    return
+                except:
+                    self._exit(stage, start)
+                    raise
+                self._exit(stage, start, line(item))
+                yield item
+        return timed
@@ -0,0 +1,189 @@
+import os
+import time
+import select
+import struct
+import ctypes
+import ctypes.util
+import logging
+import threading
+
+log = logging.getLogger("better.ConfigParser")
+
+class _Inotify:
+    """ A minimal binding of the linux inotify interface, watching a directory for changes to its entries
+
+    Params:
+        directory (str): The directory to watch
+
+    Raises:
+        OSError: inotify is not available on this platform, or the directory cannot be watched
+    """
+
+    _event = struct.Struct("iIII")  # Watch descriptor, mask, cookie and the length of the name that follows
+
+    # Modification, closing a written file, entries moved out of / into the directory, created and deleted
+    _mask = 0x2 | 0x8 | 0x40 | 0x80 | 0x100 | 0x200
+
+    def __init__(self, directory: str):
+        name = ctypes.util.find_library("c")
+        if name is None: raise OSError("inotify is unavailable - the C library could not be found")
+
+        libc = ctypes.CDLL(name, use_errno = True)
+        if not hasattr(libc, "inotify_init1"): raise OSError("inotify is unavailable on this platform")
+
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0: raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        if libc.inotify_add_watch(self._fd, os.fsencode(directory), self._mask) < 0:
+            errno = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(errno, "Cannot watch '{}'".format(directory))
+
+    def fileno(self) -> int: return self._fd
+
+    def read(self) -> [str]:
+        """ Collect the names of the entries that have changed since the last read
+
+        Returns:
+            [str]: The names of the changed entries
+        """
+        names = []
+        while True:
+            try:
+                buffer = os.read(self._fd, 64*1024)
+            except BlockingIOError:
+                return names
+
+            offset = 0
+            while offset < len(buffer):
+                _, _, _, length = self._event.unpack_from(buffer, offset)
+                offset += self._event.size
+                names.append(os.fsdecode(buffer[offset: offset + length].rstrip(b"\0")))
+                offset += length
+
+    def close(self) -> None: os.close(self._fd)
+
+class ConfigWatcher(threading.Thread):
+    """ A daemon thread that reloads a file into a config whenever the file changes. Changes are observed through
+    inotify where it is available, otherwise by polling the file's status. A burst of writes is debounced - the file
+    is reloaded once it has been left unchanged for the debounce period. Errors raised by the reload (such as a file
+    that is not valid config) are logged, and the file is reloaded again on its next change
+
+    Params:
+        config (ConfigParser): The config the file has been read into
+        filepath (str): The path of the file to watch
+        callback (callable): Called with the ChangeSet of each reload that changes the config
+        *,
+        debounce (float): The number of seconds the file must be left unchanged before it is reloaded
+        interval (float): The number of seconds between polls of the file's status
+        poll (bool): Poll the file's status even where inotify is available
+    """
+
+    def __init__(
+        self,
+        config,
+        filepath: str,
+        callback: callable = None,
+        *,
+        debounce: float = 0.1,
+        interval: float = 1.0,
+        poll: bool = False
+        ):
+        threading.Thread.__init__(self, name = "ConfigWatcher({})".format(filepath), daemon = True)
+
+        self.config = config
+        self.filepath = os.path.abspath(filepath)
+        self.callback = callback
+        self.debounce = debounce
+        self.interval = interval
+
+        self._stopped = threading.Event()
+        self._releasing = threading.Lock()  # Held while the inotify instance and wake pipe are used or closed
+        self._status = self._stat()
+
+        self._inotify = None
+        if not poll:
+            try:
+                self._inotify = _Inotify(os.path.dirname(self.filepath))
+                self._wake = os.pipe()  # Interrupts the wait on inotify when the watcher is closed
+            except OSError:
+                if self._inotify is not None: self._inotify.close()
+                self._inotify = None
+
+    def run(self):
+
+        try:
+            while not self._stopped.is_set():
+                if not self._wait(None): continue  # Woken without a change - the watcher has been closed
+
+                # Debounce the change - wait until the file has been left unchanged
+                while self._wait(self.debounce): pass
+                if self._stopped.is_set(): break
+
+                try:
+                    changes = self.config.reload(self.filepath)
+                    if changes and self.callback is not None: self.callback(changes)
+                except Exception:
+                    log.exception("Failed to reload '%s'", self.filepath)
+
+        finally:
+            self._release()
+
+    def close(self) -> None:
+        """ Stop watching the file, waiting for any reload in progress to complete """
+        self._stopped.set()
+        if self.ident is None:
+            self._release()  # The watcher was never started - its descriptors are not released by run
+            return
+
+        with self._releasing:
+            if self._inotify is not None: os.write(self._wake[1], b"\0")
+        if self.is_alive() and threading.current_thread() is not self: self.join()
+
+    def _release(self) -> None:
+        """ Close the inotify instance and the wake pipe of the watcher """
+        with self._releasing:
+            if self._inotify is not None:
+                self._inotify.close()
+                for fd in self._wake: os.close(fd)
+                self._inotify = None
+
+    def _stat(self) -> tuple:
+        """ The status of the file that identifies a change to it, None when the file does not exist """
+        try:
+            status = os.stat(self.filepath)
+        except OSError:
+            return None
+        return status.st_ino, status.st_size, status.st_mtime_ns
+
+    def _wait(self, timeout: float) -> bool:
+        """ Wait for the file to change
+
+        Params:
+            timeout (float): The number of seconds to wait, None to wait until the file changes or the watcher is closed
+
+        Returns:
+            bool: True if the file changed, False if the timeout elapsed or the watcher was closed
+        """
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        name = os.path.basename(self.filepath)
+
+        while not self._stopped.is_set():
+            remaining = None if deadline is None else max(0, deadline - time.monotonic())
+
+            if self._inotify is not None:
+                ready, _, _ = select.select([self._inotify, self._wake[0]], [], [], remaining)
+                if self._inotify in ready and name in self._inotify.read(): return True
+
+            else:
+                if self._stopped.wait(self.interval if remaining is None else min(self.interval, remaining)): break
+
+                status = self._stat()
+                if status != self._status:
+                    self._status = status
+                    return True
+
+            if deadline is not None and time.monotonic() >= deadline: break
+
+        return False
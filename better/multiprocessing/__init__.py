@@ -3,4 +3,6 @@ from multiprocessing import *
 
 from ._exceptions import SubprocessException
 from ._poolmanager import PoolProcess
-from ._poolmanager import PoolManager
\ No newline at end of file
+from ._poolmanager import PoolManager
+from ._asyncpoolmanager import AsyncPoolManager
+from ._sharedconfig import SharedConfig, SharedSection
\ No newline at end of file
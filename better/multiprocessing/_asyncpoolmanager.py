@@ -0,0 +1,198 @@
+import asyncio
+import logging
+import threading
+import collections
+import concurrent.futures
+import multiprocessing as mp
+
+from ._exceptions import SubprocessException
+from ._poolmanager import PoolManager, _Batch
+
+log = logging.getLogger("better.multiprocessing.AsyncPoolManager")
+
+class AsyncPoolManager:
+    """ An asyncio front-end for a pool of processes. Each task placed into the pool is given a future that is resolved
+    with its output, such that the event loop is never blocked by the pool
+
+    Params:
+        target: The function the process within the pool will be enacting, or a PoolProcess class
+
+    Keyword Params:
+        size (int) = os.cpu_count(): The number of processes within the pool
+        static_args (list) = []: The static arguments passed to each call of the target
+        queue_size (int) = "auto": The maximum number of tasks waiting to be picked up - submitting waits for space
+        logger (logging.Logger) = None: Provide a logger for the system
+        daemon (bool) = False: Toggle the daemonization of the pool's processes
+    """
+
+    _readInterval = 0.1  # The longest the reader waits for an output before checking that the pool is still alive
+
+    def __init__(self, target: callable, **kwargs):
+        for option in ("ordered", "chunksize", "reorder_window"):
+            if option in kwargs: raise TypeError("AsyncPoolManager does not take the '{}' option".format(option))
+
+        self._pool = PoolManager(target, **kwargs)
+        self._loop = None
+        self._futures = {}  # The future of each task yet to be resolved, keyed by the task's index
+        self._reader = None
+        self._closing = False
+
+        # Tasks are placed by a single thread, such that a full queue waits off the event loop and in submission order
+        self._placer = concurrent.futures.ThreadPoolExecutor(1, thread_name_prefix="AsyncPoolManager")
+
+    async def start(self) -> None:
+        """ Start the pool of processes and the thread that resolves the futures of the tasks """
+        self._loop = asyncio.get_running_loop()
+        self._pool.start()
+        self._reader = threading.Thread(target=self._read, daemon=True)
+        self._reader.start()
+
+    async def submit(self, *items) -> asyncio.Future:
+        """ Place a task into the pool. If the pool's queue is full, wait for space without blocking the event loop
+
+        Params:
+            items (object): The inputs of the task
+
+        Returns:
+            asyncio.Future: A future resolved with the output of the task, or with a SubprocessException if it failed
+
+        Raises:
+            RuntimeError: The pool is not running, or all of its processes have terminated
+        """
+        if self._loop is None or self._closing: raise RuntimeError("Cannot submit tasks to a pool that is not running")
+
+        future = self._loop.create_future()
+        await self._loop.run_in_executor(self._placer, self._place, future, items)
+        return future
+
+    def _place(self, future: asyncio.Future, items: tuple) -> None:
+        """ Register the future of a task under its index and place the task - run on the placing thread """
+        index = self._pool._index
+        self._futures[index] = future  # Registered first, the output can be returned before put returns
+
+        try:
+            self._pool.put(*items)
+        except:
+            del self._futures[index]
+            raise
+
+    def _read(self) -> None:
+        """ Collect outputs from the pool and resolve the future of each on the event loop - run on the reader thread """
+
+        returnQueue = self._pool._returnQueue
+        while not self._closing or self._futures:
+            try:
+                output = returnQueue.get(True, self._readInterval)
+            except mp.queues.Empty:
+                if self._pool.isAlive() or self._pool._returnReader.poll(): continue
+
+                log.debug("reader: Concluded as all the processes in the pool have terminated")
+                error = RuntimeError("All processes in the pool have terminated - no work to get")
+                for index in list(self._futures):
+                    self._loop.call_soon_threadsafe(self._fail, self._futures.pop(index), error)
+                return
+
+            for index, value in (output.items if isinstance(output, _Batch) else (output,)):
+                self._loop.call_soon_threadsafe(self._resolve, self._futures.pop(index), index, value)
+
+    @staticmethod
+    def _resolve(future: asyncio.Future, index: int, value: object) -> None:
+        """ Set the output of a task on its future - run on the event loop """
+        if future.done(): return
+        if isinstance(value, Exception): future.set_exception(SubprocessException(index, value))
+        else: future.set_result(value)
+
+    @staticmethod
+    def _fail(future: asyncio.Future, error: Exception) -> None:
+        """ Set an error of the pool on the future of a task - run on the event loop """
+        if not future.done(): future.set_exception(error)
+
+    async def map(self, iterable, *, window: int = None) -> [object]:
+        """ Apply the function to the items in the iterable and return the outputs in the order of the iterable
+
+        Params:
+            iterable (iterable / async iterable): Target of the function
+            window (int) = None: The most tasks in flight, defaults to four for each process of the pool
+
+        Returns:
+            [object]: The outputs of the function
+        """
+        return [output async for output in self.imap(iterable, window=window)]
+
+    async def imap(self, iterable, *, window: int = None) -> object:
+        """ Lazily apply the function to the items in the iterable, yielding the outputs in the order of the iterable.
+        Only a window of tasks is in flight at any time
+
+        Params:
+            iterable (iterable / async iterable): Target of the function, items are taken as space in the window frees
+            window (int) = None: The most tasks in flight, defaults to four for each process of the pool
+
+        Returns:
+            async generator: The outputs of the function
+        """
+        pending = collections.deque()
+        try:
+            async for item in self._items(iterable):
+                if len(pending) >= (window or self._pool._pool_size * 4): yield await pending.popleft()
+                pending.append(await self.submit(item))
+
+            while pending: yield await pending.popleft()
+        finally:
+            for future in pending: future.cancel()
+
+    async def imap_unordered(self, iterable, *, window: int = None) -> object:
+        """ Lazily apply the function to the items in the iterable, yielding the outputs in the order they complete.
+        Only a window of tasks is in flight at any time
+
+        Params:
+            iterable (iterable / async iterable): Target of the function, items are taken as space in the window frees
+            window (int) = None: The most tasks in flight, defaults to four for each process of the pool
+
+        Returns:
+            async generator: The outputs of the function
+        """
+        pending = set()
+        try:
+            async for item in self._items(iterable):
+                if len(pending) >= (window or self._pool._pool_size * 4):
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for future in done: yield future.result()
+                pending.add(await self.submit(item))
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done: yield future.result()
+        finally:
+            for future in pending: future.cancel()
+
+    @staticmethod
+    async def _items(iterable) -> object:
+        """ Iterate over a synchronous or asynchronous iterable """
+        if hasattr(iterable, "__aiter__"):
+            async for item in iterable: yield item
+        else:
+            for item in iterable: yield item
+
+    async def close(self) -> None:
+        """ Close the pool once the outputs of all submitted tasks have been returned """
+        if self._closing: return
+        self._closing = True
+
+        await self._loop.run_in_executor(self._placer, self._pool.close)
+        if self._reader: await self._loop.run_in_executor(None, self._reader.join)
+        self._placer.shutdown()
+
+    async def terminate(self) -> None:
+        """ Stop the processes of the pool immediately, failing the futures of the tasks yet to be returned """
+        self._closing = True
+        self._pool.terminate()
+        if self._reader: await self._loop.run_in_executor(None, self._reader.join)
+        self._placer.shutdown()
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, a, b, c):
+        if self._pool.daemon: await self.terminate()
+        else: await self.close()
@@ -17,22 +17,32 @@ class LogPipeThread(threading.Thread):
         self.receiveConnection = pipe[0]
         self.loggers = loggers
 
+    _pollInterval = 0.1  # The longest the thread waits for a record before checking whether it has been closed
+
     def run(self):
 
         while self.working:
-            while self.receiveConnection.poll():
-
-                # Collect new log from sub-processes
-                record = self.receiveConnection.recv()
-
-                # Break up the record hierarchy - iterate through the hierarchy until a logger is found
-                hierarchy = record.name.split(".")
-                while hierarchy:
-                    name = ".".join(hierarchy)
-                    if name in self.loggers:
-                        self.loggers[name].handle(record)
-                        break
-                    hierarchy.pop()
+            # Sleep until a record arrives rather than spinning on the pipe
+            if self.receiveConnection.poll(self._pollInterval): self._handle(self.receiveConnection.recv())
+
+        # Handle the records that were sent before the thread was closed
+        while self.receiveConnection.poll(): self._handle(self.receiveConnection.recv())
+
+    def _handle(self, record: logging.LogRecord) -> None:
+        """ Pass a record from a sub-process to the logger it belongs to
+
+        Params:
+            record (logging.LogRecord): The record collected from the pipe
+        """
+
+        # Break up the record hierarchy - iterate through the hierarchy until a logger is found
+        hierarchy = record.name.split(".")
+        while hierarchy:
+            name = ".".join(hierarchy)
+            if name in self.loggers:
+                self.loggers[name].handle(record)
+                break
+            hierarchy.pop()
 
     def close(self):
         """ Update the threads working flag, this shall inform the thread to stop when it has finished any current work
@@ -1,12 +1,17 @@
 import os
+import math
 import inspect
 import time
+import itertools
+import collections
 import logging
 import threading
 import multiprocessing as mp
+import multiprocessing.connection
 
 from ._exceptions import SubprocessException
 from ._mplogging import LogPipeThread, LogPipeHandler
+from ._sharedconfig import SharedConfig
 
 log = logging.getLogger("better.multiprocessing.PoolManager")
 
@@ -17,6 +22,23 @@ class PoolProcess:
     def run(self, *args, **kwargs):
         raise NotImplementedError("The run function for the PoolProcess has not been implemented")
 
+class _Batch:
+    """ Tasks sent to a pool process together, or their outputs returned together
+
+    Params:
+        items ([(int, object)]): The index of each task paired with its input or output
+        seconds (float) = None: The time the process took to run the tasks - set on returned batches
+    """
+
+    __slots__ = ("items", "seconds")
+
+    def __init__(self, items: list, seconds: float = None):
+        self.items = items
+        self.seconds = seconds
+
+    def __getstate__(self): return self.items, self.seconds
+    def __setstate__(self, state: tuple): self.items, self.seconds = state
+
 class PoolManager:
     """ Generate and manage interactions with a pool of processes
 
@@ -29,12 +51,23 @@ class PoolManager:
         queue_size (int) = None: The maximum number of items that can be placed into the work stream
         logging (logging.Logger) = None: Provide a logger for the system
         ordered (bool) = False: Toggle ordering of the returned outputs
+        chunksize (int / str) = 1: The number of tasks sent to a process at once, "auto" to size the batches from the
+            time tasks take to run
+        reorder_window (int) = None: The most tasks that can be in flight while ordered, such that the outputs held
+            for reassembly are bounded - placing tasks waits for space in the window
     """
 
     _STANDBY = 10
     _RUNNING = 20
     _CLOSED = 30
 
+    _FAILED = object()  # Held in place of the output of a failed task while ordered
+
+    _putInterval = 0.1  # The longest a blocked put waits before checking that the pool is still alive
+
+    _chunkSeconds = 0.01  # The time an automatically sized batch of tasks is expected to take to run
+    _chunkLimit = 1024  # The largest automatically sized batch
+
     def __init__(self,
         target: callable,
         *,
@@ -43,17 +76,30 @@ class PoolManager:
         queue_size: int = "auto",
         logger: logging.Logger = None,
         ordered: bool = False,
-        daemon: bool = False
+        daemon: bool = False,
+        chunksize: (int, str) = 1,
+        reorder_window: int = None
         ):
 
         self._state = self._STANDBY
         self._pool_size = size
         self._ordered = ordered
         self._returnIndex = 0
-        self._returnCache = {}
+        self._returnCache = {}  # Outputs returned before their turn, held to be returned in order
+        self._reorderPeak = 0
         self.daemon = daemon
         self.static_args = static_args
 
+        self._chunksize = self._validateChunksize(chunksize)
+        self._chunk = []  # Tasks put into the pool that are held until a batch is full
+        self._received = collections.deque()  # Outputs returned in a batch that are yet to be collected
+        self._taskSeconds = None  # The average time a task takes to run, measured from returned batches
+
+        if reorder_window is not None and (not isinstance(reorder_window, int) or reorder_window < 1):
+            raise ValueError("Invalid reorder window '{}' - expected a positive integer".format(reorder_window))
+        self._reorderWindow = reorder_window
+        self._windowCondition = threading.Condition()  # Notified as ordered outputs are returned
+
         # Setup the send and receive queues, and determine the queue size
         if isinstance(queue_size, str):
             if queue_size == "auto": size = self._pool_size*2
@@ -64,6 +110,11 @@ class PoolManager:
         self._sendQueue = mp.Queue(size)
         self._returnQueue = mp.Queue()
 
+        # mp.Queue offers no handle to wait upon alongside the processes' sentinels. Its reader connection is private, but
+        # has been a stable attribute of the queue since it was introduced - it is taken once here, rather than reached
+        # for wherever the queue is waited upon, and is only ever polled or waited upon, never read from directly
+        self._returnReader = self._returnQueue._reader
+
         # Wrap the user function
         self._function = self._user_function_wrapper(target)
 
@@ -90,7 +141,6 @@ class PoolManager:
         self._active = 0
         self._asyncThread = None
         self._clearingTasks = False
-        self._is_alive_check = 0
 
     def addLogger(self, logger: logging.Logger) -> None:
         """ Add a logger to the pool to such that the logs produced by sub-processes that would have been passed to this
@@ -142,15 +192,18 @@ class PoolManager:
             mp.TimeoutError: A block timeout and an item could not be placed
         """
 
-        if timeout is not None: start = time.time()
-        while (self.isAlive() and (timeout is None or time.time() - start < timeout)):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.isAlive():
+            # Block on the queue for a bounded period, such that the death of the pool is noticed while waiting
+            wait = self._putInterval if deadline is None else min(self._putInterval, deadline - time.monotonic())
             try:
-                return self._sendQueue.put(item, block=False)
+                return self._sendQueue.put(item, block=block, timeout=max(wait, 0))
             except mp.queues.Full:
                 if not block: raise
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise mp.TimeoutError("Timeout while attempting to place item: {}".format(item))
 
-        if not self.isAlive(): raise RuntimeError("Empty pool")
-        else: mp.TimeoutError("Timeout while attempting to place item: {}".format(item))
+        raise RuntimeError("Empty pool")
 
     def put(self, *items, block: bool = True, timeout: float = None) -> None:
         """ Place an item in the work stream, this will hold the inputs for the subprocesses. The method will block if
@@ -164,17 +217,132 @@ class PoolManager:
         if items: items = tuple(items)
         else: raise TypeError("put method must take at least one argument")
 
-        self._put((self._index, items), block=block, timeout=timeout)
+        if not self._reserve(1, block=block, timeout=timeout):
+            raise RuntimeError("Cannot place a task into a pool that is not running")
+
+        if self._chunksize == 1:
+            self._put((self._index, items), block=block, timeout=timeout)
+        else:
+            # Hold the task until its batch is full - held tasks are sent before the pool is waited upon or closed
+            self._chunk.append((self._index, items))
+            if len(self._chunk) >= self._currentChunksize(): self._flush(block=block, timeout=timeout)
+
         self._active += 1
         self._index += 1
 
-    def putAsync(self, iterable: object):
+    def _reserve(self, count: int, block: bool = True, timeout: float = None) -> int:
+        """ Wait for space in the reorder window for tasks to be placed. Tasks are only throttled while the pool is
+        ordered and has a reorder window - the space is freed by get as the outputs are returned in order
+
+        Params:
+            count (int): The number of tasks to be placed
+            block (bool) = True: Wait for space if the window is full, else raise an error
+            timeout (float) = None: The length of time to wait for space
+
+        Returns:
+            int: The number of tasks that can be placed - at most count, and 0 if the pool stopped running while waiting
+
+        Raises:
+            mp.queues.Full: The window is full and block is False
+            mp.TimeoutError: No space became free before the timeout
+            RuntimeError: All the processes in the pool have died while waiting
+        """
+        if not self._ordered or self._reorderWindow is None: return count
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._windowCondition:
+            while True:
+                space = self._reorderWindow - (self._index - self._returnIndex)
+                if space > 0: return min(space, count)
+
+                if not block: raise mp.queues.Full
+                if self._state != self._RUNNING or self._clearingTasks: return 0
+                if not self.isAlive(): raise RuntimeError("Empty pool")
+
+                # Held tasks are within the window, they must be sent for the outputs that free the window to be returned
+                self._flush()
+
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise mp.TimeoutError("Timeout while waiting for space in the reorder window")
+
+                self._windowCondition.wait(self._putInterval if remaining is None else min(self._putInterval, remaining))
+
+    def _flush(self, block: bool = True, timeout: float = None) -> None:
+        """ Send the tasks held back by put as a batch """
+        if self._chunk:
+            chunk, self._chunk = self._chunk, []
+            self._put(_Batch(chunk), block=block, timeout=timeout)
+
+    def _dispatch(self, iterable: object, chunksize: (int, str), length: int = None, limit: int = None) -> bool:
+        """ Place the tasks of an iterable into the pool in batches - each item of the iterable is a task's only input
+
+        Params:
+            iterable (object): The inputs of the tasks
+            chunksize (int / str): The number of tasks in each batch, or "auto"
+            length (int) = None: The number of tasks, if known, such that the work is spread across the pool
+            limit (int) = None: The most tasks to place, the rest of an iterator are left to be placed by a later call
+
+        Returns:
+            bool: True if the iterable was exhausted, False if the pool was closed or cleared, or the limit was reached
+        """
+        chunksize = self._validateChunksize(chunksize)
+
+        iterObj, placed = iter(iterable), 0
+        while self._state == self._RUNNING and not self._clearingTasks and (limit is None or placed < limit):
+            size = self._currentChunksize(chunksize, length)
+            if limit is not None: size = min(size, limit - placed)
+
+            size = self._reserve(size)
+            if not size: continue  # The pool stopped running while waiting for space in the reorder window
+
+            chunk = [(self._index + i, (item,)) for i, item in enumerate(itertools.islice(iterObj, size))]
+            if not chunk: return True
+
+            self._put(_Batch(chunk) if chunksize != 1 else chunk[0])
+            self._active += len(chunk)
+            self._index += len(chunk)
+            placed += len(chunk)
+
+        return False
+
+    def _currentChunksize(self, chunksize: (int, str) = None, length: int = None) -> int:
+        """ Determine the number of tasks to send in the next batch
+
+        Params:
+            chunksize (int / str) = None: The chunksize, defaults to that of the pool
+            length (int) = None: The number of tasks being dispatched, if known
+
+        Returns:
+            int: The size of the next batch
+        """
+        chunksize = self._chunksize if chunksize is None else chunksize
+        if chunksize != "auto": return chunksize
+
+        # Spread a known number of tasks across the pool, sized down to the time tasks take once it has been measured
+        size = self._chunkLimit if length is None else min(self._chunkLimit, math.ceil(length / (self._pool_size * 4)))
+        if self._taskSeconds is None: return 1 if length is None else size
+
+        return min(size, max(1, int(self._chunkSeconds / max(self._taskSeconds, 1e-9))))
+
+    @staticmethod
+    def _validateChunksize(chunksize: (int, str)) -> (int, str):
+        """ Check that a chunksize is a positive integer or "auto"
+
+        Raises:
+            ValueError: The chunksize is not valid
+        """
+        if chunksize == "auto" or (isinstance(chunksize, int) and chunksize >= 1): return chunksize
+        raise ValueError("Invalid chunksize '{}' - expected a positive integer or 'auto'".format(chunksize))
+
+    def putAsync(self, iterable: object, *, chunksize: (int, str) = None):
         """ Take a iterable of tasks and send the items to the waiting processes without blocking the main threads
         execution. This method sets up a thread that shall iterate through the provided iterable and add them to the
         send queue. It shall exit when the state of this object is no longer "RUNNING" or when the iterable is exhausted
 
         Params:
             iterable (object): An object that can be passed to the iter() function
+            chunksize (int / str) = None: The number of tasks sent to a process at once, defaults to that of the pool
 
         Raises:
             RuntimeError: This method cannot be called more than once during the lifetime of this object, Runtime error
@@ -183,15 +351,17 @@ class PoolManager:
 
         if self._asyncThread: raise RuntimeError("Cannot call put_async multiple times. Async Thread running already")
 
+        chunksize = self._validateChunksize(self._chunksize if chunksize is None else chunksize)
+
         def place(iterable):
 
-            iterObj = iter(iterable)
-            while self._state == self._RUNNING and not self._clearingTasks:
-                try:
-                    self.put(next(iterObj))
-                except StopIteration:
+            try:
+                if self._dispatch(iterable, chunksize):
                     log.debug("putThread: Concluded as iterable exhausted")
                     return
+            except RuntimeError:
+                log.debug("putThread: Concluded as all the processes in the pool have terminated")
+                return
 
             log.debug("putThread: Externally closed - State: {}, emptying: {}".format(self._state, self._clearingTasks))
 
@@ -216,20 +386,49 @@ class PoolManager:
 
         log.info("_get: attempting to get from return queue expected size {}".format(self._active))
 
-        if timeout is not None: start = time.time()
-        while ((self._active and self.isAlive()) and
-               (timeout is None or time.time() - start < timeout)):
+        self._flush()  # Tasks held back for a batch must be sent before waiting upon their output
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        reader = self._returnReader
+        while self._active:
             try:
-                index, value = self._returnQueue.get(False)
-                self._active -= 1
-                if isinstance(value, Exception): raise SubprocessException(index, value)
-                return index, value
+                if self._received:
+                    index, value = self._received.popleft()
+                else:
+                    output = self._returnQueue.get(False)
+                    if isinstance(output, _Batch):
+                        self._measure(output)
+                        self._received.extend(output.items)
+                        continue
+
+                    index, value = output
             except mp.queues.Empty:
                 if not block: raise
 
-        if not self._active: raise ValueError("Could not call get on items as there are no items to collect")
-        elif not self.isAlive(): raise RuntimeError("All processes in the pool have terminated - no work to get")
-        else: raise mp.TimeoutError("Time limit will trying to receive completed work has been exceeded")
+                # Output returned by processes before they terminated is collected before the pool is declared empty
+                if not self.isAlive():
+                    if reader.poll(): continue
+                    raise RuntimeError("All processes in the pool have terminated - no work to get")
+
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise mp.TimeoutError("Time limit will trying to receive completed work has been exceeded")
+
+                # Sleep until output is returned or a process of the pool terminates
+                mp.connection.wait([reader] + [process.sentinel for process in self._processPool], remaining)
+                continue
+
+            self._active -= 1
+            if isinstance(value, Exception): raise SubprocessException(index, value)
+            return index, value
+
+        raise ValueError("Could not call get on items as there are no items to collect")
+
+    def _measure(self, batch: _Batch) -> None:
+        """ Update the average time a task takes to run from the time a process took to run a batch """
+        if not batch.items: return
+        seconds = batch.seconds / len(batch.items)
+        self._taskSeconds = seconds if self._taskSeconds is None else 0.8*self._taskSeconds + 0.2*seconds
 
     def get(self, block: bool = True, timeout: float = None) -> object:
         """ Collect an output processed from a subprocess and return it. If block, wait for an output, or wait for the
@@ -244,54 +443,152 @@ class PoolManager:
         """
 
         if self._ordered:
-            if self._returnIndex in self._returnCache:
-                # Collect the item from the cache - previously returned and stored to be placed in order
-                value = self._returnCache[self._returnIndex]
-                del self._returnCache[self._returnIndex]
-                self._returnIndex += 1
-                return value
-            else:
-                # Collect the result - collect a value from the queue
-                index, value = self._get(block, timeout)
-                if self._returnIndex == index:
-                    # The returned item is the item to return
-                    self._returnIndex += 1
-                    return value
-                else:
-                    # The returned item is yet to be asked for - store the item and attempt to get again
+            while True:
+                # Hold the outputs returned before their turn until the output to return is collected
+                while self._returnIndex not in self._returnCache:
+                    try:
+                        index, value = self._get(block, timeout)
+                    except SubprocessException as e:
+                        # The failed task's turn is skipped once the error is raised
+                        self._returnCache[e.index] = self._FAILED
+                        raise
+
                     self._returnCache[index] = value
-                    return self.get(block, timeout)  # Recursively attempt to collect item
+                    self._reorderPeak = max(self._reorderPeak, len(self._returnCache))
+
+                value = self._returnCache.pop(self._returnIndex)
+                with self._windowCondition:
+                    self._returnIndex += 1
+                    self._windowCondition.notify_all()
+
+                if value is not self._FAILED: return value
 
         else:
             # Collect the first response and return it
             _, value = self._get(block, timeout)
             return value
 
+    @property
+    def reorderDepth(self) -> int:
+        """ int: The number of outputs currently held to be returned in order """
+        return len(self._returnCache)
+
+    @property
+    def reorderPeak(self) -> int:
+        """ int: The largest number of outputs that have been held to be returned in order """
+        return self._reorderPeak
+
     def getAll(self) -> [object]:
         """ Get all the items that have not already been returned, that were provided to be worked on
 
         Returns:
             [object]: A list of the returned outcomes still within the pool
         """
-        while self._asyncThread and self._asyncThread.isAlive(): time.sleep(0.1)
-        return [self.get() for _ in range(self._active)]
+        outputs = []
+
+        # Collect while the putAsync thread is placing tasks, it may be waiting on space in the reorder window
+        while self._asyncThread and self._asyncThread.is_alive():
+            if self._active:
+                try:
+                    outputs.append(self.get(timeout=self._putInterval))
+                except mp.TimeoutError:
+                    pass
+            else:
+                self._asyncThread.join(self._putInterval)
 
-    def map(self, iterable) -> [object]:
+        self.joinAsync()
+        while self._active or self._returnIndex in self._returnCache: outputs.append(self.get())
+        return outputs
+
+    def map(self, iterable, *, chunksize: (int, str) = None) -> [object]:
         """ Apply the function to the items in the iterable and return the result
 
         Params:
             iterable (iterable): Target of map function, function is mapped onto each item of iterable
+            chunksize (int / str) = None: The number of tasks sent to a process at once, defaults to that of the pool
 
         Returns:
             [object]: The list of object outputs produced from the function
         """
-        original = self._ordered
-        self._ordered = True
-        with self as manager:
-            for i in iterable: manager.put(i)
-            result = manager.getAll()
-        self._ordered = original
-        return result
+        length = len(iterable) if hasattr(iterable, "__len__") else None
+        return list(self._stream(iterable, True, self._reorderWindow, chunksize, length))
+
+    def imap(self, iterable, *, window: int = None, chunksize: (int, str) = None) -> object:
+        """ Lazily apply the function to the items in the iterable, yielding the outputs in the order of the iterable.
+        Only a window of tasks is in flight at any time, such that an iterable of any length is streamed through the
+        pool in constant memory
+
+        Params:
+            iterable (iterable): Target of the function, items are taken from it as space in the window becomes free
+            window (int) = None: The most tasks in flight, defaults to four batches for each process of the pool
+            chunksize (int / str) = None: The number of tasks sent to a process at once, defaults to that of the pool
+
+        Returns:
+            generator: The outputs of the function
+
+        Raises:
+            ValueError: The window or chunksize is not valid
+        """
+        return self._stream(iterable, True, window, chunksize)
+
+    def imap_unordered(self, iterable, *, window: int = None, chunksize: (int, str) = None) -> object:
+        """ Lazily apply the function to the items in the iterable, yielding the outputs in the order they complete.
+        Only a window of tasks is in flight at any time, such that an iterable of any length is streamed through the
+        pool in constant memory
+
+        Params:
+            iterable (iterable): Target of the function, items are taken from it as space in the window becomes free
+            window (int) = None: The most tasks in flight, defaults to four batches for each process of the pool
+            chunksize (int / str) = None: The number of tasks sent to a process at once, defaults to that of the pool
+
+        Returns:
+            generator: The outputs of the function
+
+        Raises:
+            ValueError: The window or chunksize is not valid
+        """
+        return self._stream(iterable, False, window, chunksize)
+
+    def _stream(self, iterable, ordered: bool, window: int, chunksize: (int, str), length: int = None) -> object:
+        """ Validate the arguments of imap and imap_unordered, and return the generator that streams the iterable """
+        chunksize = self._validateChunksize(self._chunksize if chunksize is None else chunksize)
+        if window is not None and (not isinstance(window, int) or window < 1):
+            raise ValueError("Invalid window '{}' - expected a positive integer".format(window))
+
+        def stream(iterObj):
+
+            original = self._ordered
+            self._ordered = ordered
+            exhausted = False
+            with self as manager:
+                try:
+                    while True:
+                        # Top up the window - ordered outputs held for reassembly still count against the window
+                        limit = window or manager._pool_size * 4 * manager._currentChunksize(chunksize, length)
+                        if ordered and manager._reorderWindow: limit = min(limit, manager._reorderWindow)
+                        inflight = manager._index - manager._returnIndex if ordered else manager._active
+                        if not exhausted and inflight < limit:
+                            exhausted = manager._dispatch(iterObj, chunksize, length, limit - inflight)
+
+                        # Ordered outputs can all have been collected into the reorder cache while awaiting their turn
+                        if not manager._active and not manager._returnCache: return
+                        yield manager.get()
+
+                finally:
+                    self._ordered = original
+
+                    # Abandoned streams discard their outstanding work such that the processes can be closed
+                    if manager._active:
+                        manager.clearTasks()
+                        while manager._active:
+                            try:
+                                manager._get(True, None)
+                            except SubprocessException:
+                                pass
+                            except RuntimeError:
+                                break
+
+        return stream(iter(iterable))
 
     def start(self):
         """ Start the pool of processes """
@@ -321,25 +618,19 @@ class PoolManager:
             self._processPool.append(poolProcess)
 
     def isAlive(self) -> int:
-        """ Determine whether is pool is still alive. This is done by calling is alive on all the processes within the
-        process pool. The value returned is the number of processes that are still alive, therefore when the pool is
-        empty, the returned value can be equated to False
+        """ Determine whether is pool is still alive. This is done by polling the sentinels of the processes within the
+        process pool, which become ready as soon as their process terminates. The value returned is the number of
+        processes that are still alive, therefore when the pool is empty, the returned value can be equated to False
 
         Returns:
             int: The number of alive processes within the pool
         """
-        if time.time() - self._is_alive_check < 5:
-            return len(self._processPool) > 0
-
-        self._is_alive_check = time.time()
+        if self._processPool:
+            terminated = set(mp.connection.wait([process.sentinel for process in self._processPool], 0))
+            if terminated:
+                self._processPool = [process for process in self._processPool if process.sentinel not in terminated]
 
-        curractedPool = []
-        for process in self._processPool:
-            if process.is_alive():
-                curractedPool.append(process)
-
-        self._processPool = curractedPool
-        return len(self._processPool) > 0
+        return len(self._processPool)
 
     def joinAsync(self) -> None:
         """ Wait for the async put thread if it is present, to join """
@@ -349,15 +640,20 @@ class PoolManager:
 
     def join(self):
         self.close()
-        while self.isAlive(): time.sleep(0.1)
+        for process in self._processPool: process.join()
+        self.isAlive()
 
     def clearTasks(self) -> None:
         """ Clear the queue of tasks that have not yet been picked up by a pool processes """
         self._clearingTasks = True
+
+        self._active -= len(self._chunk)
+        self._chunk = []
+
         while not self._sendQueue.empty() or self._sendQueue.qsize():
             try:
-                self._sendQueue.get(False)
-                self._active -= 1
+                task = self._sendQueue.get(False)
+                self._active -= len(task.items) if isinstance(task, _Batch) else 1
             except mp.queues.Empty:
                 pass
         self._clearingTasks = False
@@ -372,9 +668,10 @@ class PoolManager:
 
         if self._asyncThread: self.joinAsync()
 
-
         try:
-            for _ in range(self._pool_size): self._sendQueue.put(StopIteration(), False, 1)
+            # Wait for space to signal each process, a full queue must not leave a process waiting for work forever
+            self._flush()
+            for _ in range(self._pool_size): self._put(StopIteration())
             self._sendQueue.close()
             self._sendQueue.join_thread()
         except:
@@ -406,6 +703,9 @@ class PoolManager:
                     logger.propagate = False
                     logger.addHandler(pipeHandler)
 
+            # Shared configs are refreshed before each task so that published generations reach the process
+            shared = [arg for arg in static_args if isinstance(arg, SharedConfig)]
+
             if inspect.isclass(user_worker) and issubclass(user_worker, PoolProcess):
                 worker = user_worker(*static_args)
                 function = worker.run
@@ -413,20 +713,38 @@ class PoolManager:
             else:
                 function = user_worker
 
+            def perform(input_value: tuple) -> object:
+                """ Run the function on the value of a task, returning its output or the exception it raised """
+                for config in shared: config.refresh()
+
+                try:
+                    return function(*input_value, *static_args)
+                except (StopIteration, MemoryError):
+                    raise
+                except Exception as e:
+                    return e
+
             while True:
                 try:
                     # Collect an input for the subprocess - check whether process has been signalled to end
                     sub_input = sendQueue.get(True)
                     if isinstance(sub_input, StopIteration): break
 
+                    if isinstance(sub_input, _Batch):
+                        # Run the tasks of the batch and return their outputs together, with the time they took
+                        start, outputs = time.perf_counter(), []
+                        try:
+                            for input_index, input_value in sub_input.items:
+                                outputs.append((input_index, perform(input_value)))
+                        finally:
+                            returnQueue.put(_Batch(outputs, time.perf_counter() - start))
+                        continue
+
                     # Break out the input into index and value
                     input_index, input_value = sub_input
 
-                    # Run function with value and static arguments
-                    output = function(*input_value, *static_args)
-
-                    # Return the result
-                    returnQueue.put((input_index, output))
+                    # Run function with value and static arguments, and return the result
+                    returnQueue.put((input_index, perform(input_value)))
                 except StopIteration:
                     break
                 except MemoryError:
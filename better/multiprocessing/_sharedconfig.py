@@ -0,0 +1,307 @@
+import pickle
+import struct
+import collections.abc
+from multiprocessing import shared_memory
+
+from ..configparser import ConfigParser
+
+class SharedSection(collections.abc.Mapping):
+    """ A read only view of a section of a config published into shared memory. Keys and values are read from the
+    shared memory block as they are accessed - nothing is copied into the process up front
+
+    Params:
+        buffer (memoryview): The shared memory block
+        offset (int): The offset of the section's table within the block
+    """
+
+    __slots__ = ("_buffer", "_offset", "_count")
+
+    _count_format = struct.Struct("<I")
+    _entry = struct.Struct("<IIBII")  # Key offset, key length, value kind, value offset, value length
+    _position = struct.Struct("<I")  # The position of an entry within the key ordered index
+
+    _SECTION, _STRING, _PICKLE = 0, 1, 2
+
+    def __init__(self, buffer: memoryview, offset: int):
+        self._buffer = buffer
+        self._offset = offset + self._count_format.size
+        self._count, = self._count_format.unpack_from(buffer, offset)
+
+    def __repr__(self): return "<SharedSection {}>".format(dict(self))
+    def __len__(self): return self._count
+    def __getitem__(self, key: object):
+        entry = self._find(key)
+        if entry is None: raise KeyError(key)
+        return self._value(entry)
+    def __contains__(self, key: object): return self._find(key) is not None
+    def __iter__(self):
+        for i in range(self._count):
+            key_offset, key_length, _, _, _ = self._entry.unpack_from(self._buffer, self._offset + i*self._entry.size)
+            yield str(self._buffer[key_offset: key_offset + key_length], "utf-8")
+
+    def get(self, path: str, default: object = None) -> object:
+        """ Collect the value at a colon delimited path within the section - see ConfigParser.get
+
+        Params:
+            path (str): A colon delimited path of key names
+            default (object) = None: The value to be returned if nothing is found
+
+        Returns:
+            object: Either the value at the location of path, or the default
+        """
+        if not isinstance(path, str): return default
+
+        value = self
+        for key in (path.split(":") if ":" in path else (path,)):
+            if not isinstance(value, SharedSection): return default
+
+            entry = value._find(key)
+            if entry is None: return default
+            value = value._value(entry)
+
+        return value
+
+    def _find(self, key: object) -> tuple:
+        """ Binary search the section's key ordered index for a key
+
+        Params:
+            key (object): The key to be found
+
+        Returns:
+            tuple: The entry of the key, None if the section does not hold the key
+        """
+        if not isinstance(key, str): return None
+
+        encoded = key.encode("utf-8")
+        index = self._offset + self._count*self._entry.size
+
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+
+            position, = self._position.unpack_from(self._buffer, index + middle*self._position.size)
+            entry = self._entry.unpack_from(self._buffer, self._offset + position*self._entry.size)
+            candidate = self._buffer[entry[0]: entry[0] + entry[1]]
+
+            if candidate == encoded: return entry
+            elif candidate.tobytes() < encoded: low = middle + 1
+            else: high = middle
+
+        return None
+
+    def _value(self, entry: tuple) -> object:
+        """ Read the value of an entry from the block """
+        _, _, kind, offset, length = entry
+        if kind == self._SECTION: return SharedSection(self._buffer, offset)
+        elif kind == self._STRING: return str(self._buffer[offset: offset + length], "utf-8")
+        else: return pickle.loads(self._buffer[offset: offset + length])
+
+    @classmethod
+    def _encode(cls, section: collections.abc.Mapping, block: bytearray) -> int:
+        """ Encode a section, and recursively its subsections, onto the end of a block
+
+        Params:
+            section (Mapping): The section to be encoded
+            block (bytearray): The block being generated
+
+        Returns:
+            int: The offset of the section's table within the block
+
+        Raises:
+            TypeError: A key of the section is not a string
+        """
+
+        entries = []
+        for key, value in section.items():
+            if not isinstance(key, str): raise TypeError("Cannot share config key {!r} - keys must be strings".format(key))
+
+            encoded = key.encode("utf-8")
+            key_offset = len(block)
+            block += encoded
+
+            if isinstance(value, collections.abc.Mapping):
+                kind, value_offset, value_length = cls._SECTION, cls._encode(value, block), 0
+            else:
+                if isinstance(value, str): kind, data = cls._STRING, value.encode("utf-8")
+                else: kind, data = cls._PICKLE, pickle.dumps(value, protocol = pickle.HIGHEST_PROTOCOL)
+
+                value_offset, value_length = len(block), len(data)
+                block += data
+
+            entries.append((encoded, (key_offset, len(encoded), kind, value_offset, value_length)))
+
+        # The table of entries in the section's order, followed by the positions of the entries in key order
+        offset = len(block)
+        block += cls._count_format.pack(len(entries))
+        for _, entry in entries: block += cls._entry.pack(*entry)
+        for position in sorted(range(len(entries)), key = lambda i: entries[i][0]):
+            block += cls._position.pack(position)
+
+        return offset
+
+class SharedConfig:
+    """ Publish a config into shared memory such that processes can read it without it being copied into each of them.
+    The config is frozen and serialised into a shared memory block once - processes attach to the block and read the
+    config through a read only view. Publishing a new version of the config writes a new block and increments the
+    generation, processes pick up the new generation when they next refresh. Views are released when the generation
+    they belong to is replaced within the process, and so should not be held onto between refreshes.
+
+    A shared config passed to a PoolManager within its static_args is refreshed by the pool's processes before each
+    task, so a task always sees a single version of the config and new versions reach running workers between tasks.
+
+    Only the process that created the shared config may publish to it. Shared configs are sent to other processes by
+    the name of their shared memory - they can be pickled or passed as arguments to processes.
+
+    Params:
+        config (ConfigParser / Mapping): The config to be published
+    """
+
+    _control = struct.Struct("<QH")  # The sequence of the published block (odd while being written) and its name length
+    _controlSize = 256
+    _header = struct.Struct("<4sIQI")  # Magic, version, generation and the offset of the root section
+    _magic = b"BCFG"
+    _version = 1
+
+    def __init__(self, config: collections.abc.Mapping):
+        self._owner = True
+        self._controlBlock = shared_memory.SharedMemory(create = True, size = self._controlSize)
+        self._controlBlock.buf[:self._control.size] = self._control.pack(0, 0)
+
+        self._block = None  # The shared memory block of the current generation
+        self._sequence = 0
+        self._config = None
+
+        try:
+            self.publish(config)
+        except:
+            self.close()
+            self.unlink()
+            raise
+
+    def __repr__(self): return "<SharedConfig generation {}>".format(self.generation)
+
+    def __getstate__(self):
+        return {"control": self._controlBlock.name}
+
+    def __setstate__(self, state: dict):
+        self._owner = False
+        self._controlBlock = self._attach(state["control"])
+        self._block = None
+        self._sequence = None
+        self._config = None
+
+    def __enter__(self): return self
+    def __exit__(self, a, b, c):
+        self.close()
+        if self._owner: self.unlink()
+
+    @property
+    def generation(self) -> int:
+        """ int: The generation of the config currently attached - incremented with each publish """
+        if self._config is None: self.refresh()
+        return self._sequence // 2
+
+    @property
+    def config(self) -> SharedSection:
+        """ SharedSection: A read only view of the config currently attached """
+        if self._config is None: self.refresh()
+        return self._config
+
+    def get(self, path: str, default: object = None) -> object:
+        """ Collect the value at a colon delimited path within the attached config - see ConfigParser.get """
+        return self.config.get(path, default)
+
+    def publish(self, config: collections.abc.Mapping) -> int:
+        """ Serialise a new version of the config into shared memory, and publish it to the attached processes
+
+        Params:
+            config (ConfigParser / Mapping): The new config
+
+        Returns:
+            int: The generation of the published config
+
+        Raises:
+            RuntimeError: The shared config was not created by this process
+        """
+        if not self._owner: raise RuntimeError("Only the process that created a shared config may publish to it")
+        if isinstance(config, ConfigParser): config = config.freeze()
+
+        generation = self._sequence // 2 + 1
+
+        block = bytearray(self._header.size)
+        root = SharedSection._encode(config, block)
+        self._header.pack_into(block, 0, self._magic, self._version, generation, root)
+
+        memory = shared_memory.SharedMemory(create = True, size = len(block))
+        memory.buf[:len(block)] = block
+
+        # Publish the block - the sequence is odd while the name is being written, readers retry until it is even
+        name = memory.name.encode()
+        buffer = self._controlBlock.buf
+        self._control.pack_into(buffer, 0, self._sequence + 1, 0)
+        buffer[self._control.size: self._control.size + len(name)] = name
+        self._control.pack_into(buffer, 0, self._sequence + 2, len(name))
+
+        # Withdraw the previous block - processes that are attached to it retain their mapping until they refresh
+        if self._block is not None:
+            self._block.close()
+            self._block.unlink()
+
+        self._block, self._sequence = memory, self._sequence + 2
+        self._config = SharedSection(memory.buf, root)
+
+        return generation
+
+    def refresh(self) -> bool:
+        """ Attach to the latest generation of the config if it has been published since the last refresh
+
+        Returns:
+            bool: True if a new generation has been attached
+        """
+
+        while True:
+            sequence, length = self._control.unpack_from(self._controlBlock.buf, 0)
+            if sequence == self._sequence: return False
+            if sequence % 2: continue  # A new generation is being published
+
+            name = bytes(self._controlBlock.buf[self._control.size: self._control.size + length]).decode()
+            if self._control.unpack_from(self._controlBlock.buf, 0)[0] != sequence: continue  # Published meanwhile
+
+            try:
+                memory = self._attach(name)
+            except FileNotFoundError:
+                continue  # The generation has already been replaced
+
+            _, _, _, root = self._header.unpack_from(memory.buf, 0)
+
+            if self._block is not None: self._block.close()
+            self._block, self._sequence = memory, sequence
+            self._config = SharedSection(memory.buf, root)
+            return True
+
+    def close(self) -> None:
+        """ Detach from the shared memory - views of the config are released """
+        if self._block is not None: self._block.close()
+        self._controlBlock.close()
+        self._config = None
+
+    def unlink(self) -> None:
+        """ Remove the shared memory of the config - performed by the process that created it once it is finished """
+        if not self._owner: return
+        for memory in (self._block, self._controlBlock):
+            if memory is None: continue
+            try:
+                memory.unlink()
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def _attach(name: str) -> shared_memory.SharedMemory:
+        """ Attach to a shared memory block created by another process without tracking it - the creator of the block
+        is responsible for removing it. Versions of python that always track blocks register it with the resource
+        tracker the process shares with its parent, where the block is already registered.
+        """
+        try:
+            return shared_memory.SharedMemory(name, track = False)
+        except TypeError:
+            return shared_memory.SharedMemory(name)